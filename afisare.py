@@ -0,0 +1,155 @@
+'''Afisarea listelor de angajati.
+
+Modulul contine:
+- formatarea unui angajat in forma detaliata, tabelara sau JSON Lines
+- afisarea unei liste de angajati printr-o singura scriere tamponata, cu limita si deplasare
+
+Inregistrarile sunt formatate una cate una si adunate intr-un tampon care este scris
+in fisierul de iesire numai cand depaseste marimea stabilita, astfel incat afisarea unei
+liste mari nu face cate un apel print pentru fiecare angajat.
+
+Utilizare:
+python afisare.py --format tabel --limita 50 --deplasare 100
+python afisare.py --format jsonl --departament IT > angajati_it.jsonl
+'''
+
+
+import argparse
+import json
+import os
+import sys
+from itertools import islice
+
+from metrici import metrici
+
+
+FORMATE_AFISARE = ('detaliat', 'tabel', 'jsonl')
+MARIME_TAMPON = 1 << 16
+
+_DELIMITATOR = 10 * '-'
+_ANTET_TABEL = f'{"Nume":<15} {"Prenume":<15} {"CNP":<13} {"Varsta":>6} {"Salar":>12} {"Departament":<11} {"Senioritate":<11}\n'
+
+
+def formatare_detaliat(angajat):
+    '''Formateaza datele unui angajat pe mai multe randuri, ca la afisarea unui singur angajat
+
+    Arguments:
+    angajat: Dict -> informatiile unui angajat
+
+    Returns:
+    str -> textul afisat pentru angajat, terminat cu un rand nou
+    '''
+
+    return f'\n{_DELIMITATOR}\nNume: {angajat["Nume"]}\nPrenume: {angajat["Prenume"]}\nCNP: {angajat["CNP"]}\
+\nVarsta: {angajat["Varsta"]}\nSalar: {angajat["Salar"]}\nDepartament: {angajat["Departament"]}\
+\nSenioritate: {angajat["Senioritate"]}\n'
+
+
+def formatare_tabel(angajat):
+    '''Formateaza datele unui angajat pe un singur rand, in coloane de latime fixa
+
+    Arguments:
+    angajat: Dict -> informatiile unui angajat
+
+    Returns:
+    str -> randul din tabel, terminat cu un rand nou
+    '''
+
+    return f'{angajat["Nume"]:<15} {angajat["Prenume"]:<15} {angajat["CNP"]:<13} {angajat["Varsta"]:>6} \
+{angajat["Salar"]:>12} {angajat["Departament"]:<11} {angajat["Senioritate"]:<11}\n'
+
+
+def formatare_jsonl(angajat):
+    '''Formateaza datele unui angajat ca obiect JSON pe un singur rand
+
+    Arguments:
+    angajat: Dict -> informatiile unui angajat
+
+    Returns:
+    str -> obiectul JSON, terminat cu un rand nou
+    '''
+
+    return json.dumps(angajat, ensure_ascii=False) + '\n'
+
+
+_FORMATARI = {
+    'detaliat': formatare_detaliat,
+    'tabel': formatare_tabel,
+    'jsonl': formatare_jsonl
+}
+
+
+def afisare_inregistrari(angajati, format_afisare='detaliat', limita=None, deplasare=0, iesire=None, marime_tampon=MARIME_TAMPON):
+    '''Afiseaza o lista de angajati printr-un tampon, cu cel mult o scriere pentru fiecare
+    marime_tampon caractere formatate
+
+    Arguments:
+    angajati: Iterable -> angajatii afisati, sub forma de dictionar
+    format_afisare: str -> unul din FORMATE_AFISARE
+    limita: int -> numarul maxim de angajati afisati; None pentru toti
+    deplasare: int -> numarul de angajati sariti de la inceputul listei
+    iesire: fisier text -> destinatia afisarii (implicit iesirea standard)
+    marime_tampon: int -> numarul de caractere adunate inainte de o scriere
+
+    Returns:
+    numar_afisati: int -> numarul de angajati afisati
+    '''
+
+    if format_afisare not in _FORMATARI:
+        raise ValueError(f'Formatul de afisare {format_afisare} nu este cunoscut')
+    formatare = _FORMATARI[format_afisare]
+    iesire = iesire or sys.stdout
+
+    stop = deplasare + limita if limita is not None else None
+    tampon = [_ANTET_TABEL] if format_afisare == 'tabel' else []
+    marime = 0
+    scris = 0
+    numar_afisati = 0
+    for angajat in islice(angajati, deplasare, stop):
+        text = formatare(angajat)
+        tampon.append(text)
+        marime += len(text)
+        numar_afisati += 1
+        if marime >= marime_tampon:
+            iesire.write(''.join(tampon))
+            tampon.clear()
+            scris += marime
+            marime = 0
+
+    if tampon:
+        iesire.write(''.join(tampon))
+    iesire.flush()
+    if metrici.activ:
+        # numarul de caractere scrise, egal cu numarul de octeti pentru textul ASCII
+        metrici.inregistrare(numar_afisati, octeti_scrisi=scris + marime)
+
+    return numar_afisati
+
+
+def main():
+    from management_angajati import Companie, adaugare_argumente_stocare, cale_date_argumente
+
+    parser = argparse.ArgumentParser(description='Afisarea angajatilor firmei')
+    parser.add_argument('--format', choices=FORMATE_AFISARE, default='tabel', help='formatul de afisare')
+    parser.add_argument('--limita', type=int, default=None, help='numarul maxim de angajati afisati')
+    parser.add_argument('--deplasare', type=int, default=0, help='numarul de angajati sariti')
+    parser.add_argument('--departament', default=None, help='afiseaza numai angajatii din departament')
+    parser.add_argument('--senioritate', default=None, help='afiseaza numai angajatii cu senioritatea data')
+    adaugare_argumente_stocare(parser)
+    argumente = parser.parse_args()
+    try:
+        cale_date = cale_date_argumente(argumente)
+    except ValueError as exception:
+        parser.error(str(exception))
+
+    companie = Companie(cale_date=cale_date)
+    companie.initializare()
+    try:
+        companie.afisare_lista(argumente.departament, argumente.senioritate, argumente.format, argumente.limita, argumente.deplasare)
+    except BrokenPipeError:
+        # cititorul a inchis iesirea (de exemplu head); restul listei nu mai este scris
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+
+if __name__ == '__main__':
+    main()
@@ -23,7 +23,23 @@ Datele stocate referitor la un angajat sunt:
 '''
 
 
+import argparse
 import json
+import math
+import os
+import sys
+import threading
+from concurrent.futures import Future
+
+from afisare import afisare_inregistrari
+from metrici import adaugare_argumente, metrici, sesiune
+from reguli_fiscale import salar_minim_curent
+from salarizare import CacheFluturasi
+from stocare import citire_json_incrementala, salvare_json_atomica
+
+
+# fluturasii calculati sunt refolositi pana la modificarea salarului angajatului sau a cotelor
+cache_fluturasi = CacheFluturasi()
 
 
 def meniu():
@@ -35,7 +51,7 @@ def meniu():
     None
 
     Returns:
-    optiune: str -> valoarea optiunii introdusa de catre utilizator
+    optiune: int -> optiunea introdusa de catre utilizator, sau None daca nu este valida
     '''
 
     meniu = '''
@@ -51,13 +67,16 @@ def meniu():
     9. Afisarea angajatilor cu o anumita senioritate
     10. Afisarea angajatilor dintr-un departament
     11. Iesire
+    12. Salvare date (in fundal)
     '''
 
     print(meniu)
+    optiune = None
     try:
         optiune = int(input('Introduceti optiunea: '))
-        if not 1 <= optiune <= 11:
+        if not 1 <= optiune <= 12:
             print('Optiune invalida! Introduceti una din optiunile disponibile.')
+            optiune = None
 
     except ValueError:
         print('Optiune invalida! Optiunea trebuie sa fie un numar prezent in meniu!')
@@ -105,7 +124,7 @@ def validare_varsta(varsta):
 
 
 def validare_salar(salar):
-    '''Verifica daca salarul este corespunzator (este peste minimul pe economie - 4050lei)
+    '''Verifica daca salarul este corespunzator (este peste minimul pe economie din regula fiscala in vigoare)
 
     Arguments:
     salar: float - Salarul persoanei introduse
@@ -114,7 +133,7 @@ def validare_salar(salar):
     bool - True daca e valid, False in caz contrar
     '''
 
-    return salar >= 4050
+    return math.isfinite(salar) and salar >= salar_minim_curent()
 
 
 def validare_departament(departament):
@@ -149,17 +168,103 @@ def validare_senioritate(senioritate):
     return senioritate in senioritati and senioritate.isalpha()
 
 
-def introducere_date_angajat(lista_angajati, adaug_cnp=True):
-    '''Citeste informatiile despre un nou angajat, le valideaza, iar in cazul in care
-    sunt valide adauga noul angajat in lista de angajati ai firmei.
+def construire_indexuri(lista_angajati):
+    '''Construieste indexurile secundare dupa departament si senioritate, astfel incat
+    listarile filtrate sa parcurga numai angajatii care corespund filtrului
 
     Arguments:
     lista_angajati: List -> lista care contine angajatii firmei sub forma de dictionar
 
+    Returns:
+    indexuri: Dict -> pentru fiecare camp indexat, grupurile de angajati {valoare: {cnp: angajat}}
+    '''
+
+    indexuri = {'Departament': {}, 'Senioritate': {}}
+    for angajat in lista_angajati:
+        indexare_angajat(indexuri, angajat)
+
+    return indexuri
+
+
+def indexare_angajat(indexuri, angajat):
+    '''Adauga angajatul in grupurile corespunzatoare din indexurile secundare
+
+    Arguments:
+    indexuri: Dict -> indexurile secundare construite cu construire_indexuri
+    angajat: Dict -> informatiile unui angajat
+
     Returns:
     None
     '''
 
+    for camp, grupuri in indexuri.items():
+        grupuri.setdefault(angajat.get(camp), {})[angajat.get('CNP')] = angajat
+
+
+def deindexare_angajat(indexuri, angajat):
+    '''Elimina angajatul din grupurile corespunzatoare din indexurile secundare
+
+    Arguments:
+    indexuri: Dict -> indexurile secundare construite cu construire_indexuri
+    angajat: Dict -> informatiile unui angajat
+
+    Returns:
+    None
+    '''
+
+    for camp, grupuri in indexuri.items():
+        grup = grupuri.get(angajat.get(camp))
+        if grup is not None:
+            grup.pop(angajat.get('CNP'), None)
+
+
+def selectare_angajati(lista_angajati, indexuri=None, departament=None, senioritate=None):
+    '''Returneaza angajatii care corespund filtrelor. Daca indexurile sunt disponibile, sunt
+    parcursi numai angajatii din grupurile corespunzatoare, iar pentru ambele filtre se
+    intersecteaza cele doua grupuri.
+
+    Arguments:
+    lista_angajati: List -> lista care contine angajatii firmei sub forma de dictionar
+    indexuri: Dict -> indexurile secundare construite cu construire_indexuri (optional)
+    departament: str -> departamentul dupa care se filtreaza (optional)
+    senioritate: str -> senioritatea dupa care se filtreaza (optional)
+
+    Returns:
+    Iterable -> angajatii care corespund filtrelor
+    '''
+
+    if indexuri is None:
+        return [angajat for angajat in lista_angajati
+                if (not departament or angajat.get('Departament') == departament)
+                and (not senioritate or angajat.get('Senioritate') == senioritate)]
+
+    grup_departament = indexuri['Departament'].get(departament, {})
+    grup_senioritate = indexuri['Senioritate'].get(senioritate, {})
+    if departament and senioritate:
+        grup_mic, grup_mare = sorted((grup_departament, grup_senioritate), key=len)
+        return [angajat for cnp, angajat in grup_mic.items() if cnp in grup_mare]
+    if departament:
+        return grup_departament.values()
+    if senioritate:
+        return grup_senioritate.values()
+    return lista_angajati
+
+
+def introducere_date_angajat(lista_angajati, adaug_cnp=True, indexuri=None, angajat_curent=None):
+    '''Citeste informatiile despre un nou angajat, le valideaza, iar in cazul in care
+    sunt valide adauga noul angajat in lista de angajati ai firmei. Daca adaug_cnp este False,
+    datele citite inlocuiesc datele angajatului curent.
+
+    Arguments:
+    lista_angajati: List -> lista care contine angajatii firmei sub forma de dictionar
+    adaug_cnp: bool -> daca este True se citeste si CNP-ul unui angajat nou
+    indexuri: Dict -> indexurile secundare care trebuie actualizate (optional)
+    angajat_curent: Dict -> angajatul ale carui date sunt modificate, cand adaug_cnp este False
+
+    Returns:
+    bool -> True daca lista de angajati a fost modificata
+    '''
+
     while True:
         nume = input('Introduceti numele: ')
         if validare_nume(nume):
@@ -177,10 +282,13 @@ def introducere_date_angajat(lista_angajati, adaug_cnp=True):
     if adaug_cnp:
         while True:
             cnp = input('Introduceti CNPul: ')
-            if validare_cnp(cnp):
-                break
-            else:
+            if not validare_cnp(cnp):
                 print('CNPul introdus nu este valid! Trebuie sa contina 13 cifre!')
+            elif any(angajat.get('CNP') == cnp for angajat in lista_angajati):
+                # indexurile grupeaza angajatii dupa CNP, deci acesta trebuie sa fie unic
+                print('CNPul introdus apartine deja unui angajat! Introduceti un alt CNP.')
+            else:
+                break
 
     while True:
         varsta = input('Introduceti varsta: ')
@@ -214,6 +322,9 @@ def introducere_date_angajat(lista_angajati, adaug_cnp=True):
         else:
             print('Senioritatea introdusa nu este valida! Trebuie sa fie una din lista mentionata.')
 
+    if not adaug_cnp:
+        cnp = angajat_curent.get('CNP')
+
     angajat = {
         'Nume': nume,
         'Prenume': prenume,
@@ -224,11 +335,25 @@ def introducere_date_angajat(lista_angajati, adaug_cnp=True):
         'Senioritate': senioritate
     }
 
-    lista_angajati.append(angajat)
     if adaug_cnp:
+        lista_angajati.append(angajat)
+        if indexuri is not None:
+            indexare_angajat(indexuri, angajat)
         print('Angajatul a fost introdus cu succes!')
-    else:
-        print('Datele angajatului au fost modificate cu succes!')
+        return True
+
+    if angajat == {camp: angajat_curent.get(camp) for camp in angajat}:
+        print('Datele introduse sunt identice cu cele existente, angajatul nu a fost modificat.')
+        return False
+
+    if indexuri is not None:
+        deindexare_angajat(indexuri, angajat_curent)
+    angajat_curent.update(angajat)
+    if indexuri is not None:
+        indexare_angajat(indexuri, angajat_curent)
+    cache_fluturasi.invalidare(cnp)
+    print('Datele angajatului au fost modificate cu succes!')
+    return True
 
 
 def afisare_angajat(angajat):
@@ -267,24 +392,28 @@ def cautare_angajat_cnp(lista_angajati):
             print('CNPul introdus nu este valid! Trebuie sa contina 13 cifre!')
 
     found = False
-    for angajat in lista_angajati:
+    for parcursi, angajat in enumerate(lista_angajati, 1):
         if angajat.get('CNP') == cnp:
             found = True
             afisare_angajat(angajat)
             break
 
+    if metrici.activ:
+        metrici.inregistrare(parcursi if found else len(lista_angajati))
+
     if not found:
         print(f'Angajatul cu CNP-ul: {cnp} nu a fost gasit! Verificati si reintroduceti CNP-ul corect.')
 
 
-def modificare_angajat_cnp(lista_angajati):
+def modificare_angajat_cnp(lista_angajati, indexuri=None):
     '''Modifica datele unui angajat pe baza cnp-ului furnizat de catre utilizator
 
     Arguments:
     lista_angajati: List -> lista care contine angajatii firmei sub forma de dictionar
+    indexuri: Dict -> indexurile secundare care trebuie actualizate (optional)
 
     Returns:
-    None
+    bool -> True daca datele angajatului au fost modificate
     '''
 
     while True:
@@ -294,13 +423,14 @@ def modificare_angajat_cnp(lista_angajati):
         else:
             print('CNPul introdus nu este valid! Trebuie sa contina 13 cifre!')
 
+    modificat = False
     found = False
     for angajat in lista_angajati:
         if angajat.get('CNP') == cnp:
             found = True
             print('Datele curente ale angajatului:')
             afisare_angajat(angajat)
-            introducere_date_angajat(lista_angajati, adaug_cnp=False)
+            modificat = introducere_date_angajat(lista_angajati, adaug_cnp=False, indexuri=indexuri, angajat_curent=angajat)
             print('Noile date ale angajatului sunt:')
             afisare_angajat(angajat)
             break
@@ -308,15 +438,18 @@ def modificare_angajat_cnp(lista_angajati):
     if not found:
         print(f'Angajatul cu CNP-ul: {cnp} nu a fost gasit! Verificati si reintroduceti CNP-ul corect.')
 
+    return modificat
+
 
-def stergere_angajat_cnp(lista_angajati):
+def stergere_angajat_cnp(lista_angajati, indexuri=None):
     '''Sterge un angajat din lista angajatilor firmei pe baza cnp-ului introdus de catre utilizator
 
     Arguments:
     lista_angajati: List -> lista care contine angajatii firmei sub forma de dictionar
+    indexuri: Dict -> indexurile secundare care trebuie actualizate (optional)
 
     Returns:
-    None
+    bool -> True daca angajatul a fost sters
     '''
 
     while True:
@@ -331,6 +464,9 @@ def stergere_angajat_cnp(lista_angajati):
         if angajat.get('CNP') == cnp:
             found = True
             lista_angajati.remove(angajat)
+            if indexuri is not None:
+                deindexare_angajat(indexuri, angajat)
+            cache_fluturasi.invalidare(cnp)
             break
 
     if not found:
@@ -338,12 +474,19 @@ def stergere_angajat_cnp(lista_angajati):
     else:
         print('Angajatul a fost sters cu succes!')
 
+    return found
 
-def afisare_angajati(lista_angajati, departament=False, senioritate=False):
-    '''Afiseaza toti angajatii prezenti in sistem
+
+def afisare_angajati(lista_angajati, departament=False, senioritate=False, indexuri=None, format_afisare='detaliat',
+                     limita=None, deplasare=0):
+    '''Afiseaza toti angajatii prezenti in sistem, printr-o singura scriere tamponata
 
     Arguments:
     lista_angajati: List -> lista care contine angajatii firmei sub forma de dictionar
+    indexuri: Dict -> indexurile secundare folosite pentru filtrare (optional)
+    format_afisare: str -> 'detaliat', 'tabel' sau 'jsonl'
+    limita: int -> numarul maxim de angajati afisati; None pentru toti
+    deplasare: int -> numarul de angajati sariti de la inceputul listei
 
     Returns:
     None
@@ -365,18 +508,10 @@ def afisare_angajati(lista_angajati, departament=False, senioritate=False):
             else:
                 print('Senioritatea introdusa nu este valida! Trebuie sa fie una din lista mentionata.')
 
-    for angajat in lista_angajati:
-        if departament:
-            if angajat.get('Departament') == departament:
-                afisare_angajat(angajat)
-        elif senioritate:
-            if angajat.get('Senioritate') == senioritate:
-                afisare_angajat(angajat)
-        else:
-            afisare_angajat(angajat)
+    afisare_inregistrari(selectare_angajati(lista_angajati, indexuri, departament, senioritate), format_afisare, limita, deplasare)
 
 
-def calculator_cost_salarii(lista_angajati, firma=True):
+def calculator_cost_salarii(lista_angajati, firma=True, indexuri=None):
     '''Calculeaza costul salariilor la nivel de firma sau la nivel de departament in cazul in care departamentul
     este specificat.
 
@@ -384,6 +519,7 @@ def calculator_cost_salarii(lista_angajati, firma=True):
     lista_angajati: List -> lista care contine angajatii firmei sub forma de dictionar
     total: bool -> daca este True se calculeaza pentru toata firma, iar daca este False este necesara introducerea
                          departamentului pentru care se face calculul
+    indexuri: Dict -> indexurile secundare folosite pentru filtrare (optional)
 
     Returns:
     None
@@ -399,12 +535,8 @@ def calculator_cost_salarii(lista_angajati, firma=True):
                 print('Departamentul introdus este invalid! Trebuie sa fie unul din lista mentionata.')
 
     cost_salarii = 0
-    for angajat in lista_angajati:
-        if not departament:
-            cost_salarii += angajat.get('Salar')
-        else:
-            if angajat.get('Departament') == departament:
-                cost_salarii += angajat.get('Salar')
+    for angajat in selectare_angajati(lista_angajati, indexuri, departament):
+        cost_salarii += angajat.get('Salar')
 
     if not firma:
         print(f'Costul total al salariilor din departamentul {departament} este: {cost_salarii} lei')
@@ -429,14 +561,10 @@ def calculator_fluturas_salar(lista_angajati):
             print('CNPul introdus nu este valid! Trebuie sa contina 13 cifre!')
 
     found = False
-    for angajat in lista_angajati:
+    for parcursi, angajat in enumerate(lista_angajati, 1):
         if angajat.get('CNP') == cnp:
             found = True
-            salar = angajat.get('Salar')
-            cas = 0.1 * salar
-            cass = 0.25 * salar
-            impozit = (salar - cas - cass) * 0.1
-            net = salar - cas - cass - impozit
+            cas, cass, impozit, net = cache_fluturasi.obtinere(cnp, angajat.get('Salar'))
 
             delimitator = 10 * '-'
             afisaj = f'\n{delimitator}\nNume: {angajat.get("Nume")}\nPrenume: {angajat.get("Prenume")}\nBrut: {angajat.get("Salar")}\n\
@@ -444,6 +572,9 @@ def calculator_fluturas_salar(lista_angajati):
             print(afisaj)
             break
 
+    if metrici.activ:
+        metrici.inregistrare(parcursi if found else len(lista_angajati))
+
     if not found:
         print(f'Angajatul cu CNP-ul: {cnp} nu a fost gasit! Verificati si reintroduceti CNP-ul corect.')
 
@@ -460,8 +591,19 @@ def incarca_date_json():
 
     lista_angajati = []
     try:
-        with open('date_angajati.json', 'r') as json_file:
-            lista_angajati = json.load(json_file)
+        # elementele sunt adaugate pe masura ce fisierul este parcurs, fara a incarca
+        # intreg continutul JSON in memorie; la eroare nu se pastreaza o lista partiala
+        angajati = []
+        cnp_uri = set()
+        for angajat in citire_json_incrementala('date_angajati.json'):
+            if angajat.get('CNP') in cnp_uri:
+                print(f'Exista deja un angajat cu CNP-ul: {angajat.get("CNP")}! Inregistrarea duplicat a fost ignorata.')
+                continue
+            cnp_uri.add(angajat.get('CNP'))
+            angajati.append(angajat)
+        lista_angajati = angajati
+        if metrici.activ:
+            metrici.inregistrare(len(lista_angajati), octeti_cititi=os.path.getsize('date_angajati.json'))
     except FileNotFoundError:
         print('Fisierul JSON care contine informatiile despre angajati nu a fost gasit! Initializare angajati nereusita.')
     except json.JSONDecodeError:
@@ -472,18 +614,39 @@ def incarca_date_json():
     return lista_angajati
 
 
-def salveaza_date_json(lista_angajati):
-    '''Salveaza datele angajatilor in fisierul json folosit ca baza de date
+def salveaza_date_json(lista_angajati, fundal=False):
+    '''Salveaza datele angajatilor in fisierul json folosit ca baza de date. Fisierul este scris
+    compact intr-un fisier temporar, sincronizat pe disc si redenumit peste cel existent, astfel
+    incat o intrerupere in timpul salvarii nu afecteaza datele salvate anterior.
 
     Arguments:
     lista_angajati: List -> lista care contine angajatii firmei sub forma de dictionar
+    fundal: bool -> daca este True, fisierul este scris de un fir separat, dintr-o copie a listei
 
     Returns:
-    None
+    Future -> rezultatul scrierii facute de firul separat, daca fundal este True; altfel None.
+              Eroarea scrierii, daca a aparut, este ridicata de metoda result()
     '''
 
-    with open('date_angajati.json', 'w') as json_file:
-        json.dump(lista_angajati, json_file, indent=4)
+    if fundal:
+        # angajatii pot fi modificati pe loc din meniu in timpul scrierii, deci se salveaza o copie
+        copie = [dict(angajat) for angajat in lista_angajati]
+        rezultat = Future()
+
+        def scriere():
+            try:
+                salveaza_date_json(copie)
+                rezultat.set_result(None)
+            except Exception as exception:
+                rezultat.set_exception(exception)
+
+        threading.Thread(target=scriere).start()
+        return rezultat
+
+    salvare_json_atomica('date_angajati.json', lista_angajati)
+
+    if metrici.activ:
+        metrici.inregistrare(len(lista_angajati), octeti_scrisi=os.path.getsize('date_angajati.json'))
 
 
 def app():
@@ -497,25 +660,63 @@ def app():
     '''
 
     lista_angajati = incarca_date_json()
+    indexuri = construire_indexuri(lista_angajati)
+    salvare = None
+    # fisierul este rescris numai daca in sesiune a fost folosita o optiune care modifica angajatii;
+    # modificarile sunt numarate, iar o salvare din fundal le marcheaza ca salvate numai daca reuseste
+    modificari = 0
+    modificari_salvate = 0
+    modificari_in_salvare = 0
 
     while True:
         optiune = meniu()
-        match optiune:
-            case 1: introducere_date_angajat(lista_angajati)
-            case 2: cautare_angajat_cnp(lista_angajati)
-            case 3: modificare_angajat_cnp(lista_angajati)
-            case 4: stergere_angajat_cnp(lista_angajati)
-            case 5: afisare_angajati(lista_angajati)
-            case 6: calculator_cost_salarii(lista_angajati)
-            case 7: calculator_cost_salarii(lista_angajati, firma=False)
-            case 8: calculator_fluturas_salar(lista_angajati)
-            case 9: afisare_angajati(lista_angajati, senioritate=True)
-            case 10: afisare_angajati(lista_angajati, departament=True)
-            case 11:
-                print('Iesire din program.')
-                salveaza_date_json(lista_angajati)
-                break
+        # o singura salvare este in curs la un moment dat
+        if salvare is not None and (optiune in (11, 12) or salvare.done()):
+            try:
+                salvare.result()
+                modificari_salvate = modificari_in_salvare
+            except Exception as exception:
+                print(f'Salvarea din fundal a esuat, modificarile nu au fost salvate! Eroare: {exception}')
+            salvare = None
+        if optiune == 11:
+            print('Iesire din program.')
+            if modificari != modificari_salvate:
+                with metrici.masurare('meniu.11'):
+                    salveaza_date_json(lista_angajati)
+            break
+        if optiune == 12:
+            if modificari != modificari_salvate:
+                salvare = salveaza_date_json(lista_angajati, fundal=True)
+                modificari_in_salvare = modificari
+                print('Salvarea datelor a pornit in fundal.')
+            else:
+                print('Nu exista modificari nesalvate.')
+            continue
+        if optiune is None:
+            # o optiune invalida nu este masurata, ca sa nu apara in metrici
+            continue
+        # numai operatiile care au modificat efectiv angajatii marcheaza datele ca nesalvate
+        modificat = False
+        with metrici.masurare(f'meniu.{optiune}'):
+            match optiune:
+                case 1: modificat = introducere_date_angajat(lista_angajati, indexuri=indexuri)
+                case 2: cautare_angajat_cnp(lista_angajati)
+                case 3: modificat = modificare_angajat_cnp(lista_angajati, indexuri)
+                case 4: modificat = stergere_angajat_cnp(lista_angajati, indexuri)
+                case 5: afisare_angajati(lista_angajati)
+                case 6: calculator_cost_salarii(lista_angajati)
+                case 7: calculator_cost_salarii(lista_angajati, firma=False, indexuri=indexuri)
+                case 8: calculator_fluturas_salar(lista_angajati)
+                case 9: afisare_angajati(lista_angajati, senioritate=True, indexuri=indexuri)
+                case 10: afisare_angajati(lista_angajati, departament=True, indexuri=indexuri)
+        if modificat:
+            modificari += 1
 
 
 if __name__ == '__main__':
-    app()
+    parser = argparse.ArgumentParser(description='Gestiunea angajatilor unei firme')
+    adaugare_argumente(parser)
+    argumente = parser.parse_args()
+    # cu --metrici sau --profil sunt masurate functiile publice ale modulului si fiecare optiune din meniu
+    with sesiune(argumente.metrici, argumente.profil, [(sys.modules[__name__], 'angajat')]):
+        app()
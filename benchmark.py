@@ -0,0 +1,444 @@
+'''Benchmark pentru gestiunea angajatilor.
+
+Scriptul genereaza angajati sintetici si masoara:
+- memoria ocupata de un angajat in fiecare forma de reprezentare
+- numarul de fluturasi de salar calculati pe secunda, unul cate unul si pe lot
+- numarul de interogari ale agregatelor pe secunda in modul concurent, in functie de numarul de fire de citire
+- numarul de modificari pe secunda in modul concurent, fiecare urmata de publicarea unei vederi
+- suita de operatii (incarcare, salvare, cautare dupa CNP, listare filtrata, costuri, fluturasi) pentru
+  implementarea cu clase (management_angajati.py) si pentru cea cu functii (angajat.py), la mai multe marimi
+
+Angajatii generati trec toate validarile aplicatiei, iar CNP-urile sunt unice si au cifra de control corecta.
+Generarea este determinista: aceeasi samanta produce aceiasi angajati.
+
+Utilizare:
+python benchmark.py --numar 100000
+python benchmark.py --suita --marimi 1000 10000 100000 --iesire rezultate.json
+'''
+
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import angajat as functii
+from management_angajati import FISIER_DATE, Angajat, Companie, _internare
+from reguli_fiscale import regula_curenta
+from salarizare import calcul_fluturas, numpy
+
+
+DEPARTAMENTE = ['HR', 'Marketing', 'IT', 'Finance']
+SENIORITATI = ['junior', 'mid', 'senior']
+NUME = ['Popescu', 'Ionescu', 'Popa', 'Pop', 'Radu', 'Dumitru', 'Stan', 'Stoica', 'Gheorghe', 'Matei',
+        'Ciobanu', 'Rusu', 'Munteanu', 'Constantin', 'Marin', 'Florea', 'Ilie', 'Dinu', 'Lazar', 'Tudor']
+PRENUME = ['Andrei', 'Maria', 'Alexandru', 'Elena', 'Mihai', 'Ioana', 'Stefan', 'Ana', 'Cristian', 'Andreea',
+           'Gabriel', 'Alina', 'Bogdan', 'Diana', 'Adrian', 'Roxana', 'Florin', 'Simona', 'Vlad', 'Irina']
+SALAR_MAXIM = 30000
+# codurile de judet din CNP: 01 - 46 si 51, 52 (Calarasi, Giurgiu)
+JUDETE = [f'{cod:02d}' for cod in range(1, 47)] + ['51', '52']
+PONDERI_CNP = '279146358279'
+# varstele generate sunt raportate la acest an, pentru ca datele sa nu depinda de data rularii
+AN_REFERINTA = 2025
+MARIMI_SUITA = (1000, 10000, 100000)
+
+
+class AngajatCuDictionar:
+    # forma clasica, cu __dict__ pe fiecare instanta, folosita ca referinta
+    def __init__(self, nume, prenume, cnp, varsta, salar, departament, senioritate):
+        self.nume = nume
+        self.prenume = prenume
+        self.cnp = cnp
+        self.varsta = varsta
+        self.salar = salar
+        self.departament = departament
+        self.senioritate = senioritate
+
+
+def cifra_control_cnp(cnp):
+    '''Calculeaza cifra de control a unui CNP din primele 12 cifre
+
+    Arguments:
+    cnp: str -> primele 12 cifre ale CNP-ului
+
+    Returns:
+    str -> cifra de control
+    '''
+
+    rest = sum(int(cifra) * int(pondere) for cifra, pondere in zip(cnp, PONDERI_CNP)) % 11
+    return '1' if rest == 10 else str(rest)
+
+
+def generare_angajati(numar, seed=0):
+    '''Genereaza determinist angajati sintetici, sub forma de dictionar, care trec toate validarile.
+    CNP-urile sunt unice, cu data nasterii corespunzatoare varstei si cifra de control corecta.
+
+    Arguments:
+    numar: int -> numarul de angajati generati
+    seed: int -> samanta generatorului de numere aleatoare
+
+    Returns:
+    Generator -> angajatii generati, cu aceleasi chei ca in fisierul JSON
+    '''
+
+    generator = random.Random(seed)
+    salar_minim = regula_curenta().salar_minim
+    # ultimul numar de ordine folosit pentru fiecare combinatie sex / data nasterii / judet
+    secvente = {}
+    for _ in range(numar):
+        varsta = generator.randint(18, 65)
+        an = AN_REFERINTA - varsta
+        prefix = f'{(1 if an < 2000 else 5) + generator.randint(0, 1)}{an % 100:02d}' \
+                 f'{generator.randint(1, 12):02d}{generator.randint(1, 28):02d}'
+        while True:
+            judet = generator.choice(JUDETE)
+            secventa = secvente.get(prefix + judet, 0) + 1
+            if secventa <= 999:
+                break
+        secvente[prefix + judet] = secventa
+        cnp = f'{prefix}{judet}{secventa:03d}'
+
+        yield {
+            'Nume': generator.choice(NUME),
+            'Prenume': generator.choice(PRENUME),
+            'CNP': cnp + cifra_control_cnp(cnp),
+            'Varsta': str(varsta),
+            'Salar': round(generator.uniform(salar_minim, SALAR_MAXIM), 2),
+            'Departament': generator.choice(DEPARTAMENTE),
+            'Senioritate': generator.choice(SENIORITATI)
+        }
+
+
+def scriere_date_sintetice(cale, numar, seed=0):
+    '''Scrie angajatii generati intr-un fisier JSON in formatul aplicatiei, pe masura ce sunt
+    generati, fara a-i pastra pe toti in memorie
+
+    Arguments:
+    cale: str -> calea fisierului JSON
+    numar: int -> numarul de angajati generati
+    seed: int -> samanta generatorului de angajati
+
+    Returns:
+    None
+    '''
+
+    with open(cale, 'w') as fisier:
+        fisier.write('[')
+        for index, item in enumerate(generare_angajati(numar, seed)):
+            fisier.write(',\n' if index else '\n')
+            fisier.write(json.dumps(item))
+        fisier.write('\n]\n')
+
+
+def _construire_obiecte(linii, clasa, internare):
+    angajati = []
+    for linie in linii:
+        item = json.loads(linie)
+        angajati.append(clasa(item['Nume'], item['Prenume'], item['CNP'], internare(item['Varsta']), item['Salar'],
+                              internare(item['Departament']), internare(item['Senioritate'])))
+    return angajati
+
+
+def _construire_companie(linii):
+    companie = Companie()
+    companie.adaugare_angajati(_construire_obiecte(linii, Angajat, _internare))
+    return companie
+
+
+def masurare_memorie(numar, seed=0):
+    '''Masoara memoria ocupata de un angajat in fiecare forma de reprezentare
+
+    Arguments:
+    numar: int -> numarul de angajati folositi la masurare
+    seed: int -> samanta generatorului de angajati
+
+    Returns:
+    rezultate: Dict -> numarul mediu de octeti pe angajat pentru fiecare reprezentare
+    '''
+
+    # fiecare angajat este decodat separat, ca la citirea din fisier, astfel incat
+    # sirurile de caractere sa nu fie partajate intre reprezentari
+    linii = [json.dumps(item) for item in generare_angajati(numar, seed)]
+    reprezentari = {
+        # la json.load pe tot fisierul cheile sunt partajate intre dictionare
+        'dictionar': lambda: json.loads('[' + ','.join(linii) + ']'),
+        'obiect_cu_dict': lambda: _construire_obiecte(linii, AngajatCuDictionar, lambda valoare: valoare),
+        'obiect_cu_sloturi': lambda: _construire_obiecte(linii, Angajat, _internare),
+        # firma pastreaza obiectele, dictionarul dupa CNP, indexurile secundare si agregatele
+        'companie': lambda: _construire_companie(linii)
+    }
+
+    rezultate = {}
+    for nume, construire in reprezentari.items():
+        gc.collect()
+        tracemalloc.start()
+        structura = construire()
+        gc.collect()
+        memorie, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del structura
+        rezultate[nume] = round(memorie / numar, 1)
+
+    return rezultate
+
+
+def masurare_salarizare(numar, seed=0):
+    '''Masoara cati angajati pe secunda sunt procesati la calculul fluturasilor de salar
+
+    Arguments:
+    numar: int -> numarul de angajati din firma
+    seed: int -> samanta generatorului de angajati
+
+    Returns:
+    rezultate: Dict -> angajati pe secunda pentru calculul individual si pentru calculul pe lot
+    '''
+
+    companie = Companie()
+    for item in generare_angajati(numar, seed):
+        companie.adaugare_angajat(Angajat(item['Nume'], item['Prenume'], item['CNP'], item['Varsta'], item['Salar'],
+                                          item['Departament'], item['Senioritate']))
+
+    start = time.perf_counter()
+    fluturasi = [calcul_fluturas(angajat.salar) for angajat in companie.angajati.values()]
+    durata_individual = time.perf_counter() - start
+
+    start = time.perf_counter()
+    companie.calcul_fluturasi_lot()
+    durata_lot = time.perf_counter() - start
+
+    return {
+        'individual': round(numar / durata_individual),
+        'lot': round(numar / durata_lot)
+    }
+
+
+def masurare_concurenta(numar, seed=0, fire=(1, 2, 4, 8), durata=1.0):
+    '''Masoara interogarile agregatelor pe secunda in modul concurent, cu un fir care modifica
+    salariile in continuu si un numar variabil de fire de citire. Fiecare interogare citeste si
+    un angajat din vedere, deci fiecare modificare este urmata de publicarea unei vederi noi.
+    Firele impart acelasi interpretor, deci modificarile pe secunda scad si din cauza timpului
+    de procesor luat de cititori; costul unei modificari este masurat de masurare_publicare
+
+    Arguments:
+    numar: int -> numarul de angajati din firma
+    seed: int -> samanta generatorului de angajati
+    fire: Tuple -> numerele de fire de citire masurate
+    durata: float -> durata unei masuratori, in secunde
+
+    Returns:
+    rezultate: Dict -> pentru fiecare numar de fire, interogarile pe secunda si modificarile pe secunda
+    '''
+
+    companie = Companie(concurent=True)
+    companie.adaugare_angajati([Angajat.din_dictionar(item) for item in generare_angajati(numar, seed)])
+    cnp_uri = list(companie.angajati)
+
+    rezultate = {}
+    for numar_fire in fire:
+        oprire = threading.Event()
+        interogari = [0] * numar_fire
+        modificari = 0
+
+        def scriitor():
+            nonlocal modificari
+            generator = random.Random(seed)
+            while not oprire.is_set():
+                angajat = companie.obtinere_angajat(generator.choice(cnp_uri))
+                companie.modificare_angajat(Angajat(angajat.nume, angajat.prenume, angajat.cnp, angajat.varsta,
+                                                    round(generator.uniform(4050, 30000), 2), angajat.departament, angajat.senioritate))
+                modificari += 1
+                time.sleep(0.001)
+
+        def cititor(index):
+            while not oprire.is_set():
+                companie.vedere().obtinere_angajat(cnp_uri[index])
+                companie.cost_salarii()
+                companie.cost_salarii('IT')
+                companie.statistici_salarii()
+                interogari[index] += 1
+
+        lucratori = [threading.Thread(target=scriitor)] + [threading.Thread(target=cititor, args=(index,)) for index in range(numar_fire)]
+        for lucrator in lucratori:
+            lucrator.start()
+        time.sleep(durata)
+        oprire.set()
+        for lucrator in lucratori:
+            lucrator.join()
+        rezultate[numar_fire] = {'interogari': round(sum(interogari) / durata), 'modificari': round(modificari / durata)}
+
+    return rezultate
+
+
+def masurare_publicare(numar, seed=0, modificari=2000):
+    '''Masoara modificarile pe secunda in modul concurent cand fiecare modificare este urmata de
+    publicarea unei vederi, intr-un singur fir, fara concurenta pentru procesor
+
+    Arguments:
+    numar: int -> numarul de angajati din firma
+    seed: int -> samanta generatorului de angajati
+    modificari: int -> numarul de modificari masurate
+
+    Returns:
+    int -> modificarile pe secunda, fiecare cu publicarea vederii urmatoare
+    '''
+
+    companie = Companie(concurent=True)
+    companie.adaugare_angajati([Angajat.din_dictionar(item) for item in generare_angajati(numar, seed)])
+    generator = random.Random(seed)
+    angajati = generator.choices(list(companie.angajati.values()), k=modificari)
+
+    start = time.perf_counter()
+    for angajat in angajati:
+        companie.modificare_angajat(Angajat(angajat.nume, angajat.prenume, angajat.cnp, angajat.varsta,
+                                            round(generator.uniform(4050, 30000), 2), angajat.departament, angajat.senioritate))
+        companie.vedere().obtinere_angajat(angajat.cnp)
+    return round(modificari / (time.perf_counter() - start))
+
+
+def _cronometrare(rezultate, nume, operatie, operatii=1):
+    start = time.perf_counter()
+    valoare = operatie()
+    rezultate[nume] = {'operatii': operatii, 'secunde': round(time.perf_counter() - start, 6)}
+    return valoare
+
+
+def _masurare_clase(cale, cnp_uri, rezultate):
+    companie = Companie(cale_date=cale)
+    _cronometrare(rezultate, 'incarcare', companie.initializare)
+    _cronometrare(rezultate, 'cautare_cnp', lambda: [companie.obtinere_angajat(cnp) for cnp in cnp_uri], len(cnp_uri))
+    _cronometrare(rezultate, 'listare_filtrata', lambda: list(companie.selectare_angajati('IT', 'senior')))
+    _cronometrare(rezultate, 'cost_salarii',
+                  lambda: [companie.cost_salarii(departament) for departament in [None] + DEPARTAMENTE], len(DEPARTAMENTE) + 1)
+    _cronometrare(rezultate, 'fluturasi', companie.calcul_fluturasi_lot, len(companie.angajati))
+    # fara modificari salvarea nu scrie nimic; toti angajatii sunt marcati nesalvati, pentru ca
+    # salvarea sa scrie intreg fisierul, ca in implementarea cu functii
+    companie.marcare_modificati()
+    _cronometrare(rezultate, 'salvare', companie.salvare_informatii)
+
+
+def _masurare_functii(cnp_uri, rezultate):
+    # implementarea cu functii citeste si scrie fisierul din directorul curent
+    lista_angajati = _cronometrare(rezultate, 'incarcare', functii.incarca_date_json)
+    indexuri = _cronometrare(rezultate, 'indexare', lambda: functii.construire_indexuri(lista_angajati))
+    # cautarea dupa CNP parcurge lista, ca in cautare_angajat_cnp
+    _cronometrare(rezultate, 'cautare_cnp',
+                  lambda: [next((angajat for angajat in lista_angajati if angajat.get('CNP') == cnp), None) for cnp in cnp_uri],
+                  len(cnp_uri))
+    _cronometrare(rezultate, 'listare_filtrata', lambda: list(functii.selectare_angajati(lista_angajati, indexuri, 'IT', 'senior')))
+    _cronometrare(rezultate, 'cost_salarii',
+                  lambda: [sum(angajat.get('Salar') for angajat in functii.selectare_angajati(lista_angajati, indexuri, departament))
+                           for departament in [None] + DEPARTAMENTE], len(DEPARTAMENTE) + 1)
+    _cronometrare(rezultate, 'fluturasi', lambda: [calcul_fluturas(angajat.get('Salar')) for angajat in lista_angajati],
+                  len(lista_angajati))
+    _cronometrare(rezultate, 'salvare', lambda: functii.salveaza_date_json(lista_angajati))
+
+
+def masurare_operatii(numar, seed=0, cautari=1000, cautari_liniare=100):
+    '''Masoara durata operatiilor principale pentru implementarea cu clase si pentru cea cu functii,
+    pe acelasi fisier de date generat
+
+    Arguments:
+    numar: int -> numarul de angajati generati
+    seed: int -> samanta generatorului de angajati
+    cautari: int -> numarul de cautari dupa CNP in implementarea cu clase
+    cautari_liniare: int -> numarul de cautari dupa CNP in implementarea cu functii, care parcurge lista
+
+    Returns:
+    rezultate: Dict -> pentru fiecare implementare si operatie, numarul de operatii si durata totala in secunde
+    '''
+
+    generator = random.Random(seed)
+    director_curent = os.getcwd()
+    with tempfile.TemporaryDirectory() as director:
+        cale = os.path.join(director, FISIER_DATE)
+        scriere_date_sintetice(cale, numar, seed)
+        cnp_uri = [item['CNP'] for item in generare_angajati(numar, seed)]
+        # o parte din cautari sunt pentru CNP-uri care nu exista, cazul cel mai lent pentru parcurgerea listei
+        selectie = generator.sample(cnp_uri, min(cautari, numar)) + ['0000000000000']
+        selectie_liniara = selectie[:cautari_liniare] + ['0000000000000']
+        del cnp_uri
+
+        rezultate = {'clase': {}, 'functii': {}}
+        gc.collect()
+        _masurare_clase(cale, selectie, rezultate['clase'])
+        gc.collect()
+        os.chdir(director)
+        try:
+            _masurare_functii(selectie_liniara, rezultate['functii'])
+        finally:
+            os.chdir(director_curent)
+
+    return rezultate
+
+
+def suita(marimi=MARIMI_SUITA, seed=0, cautari=1000, cautari_liniare=100):
+    '''Ruleaza masurarea operatiilor la fiecare marime si adauga informatiile despre mediul de rulare,
+    astfel incat rezultatele sa poata fi comparate intre rulari
+
+    Arguments:
+    marimi: Tuple -> numerele de angajati masurate
+    seed: int -> samanta generatorului de angajati
+    cautari: int -> numarul de cautari dupa CNP in implementarea cu clase
+    cautari_liniare: int -> numarul de cautari dupa CNP in implementarea cu functii
+
+    Returns:
+    rezultate: Dict -> mediul de rulare si rezultatele masurarii pentru fiecare marime
+    '''
+
+    return {
+        'mediu': {
+            'data': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platforma': platform.platform(),
+            'numpy': numpy is not None,
+            'seed': seed
+        },
+        'marimi': {str(numar): masurare_operatii(numar, seed, cautari, cautari_liniare) for numar in marimi}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pentru gestiunea angajatilor')
+    parser.add_argument('--numar', type=int, default=100000, help='numarul de angajati generati')
+    parser.add_argument('--seed', type=int, default=0, help='samanta generatorului de angajati')
+    parser.add_argument('--suita', action='store_true', help='ruleaza suita de operatii pentru ambele implementari')
+    parser.add_argument('--marimi', type=int, nargs='+', default=MARIMI_SUITA,
+                        help='numerele de angajati din suita (de exemplu 1000 10000 100000 1000000 10000000)')
+    parser.add_argument('--cautari', type=int, default=1000, help='numarul de cautari dupa CNP in implementarea cu clase')
+    parser.add_argument('--cautari-liniare', type=int, default=100,
+                        help='numarul de cautari dupa CNP in implementarea cu functii')
+    parser.add_argument('--iesire', default=None, help='fisierul JSON in care sunt scrise rezultatele suitei')
+    argumente = parser.parse_args()
+
+    if argumente.suita:
+        rezultate = suita(argumente.marimi, argumente.seed, argumente.cautari, argumente.cautari_liniare)
+        if argumente.iesire:
+            with open(argumente.iesire, 'w') as fisier:
+                json.dump(rezultate, fisier, indent=4)
+        else:
+            print(json.dumps(rezultate, indent=4))
+        return
+
+    print(f'Memorie pe angajat (octeti), {argumente.numar} angajati:')
+    for nume, octeti in masurare_memorie(argumente.numar, argumente.seed).items():
+        print(f'{nume}: {octeti}')
+
+    print(f'Fluturasi de salar (angajati pe secunda), {argumente.numar} angajati:')
+    for nume, viteza in masurare_salarizare(argumente.numar, argumente.seed).items():
+        print(f'{nume}: {viteza}')
+
+    print(f'Interogari ale agregatelor pe secunda in modul concurent, {argumente.numar} angajati:')
+    for numar_fire, viteza in masurare_concurenta(argumente.numar, argumente.seed).items():
+        print(f'{numar_fire} fire de citire: {viteza["interogari"]} interogari, {viteza["modificari"]} modificari')
+    print(f'Modificari pe secunda, fiecare urmata de publicarea unei vederi: {masurare_publicare(argumente.numar, argumente.seed)}')
+
+
+if __name__ == '__main__':
+    main()
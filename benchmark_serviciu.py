@@ -0,0 +1,147 @@
+'''Test de incarcare pentru serviciul HTTP.
+
+Scriptul deschide mai multe conexiuni catre un serviciu pornit cu serviciu.py, trimite
+pe fiecare cereri de citire amestecate (cautare dupa CNP, fluturas, cost, pagini din lista)
+si raporteaza latenta p50 si p99 si numarul de cereri pe secunda.
+
+Utilizare:
+python serviciu.py --port 8080 &
+python benchmark_serviciu.py --port 8080 --conexiuni 50 --cereri 20000
+'''
+
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from serviciu import GAZDA, PORT
+
+
+TIPURI_CERERI = ('angajat', 'fluturas', 'cost', 'lista')
+
+
+async def _cerere(reader, writer, cale):
+    writer.write(f'GET {cale} HTTP/1.1\r\nHost: {GAZDA}\r\n\r\n'.encode('ascii'))
+    await writer.drain()
+
+    stare = int((await reader.readline()).split()[1])
+    antete = {}
+    while True:
+        linie = await reader.readline()
+        if linie in (b'\r\n', b''):
+            break
+        nume, _, valoare = linie.decode('latin-1').partition(':')
+        antete[nume.strip().lower()] = valoare.strip()
+
+    if antete.get('transfer-encoding') == 'chunked':
+        parti = []
+        while True:
+            lungime = int(await reader.readline(), 16)
+            parti.append(await reader.readexactly(lungime + 2))
+            if not lungime:
+                break
+        corp = b''.join(parte[:-2] for parte in parti)
+    else:
+        corp = await reader.readexactly(int(antete.get('content-length', 0)))
+    return stare, corp
+
+
+def _percentila(valori_sortate, procent):
+    if not valori_sortate:
+        return 0.0
+    return valori_sortate[min(len(valori_sortate) - 1, int(len(valori_sortate) * procent / 100))]
+
+
+async def incarcare(gazda=GAZDA, port=PORT, conexiuni=50, cereri=10000, seed=0):
+    '''Trimite cereri de citire catre serviciu si masoara latenta fiecarei cereri
+
+    Arguments:
+    gazda: str -> adresa serviciului
+    port: int -> portul serviciului
+    conexiuni: int -> numarul de conexiuni deschise in paralel
+    cereri: int -> numarul total de cereri trimise
+    seed: int -> samanta generatorului de cereri
+
+    Returns:
+    rezultate: Dict -> p50 si p99 (ms) pentru fiecare tip de cerere si pentru total, cereri pe secunda si erori
+    '''
+
+    reader, writer = await asyncio.open_connection(gazda, port)
+    _, corp = await _cerere(reader, writer, '/angajati?limita=1000')
+    writer.close()
+    cnp_uri = [json.loads(linie)['CNP'] for linie in corp.splitlines()]
+    if not cnp_uri:
+        raise ValueError('Serviciul nu are angajati')
+
+    generator = random.Random(seed)
+    plan = []
+    for _ in range(cereri):
+        tip = generator.choice(TIPURI_CERERI)
+        if tip == 'angajat':
+            cale = f'/angajati/{generator.choice(cnp_uri)}'
+        elif tip == 'fluturas':
+            cale = f'/fluturas/{generator.choice(cnp_uri)}'
+        elif tip == 'cost':
+            cale = f'/cost?departament={generator.choice(["HR", "IT", "Marketing", "Finance"])}'
+        else:
+            cale = f'/angajati?limita=20&deplasare={generator.randrange(len(cnp_uri))}'
+        plan.append((tip, cale))
+
+    latente = {tip: [] for tip in TIPURI_CERERI}
+    erori = 0
+
+    async def conexiune(cereri_conexiune):
+        nonlocal erori
+        reader, writer = await asyncio.open_connection(gazda, port)
+        try:
+            for tip, cale in cereri_conexiune:
+                start = time.perf_counter()
+                stare, _ = await _cerere(reader, writer, cale)
+                latente[tip].append(time.perf_counter() - start)
+                if stare != 200:
+                    erori += 1
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(conexiune(plan[index::conexiuni]) for index in range(conexiuni)))
+    durata = time.perf_counter() - start
+
+    rezultate = {}
+    for tip, valori in list(latente.items()) + [('total', [valoare for valori in latente.values() for valoare in valori])]:
+        valori.sort()
+        rezultate[tip] = {
+            'cereri': len(valori),
+            'p50_ms': round(_percentila(valori, 50) * 1000, 3),
+            'p99_ms': round(_percentila(valori, 99) * 1000, 3)
+        }
+    rezultate['cereri_pe_secunda'] = round(cereri / durata)
+    rezultate['erori'] = erori
+    return rezultate
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Test de incarcare pentru serviciul HTTP')
+    parser.add_argument('--gazda', default=GAZDA, help='adresa serviciului')
+    parser.add_argument('--port', type=int, default=PORT, help='portul serviciului')
+    parser.add_argument('--conexiuni', type=int, default=50, help='numarul de conexiuni paralele')
+    parser.add_argument('--cereri', type=int, default=10000, help='numarul total de cereri')
+    parser.add_argument('--seed', type=int, default=0, help='samanta generatorului de cereri')
+    parser.add_argument('--json', action='store_true', help='afiseaza rezultatele in format JSON')
+    argumente = parser.parse_args()
+
+    rezultate = asyncio.run(incarcare(argumente.gazda, argumente.port, argumente.conexiuni, argumente.cereri, argumente.seed))
+    if argumente.json:
+        print(json.dumps(rezultate, indent=4))
+        return
+
+    print(f'{argumente.cereri} cereri pe {argumente.conexiuni} conexiuni:')
+    for tip in TIPURI_CERERI + ('total',):
+        print(f'{tip}: p50 {rezultate[tip]["p50_ms"]} ms, p99 {rezultate[tip]["p99_ms"]} ms ({rezultate[tip]["cereri"]} cereri)')
+    print(f'Cereri pe secunda: {rezultate["cereri_pe_secunda"]}, erori: {rezultate["erori"]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,365 @@
+'''Cautarea angajatilor dupa atributele codificate in CNP si dupa nume.
+
+Modulul contine:
+- decodificarea datei nasterii si a judetului din CNP
+- lista ordonata in blocuri, folosita de indexul CNP
+- indexul CNP: pentru fiecare criteriu de cautare (CNP, data nasterii, judet), perechile
+  (cheie, CNP) ale angajatilor pastrate ordonate, cu cautare binara dupa un prefix sau dupa
+  un interval de prefixe
+- indexul de nume: un index inversat de trigrame peste numele si prenumele angajatilor, pentru
+  cautarea dupa nume scrise incomplet sau gresit, cu rezultate ordonate dupa similaritate
+
+CNP-ul are forma SAALLZZJJNNNC: S codifica sexul si secolul nasterii, AALLZZ data nasterii,
+JJ judetul, NNN un numar de ordine si C cifra de control. Cheile sunt texte (CNP-ul, data
+nasterii ca AAAA-LL-ZZ si codul judetului), iar intervalul dintre doua prefixe contine toate
+cheile care incep cu un text aflat intre cele doua, inclusiv. Perechile sunt pastrate intr-o
+lista de blocuri ordonate de cel mult 2 * MARIME_BLOC elemente: o cautare costa doua cautari
+binare plus numarul angajatilor gasiti, iar o adaugare sau o eliminare costa o cautare binara
+si mutarea elementelor unui singur bloc, nu reordonarea intregului index.
+
+Indexul de nume lucreaza pe valorile distincte ale numelor, nu pe angajati: trigramele trimit
+la nume, iar fiecare pereche (nume, prenume) trimite la angajatii care o poarta. O cautare
+compara textul cautat numai cu numele care au trigrame comune cu el, deci costul ei depinde
+de numarul numelor diferite si al rezultatelor returnate, nu de numarul angajatilor.
+
+Exemplu (angajatii nascuti intre 1990 si 1995, angajatii din judetul 40, apoi o cautare dupa nume):
+companie.cautare_angajati('data_nasterii', '1990', '1995')
+companie.cautare_angajati('judet', '40')
+companie.cautare_nume('Popesku Andrei')
+'''
+
+
+import bisect
+import datetime
+import functools
+import heapq
+import math
+import sys
+import unicodedata
+
+
+# secolul nasterii dupa prima cifra a CNP-ului; pentru rezidentii si cetatenii straini (7, 8, 9)
+# secolul nu este codificat in CNP si este considerat 1900
+SECOLE_CNP = {'1': 1900, '2': 1900, '3': 1800, '4': 1800, '5': 2000, '6': 2000, '7': 1900, '8': 1900, '9': 1900}
+CRITERII_CAUTARE = ('cnp', 'data_nasterii', 'judet')
+# adaugat la capatul superior al intervalului, este mai mare decat orice caracter dintr-o cheie
+_SFARSIT_PREFIX = '\uffff'
+# pragurile de similaritate incercate, in ordine, de cautarea dupa nume: un prag mai mic este folosit
+# numai daca potrivirile de peste pragul anterior nu ajung pentru toate rezultatele cerute
+PRAGURI_SIMILARITATE = (0.8, 0.6, 0.4)
+LIMITA_REZULTATE = 20
+# numarul de elemente la care este umplut un bloc al listei ordonate; un bloc mai mare decat
+# dublul acestei valori este impartit in doua
+MARIME_BLOC = 512
+
+
+def data_nasterii(cnp):
+    '''Decodifica data nasterii din CNP
+
+    Arguments:
+    cnp: str -> CNP-ul angajatului
+
+    Returns:
+    str -> data nasterii in forma AAAA-LL-ZZ sau None daca CNP-ul nu contine o data valida
+    '''
+
+    secol = SECOLE_CNP.get(cnp[:1])
+    if secol is None or len(cnp) != 13:
+        return None
+    try:
+        # datele se repeta intre angajati, deci sunt pastrate o singura data in memorie
+        return sys.intern(datetime.date(secol + int(cnp[1:3]), int(cnp[3:5]), int(cnp[5:7])).isoformat())
+    except ValueError:
+        return None
+
+
+def judet(cnp):
+    '''Decodifica codul judetului din CNP
+
+    Arguments:
+    cnp: str -> CNP-ul angajatului
+
+    Returns:
+    str -> codul judetului, din doua cifre, sau None daca CNP-ul nu are 13 caractere
+    '''
+
+    return sys.intern(cnp[7:9]) if len(cnp) == 13 else None
+
+
+_CHEI_CAUTARE = {'cnp': str, 'data_nasterii': data_nasterii, 'judet': judet}
+
+
+class ListaOrdonata:
+    def __init__(self, elemente=()):
+        # elementele sunt impartite in blocuri ordonate, consecutive; _maxime pastreaza ultimul
+        # element al fiecarui bloc, pentru cautarea binara a blocului in care se afla o valoare
+        elemente = sorted(elemente)
+        self._blocuri = [elemente[i:i + MARIME_BLOC] for i in range(0, len(elemente), MARIME_BLOC)]
+        self._maxime = [bloc[-1] for bloc in self._blocuri]
+        self._numar = len(elemente)
+
+    def __len__(self):
+        return self._numar
+
+    def __iter__(self):
+        for bloc in self._blocuri:
+            yield from bloc
+
+    def adauga(self, element):
+        if not self._blocuri:
+            self._blocuri.append([element])
+            self._maxime.append(element)
+            self._numar = 1
+            return
+        # un element mai mare decat toate cele existente intra in ultimul bloc
+        pozitie = min(bisect.bisect_left(self._maxime, element), len(self._blocuri) - 1)
+        bloc = self._blocuri[pozitie]
+        bisect.insort(bloc, element)
+        self._maxime[pozitie] = bloc[-1]
+        self._numar += 1
+        if len(bloc) > 2 * MARIME_BLOC:
+            self._blocuri.insert(pozitie + 1, bloc[MARIME_BLOC:])
+            del bloc[MARIME_BLOC:]
+            self._maxime.insert(pozitie, bloc[-1])
+
+    def elimina(self, element):
+        pozitie = bisect.bisect_left(self._maxime, element)
+        if pozitie == len(self._blocuri):
+            return False
+        bloc = self._blocuri[pozitie]
+        index = bisect.bisect_left(bloc, element)
+        if index == len(bloc) or bloc[index] != element:
+            return False
+        del bloc[index]
+        self._numar -= 1
+        if bloc:
+            self._maxime[pozitie] = bloc[-1]
+        else:
+            del self._blocuri[pozitie]
+            del self._maxime[pozitie]
+        return True
+
+    def interval(self, inceput, sfarsit):
+        # elementele x cu inceput <= x < sfarsit, in ordine
+        pozitie = bisect.bisect_left(self._maxime, inceput)
+        if pozitie == len(self._blocuri):
+            return
+        index = bisect.bisect_left(self._blocuri[pozitie], inceput)
+        for pozitie in range(pozitie, len(self._blocuri)):
+            bloc = self._blocuri[pozitie]
+            for index in range(index, len(bloc)):
+                if bloc[index] >= sfarsit:
+                    return
+                yield bloc[index]
+            index = 0
+
+
+class IndexCNP:
+    def __init__(self, angajati=()):
+        # angajatii sunt rezolvati dupa CNP; pentru fiecare criteriu sunt pastrate perechile (cheie, CNP)
+        # ordonate, iar angajatii fara cheie (de exemplu cu o data a nasterii invalida) nu sunt indexati
+        self.angajati = {angajat.cnp: angajat for angajat in angajati}
+        # la construire perechile sunt sortate o singura data, apoi impartite in blocuri
+        self._intrari = {
+            criteriu: ListaOrdonata(
+                (cheie, cnp) for cnp in self.angajati for cheie in (functie(cnp),) if cheie is not None
+            )
+            for criteriu, functie in _CHEI_CAUTARE.items()
+        }
+
+    def __len__(self):
+        return len(self.angajati)
+
+    def adauga(self, angajat):
+        if angajat.cnp in self.angajati:
+            self.angajati[angajat.cnp] = angajat
+            return
+        self.angajati[angajat.cnp] = angajat
+        for criteriu, functie in _CHEI_CAUTARE.items():
+            cheie = functie(angajat.cnp)
+            if cheie is not None:
+                self._intrari[criteriu].adauga((cheie, angajat.cnp))
+
+    def elimina(self, angajat):
+        if self.angajati.pop(angajat.cnp, None) is None:
+            return
+        for criteriu, functie in _CHEI_CAUTARE.items():
+            cheie = functie(angajat.cnp)
+            if cheie is not None:
+                self._intrari[criteriu].elimina((cheie, angajat.cnp))
+
+    def inlocuieste(self, vechi, nou):
+        # cheile depind numai de CNP, care nu se schimba la modificare
+        self.angajati[nou.cnp] = nou
+
+    def cautare(self, criteriu, inceput, sfarsit=None):
+        # fara sfarsit, sunt returnati angajatii a caror cheie incepe cu inceput
+        stop = ((inceput if sfarsit is None else sfarsit) + _SFARSIT_PREFIX,)
+        return [self.angajati[cnp] for _, cnp in self._intrari[criteriu].interval((inceput,), stop)]
+
+
+@functools.lru_cache(maxsize=65536)
+def normalizare_nume(nume):
+    '''Aduce un nume la forma folosita in indexul de nume: litere mici, fara diacritice
+
+    Arguments:
+    nume: str -> numele sau prenumele
+
+    Returns:
+    str -> numele normalizat
+    '''
+
+    descompus = unicodedata.normalize('NFKD', nume.casefold())
+    return sys.intern(''.join(caracter for caracter in descompus if not unicodedata.combining(caracter)))
+
+
+def trigrame(cuvant):
+    '''Imparte un cuvant normalizat in trigrame; inceputul si sfarsitul cuvantului sunt marcate
+    prin spatii, astfel incat si cuvintele scurte au trigrame
+
+    Arguments:
+    cuvant: str -> cuvantul normalizat
+
+    Returns:
+    Set -> trigramele cuvantului
+    '''
+
+    text = f'  {cuvant} '
+    return {text[pozitie:pozitie + 3] for pozitie in range(len(text) - 2)}
+
+
+class IndexNume:
+    def __init__(self, angajati=()):
+        # perechea (nume, prenume) normalizata -> angajatii care o poarta, indexati dupa CNP
+        self.persoane = {}
+        # numele normalizat (de familie sau prenume) -> perechile in care apare si trigramele lui
+        self._nume = {}
+        self._trigrame_nume = {}
+        # trigrama -> numele care o contin
+        self._trigrame = {}
+        # numele distincte, ordonate, pentru potrivirea dupa prefix
+        self._vocabular = []
+        for angajat in angajati:
+            self.adauga(angajat)
+
+    def __len__(self):
+        return sum(map(len, self.persoane.values()))
+
+    def adauga(self, angajat):
+        persoana = self._persoana(angajat)
+        grup = self.persoane.get(persoana)
+        if grup is None:
+            grup = self.persoane[persoana] = {}
+            for nume in set(persoana):
+                perechi = self._nume.get(nume)
+                if perechi is None:
+                    perechi = self._nume[nume] = set()
+                    trigrame_nume = self._trigrame_nume[nume] = frozenset(trigrame(nume))
+                    for trigrama in trigrame_nume:
+                        self._trigrame.setdefault(trigrama, set()).add(nume)
+                    bisect.insort(self._vocabular, nume)
+                perechi.add(persoana)
+        grup[angajat.cnp] = angajat
+
+    def elimina(self, angajat):
+        persoana = self._persoana(angajat)
+        grup = self.persoane.get(persoana)
+        if grup is None or grup.pop(angajat.cnp, None) is None or grup:
+            return
+        # ultimul angajat cu acest nume: numele si trigramele lui raman in index numai daca mai sunt folosite
+        del self.persoane[persoana]
+        for nume in set(persoana):
+            perechi = self._nume[nume]
+            perechi.discard(persoana)
+            if not perechi:
+                del self._nume[nume]
+                for trigrama in self._trigrame_nume.pop(nume):
+                    cuvinte = self._trigrame[trigrama]
+                    cuvinte.discard(nume)
+                    if not cuvinte:
+                        del self._trigrame[trigrama]
+                del self._vocabular[bisect.bisect_left(self._vocabular, nume)]
+
+    def inlocuieste(self, vechi, nou):
+        # daca numele nu se schimba, angajatul isi pastreaza pozitia in grup
+        if self._persoana(vechi) == self._persoana(nou):
+            self.persoane[self._persoana(nou)][nou.cnp] = nou
+        else:
+            self.elimina(vechi)
+            self.adauga(nou)
+
+    def cautare(self, text, limita=LIMITA_REZULTATE):
+        # returneaza cel mult limita perechi (scor, angajat), in ordinea descrescatoare a scorului;
+        # scorul unei persoane este media, pe cuvintele cautate, a celei mai bune similaritati cu numele ei
+        cuvinte = [cuvant for cuvant in map(normalizare_nume, text.split()) if cuvant]
+        rezultate = []
+        if not cuvinte or limita <= 0:
+            return rezultate
+        for prag in PRAGURI_SIMILARITATE:
+            rezultate = self._clasament([self._similaritati(cuvant, prag) for cuvant in cuvinte], limita)
+            if len(rezultate) == limita:
+                break
+        return rezultate
+
+    def _clasament(self, scoruri, limita):
+        if not all(scoruri):
+            return []
+        # persoanele sunt parcurse prin numele potrivite cuvantului cu cele mai putine potriviri, in ordinea
+        # descrescatoare a similaritatii; parcurgerea se opreste cand nicio persoana ramasa nu mai poate
+        # intra intre primele limita, chiar daca s-ar potrivi perfect cu celelalte cuvinte
+        selectiv = min(scoruri, key=len)
+        maxim_rest = sum(max(similaritati.values()) for similaritati in scoruri) - max(selectiv.values())
+        clasament = []
+        vazute = set()
+        for scor_nume, nume in sorted(((scor, nume) for nume, scor in selectiv.items()), reverse=True):
+            if len(clasament) == limita and scor_nume + maxim_rest <= clasament[0][0]:
+                break
+            for persoana in self._nume[nume]:
+                if persoana in vazute:
+                    continue
+                vazute.add(persoana)
+                scor = sum(max(similaritati.get(parte, 0.0) for parte in persoana) for similaritati in scoruri)
+                if len(clasament) < limita:
+                    heapq.heappush(clasament, (scor, persoana))
+                elif (scor, persoana) > clasament[0]:
+                    heapq.heapreplace(clasament, (scor, persoana))
+
+        rezultate = []
+        for scor, persoana in sorted(clasament, reverse=True):
+            for angajat in self.persoane[persoana].values():
+                if len(rezultate) == limita:
+                    return rezultate
+                rezultate.append((scor / len(scoruri), angajat))
+        return rezultate
+
+    def _similaritati(self, cuvant, prag):
+        # numele identic are scorul 1, numele care incep cu cuvantul cautat sunt potriviri dupa prefix,
+        # iar pentru celelalte se foloseste similaritatea Dice a trigramelor; sunt pastrate numai
+        # numele cu scorul cel putin egal cu pragul
+        similaritati = {}
+        pozitie = bisect.bisect_left(self._vocabular, cuvant)
+        stop = bisect.bisect_left(self._vocabular, cuvant + _SFARSIT_PREFIX, pozitie)
+        for nume in self._vocabular[pozitie:stop]:
+            scor = 1.0 if nume == cuvant else 0.5 + 0.4 * len(cuvant) / len(nume)
+            if scor >= prag:
+                similaritati[nume] = scor
+
+        # un nume cu similaritatea cel putin egala cu pragul are cel putin `minim` trigrame comune cu
+        # cuvantul: fie contine una dintre cele mai rare len - minim trigrame ale cuvantului, fie le
+        # contine pe toate celelalte minim trigrame; numai aceste nume sunt comparate cu cuvantul
+        trigrame_cuvant = trigrame(cuvant)
+        minim = math.ceil(prag * len(trigrame_cuvant) / (2 - prag))
+        liste = sorted((self._trigrame.get(trigrama, set()) for trigrama in trigrame_cuvant), key=len)
+        candidati = set().union(*liste[:len(liste) - minim])
+        candidati.update(set.intersection(*liste[len(liste) - minim:]))
+        candidati.difference_update(similaritati)
+
+        for nume in candidati:
+            trigrame_nume = self._trigrame_nume[nume]
+            scor = 2 * len(trigrame_cuvant & trigrame_nume) / (len(trigrame_cuvant) + len(trigrame_nume))
+            if scor >= prag:
+                similaritati[nume] = scor
+        return similaritati
+
+    def _persoana(self, angajat):
+        return normalizare_nume(angajat.nume or ''), normalizare_nume(angajat.prenume or '')
@@ -0,0 +1,551 @@
+'''Importul si exportul angajatilor pe loturi, fara introducerea datelor de la tastatura.
+
+Formate suportate:
+- CSV, cu antetul Nume,Prenume,CNP,Varsta,Salar,Departament,Senioritate
+- JSON Lines, cate un angajat pe linie, cu aceleasi chei ca in fisierul JSON
+
+Fiecare rand este validat cu aceleasi reguli ca la introducerea manuala. Randurile valide
+sunt adaugate pe loturi, iar randurile invalide sunt scrise intr-un raport de respingere.
+Pentru fisierele mari, fisierul este impartit pe intervale de octeti, iar fiecare proces
+citeste, decodeaza si valideaza singur intervalul primit.
+
+Operatiile import-json si export-json convertesc datele intre stocarea aleasa (--stocare sau
+--date) si un fisier JSON in formatul aplicatiei, implicit date_angajati.json, citit de angajat.py.
+Dupa export-json in acest fisier, fisierul si stocarea sunt considerate sincronizate, iar
+avertismentul afisat la deschiderea unor date diferite nu mai apare.
+
+Utilizare:
+python import_export.py import angajati_noi.csv --respinse respinse.csv --procese 4
+python import_export.py export angajati.jsonl
+python import_export.py validare angajati_noi.csv --respinse respinse.csv --procese 4
+python import_export.py revalidare --salar-minim 4500 --respinse respinse.csv
+python import_export.py import-json date_angajati.json --stocare sqlite
+python import_export.py export-json --stocare sqlite
+'''
+
+
+import argparse
+import csv
+import io
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
+from management_angajati import (CAMPURI_ANGAJAT, FISIER_DATE, Angajat, Companie, adaugare_argumente_stocare, cale_date_argumente,
+                                  sincronizare_json)
+from stocare import CRITERII_FRAGMENTARE
+
+
+MARIME_LOT = 10000
+MARIME_BUCATA = 20000
+MARIME_INTERVAL = 2 * 1024 * 1024
+PRAG_PARALEL = 4 * 1024 * 1024
+
+
+def _format_fisier(cale, format_fisier=None):
+    if format_fisier:
+        return format_fisier
+    return 'jsonl' if cale.endswith(('.jsonl', '.ndjson')) else 'csv'
+
+
+def citire_inregistrari(cale, format_fisier=None):
+    '''Citeste inregistrarile dintr-un fisier CSV sau JSON Lines, una cate una
+
+    Arguments:
+    cale: str -> calea fisierului
+    format_fisier: str -> 'csv' sau 'jsonl'; daca lipseste, este dedus din extensie
+
+    Returns:
+    Generator -> perechi (numar_rand, inregistrare), unde numar_rand este linia din fisier pe care
+                 incepe inregistrarea, iar inregistrarea este un dictionar, sau None daca linia JSON
+                 nu poate fi decodata
+    '''
+
+    # utf-8-sig elimina marcajul BOM scris la inceputul fisierului de unele editoare
+    if _format_fisier(cale, format_fisier) == 'jsonl':
+        # liniile sunt despartite numai de \n, ca la impartirea pe intervale
+        with open(cale, 'r', encoding='utf-8-sig', newline='\n') as fisier:
+            for numar_rand, item in _linii_jsonl(fisier):
+                yield numar_rand + 1, item
+    else:
+        with open(cale, 'r', encoding='utf-8-sig', newline='') as fisier:
+            for numar_rand, item in _randuri_csv(csv.reader(fisier)):
+                yield numar_rand + 1, item
+
+
+def _linii_jsonl(linii):
+    # numeroteaza liniile de la 0 si sare peste cele goale
+    for numar_linie, linie in enumerate(linii):
+        if not linie.strip():
+            continue
+        try:
+            yield numar_linie, json.loads(linie)
+        except json.JSONDecodeError:
+            yield numar_linie, None
+
+
+def _randuri_csv(reader, antet=None):
+    # ca csv.DictReader, dar fiecare inregistrare este numerotata cu linia fizica pe care incepe
+    # (de la 0), astfel incat liniile goale si campurile pe mai multe linii nu decaleaza numerele;
+    # daca antetul lipseste, este citit din primul rand
+    if antet is None:
+        antet = next(reader, None)
+        if antet is None:
+            return
+    while True:
+        numar_linie = reader.line_num
+        rand = next(reader, None)
+        if rand is None:
+            return
+        if not rand:
+            continue
+        item = dict(zip(antet, rand))
+        if len(rand) > len(antet):
+            item[None] = rand[len(antet):]
+        for camp in antet[len(rand):]:
+            item[camp] = None
+        yield numar_linie, item
+
+
+def validare_inregistrare(item, salar_minim=None):
+    '''Valideaza o inregistrare cu regulile folosite la introducerea manuala a datelor
+
+    Arguments:
+    item: Dict -> inregistrarea citita din fisier
+    salar_minim: float -> salarul minim pe economie folosit la validare (implicit cel din regula fiscala in vigoare)
+
+    Returns:
+    Tuple -> (valori, erori); valori contine campurile angajatului, in ordinea parametrilor
+             clasei Angajat, si este None daca lista de erori nu este goala
+    '''
+
+    if not isinstance(item, dict):
+        return None, ['Inregistrarea nu este un obiect JSON valid']
+
+    erori = []
+    nume = str(item.get('Nume') or '')
+    prenume = str(item.get('Prenume') or '')
+    cnp = str(item.get('CNP') or '')
+    varsta = str(item.get('Varsta') or '')
+    departament = str(item.get('Departament') or '')
+    senioritate = str(item.get('Senioritate') or '')
+
+    if not Companie._validare_nume(nume):
+        erori.append('Numele nu este valid')
+    if not Companie._validare_nume(prenume):
+        erori.append('Prenumele nu este valid')
+    if not Companie._validare_cnp(cnp):
+        erori.append('CNPul nu este valid')
+    if not Companie._validare_varsta(varsta):
+        erori.append('Varsta nu este valida')
+    try:
+        salar = float(item.get('Salar'))
+        if not math.isfinite(salar):
+            erori.append('Salarul nu este un numar finit')
+        elif not Companie._validare_salar(salar, salar_minim):
+            erori.append('Salarul este sub minimul pe economie')
+    except (TypeError, ValueError):
+        erori.append('Salarul nu este un numar')
+    if not Companie._validare_departament(departament):
+        erori.append('Departamentul nu este valid')
+    if not Companie._validare_senioritate(senioritate):
+        erori.append('Senioritatea nu este valida')
+
+    if erori:
+        return None, erori
+    return (nume, prenume, cnp, varsta, salar, departament, senioritate), []
+
+
+def _validare_bucata(bucata, salar_minim=None):
+    # ruleaza intr-un proces de lucru; inregistrarile raman in procesul principal,
+    # iar inapoi sunt trimise numai valorile validate si erorile
+    return [validare_inregistrare(item, salar_minim) for _, item in bucata]
+
+
+def _numar_procese(procese):
+    # implicit este folosit cate un proces pentru fiecare procesor, dar niciodata mai multe
+    numar_procesoare = os.cpu_count() or 1
+    return min(procese or numar_procesoare, numar_procesoare)
+
+
+def validare_paralela(inregistrari, procese=None, marime_bucata=MARIME_BUCATA, salar_minim=None):
+    '''Valideaza inregistrarile pe bucati, repartizate intre procesele unui ProcessPoolExecutor.
+    Rezultatele sunt returnate in ordinea inregistrarilor, iar in lucru sunt tinute cel mult
+    doua bucati pentru fiecare proces, astfel incat memoria folosita sa nu depinda de dimensiunea
+    fisierului.
+
+    Arguments:
+    inregistrari: Iterable -> perechi (numar_rand, inregistrare), ca cele din citire_inregistrari
+    procese: int -> numarul de procese (implicit numarul de procesoare); cu un singur proces, validarea se face in procesul curent
+    marime_bucata: int -> numarul de inregistrari trimise unui proces la un pas
+    salar_minim: float -> salarul minim pe economie folosit la validare (implicit cel din regula fiscala in vigoare)
+
+    Returns:
+    Generator -> tupluri (numar_rand, inregistrare, valori, erori)
+    '''
+
+    inregistrari = iter(inregistrari)
+    bucati = iter(lambda: list(islice(inregistrari, marime_bucata)), [])
+
+    procese = _numar_procese(procese)
+    if procese == 1:
+        for bucata in bucati:
+            for (numar_rand, item), (valori, erori) in zip(bucata, _validare_bucata(bucata, salar_minim)):
+                yield numar_rand, item, valori, erori
+        return
+
+    validare = partial(_validare_bucata, salar_minim=salar_minim)
+    with ProcessPoolExecutor(max_workers=procese) as executor:
+        in_lucru = deque()
+        for bucata in bucati:
+            in_lucru.append((bucata, executor.submit(validare, bucata)))
+            while len(in_lucru) > 2 * procese or (in_lucru and in_lucru[0][1].done()):
+                bucata_gata, rezultat = in_lucru.popleft()
+                for (numar_rand, item), (valori, erori) in zip(bucata_gata, rezultat.result()):
+                    yield numar_rand, item, valori, erori
+        while in_lucru:
+            bucata_gata, rezultat = in_lucru.popleft()
+            for (numar_rand, item), (valori, erori) in zip(bucata_gata, rezultat.result()):
+                yield numar_rand, item, valori, erori
+
+
+def _validare_interval(cale, format_fisier, antet, inceput, sfarsit, salar_minim=None, cu_valide=True):
+    # ruleaza intr-un proces de lucru: intervalul este citit si decodat aici, iar inapoi sunt trimise
+    # numai randurile invalide si, la import, valorile randurilor valide; numerele randurilor sunt
+    # relative la inceputul intervalului
+    with open(cale, 'rb') as fisier:
+        fisier.seek(inceput)
+        # marcajul BOM poate aparea numai la inceputul primului interval
+        text = fisier.read(sfarsit - inceput).decode('utf-8-sig')
+
+    reader = None
+    if format_fisier == 'jsonl':
+        linii = text.split('\n')
+        inregistrari = _linii_jsonl(linii)
+    else:
+        reader = csv.reader(io.StringIO(text, newline=''))
+        inregistrari = _randuri_csv(reader, antet)
+
+    numar_valide = 0
+    rezultate = []
+    for numar_rand, item in inregistrari:
+        valori, erori = validare_inregistrare(item, salar_minim)
+        if erori:
+            rezultate.append((numar_rand, item, None, erori))
+        else:
+            numar_valide += 1
+            if cu_valide:
+                rezultate.append((numar_rand, None, valori, []))
+
+    # numarul de linii fizice din interval, pentru numerotarea intervalelor urmatoare
+    if reader is not None:
+        numar_linii = reader.line_num
+    else:
+        numar_linii = len(linii) - 1 if text.endswith('\n') else len(linii)
+    return numar_linii, numar_valide, rezultate
+
+
+def _intervale_fisier(fisier, inceput, marime_interval):
+    # intervalele se termina la sfarsitul unei linii, astfel incat fiecare proces primeste linii intregi
+    fisier.seek(0, os.SEEK_END)
+    sfarsit_fisier = fisier.tell()
+    while inceput < sfarsit_fisier:
+        fisier.seek(min(inceput + marime_interval, sfarsit_fisier))
+        fisier.readline()
+        sfarsit = fisier.tell()
+        yield inceput, sfarsit
+        inceput = sfarsit
+
+
+def validare_paralela_fisier(cale, format_fisier=None, procese=None, salar_minim=None, cu_valide=True,
+                             marime_interval=MARIME_INTERVAL):
+    '''Valideaza un fisier CSV sau JSON Lines pe intervale de octeti. Fiecare proces citeste si decodeaza
+    singur intervalul primit, astfel incat procesul principal nu mai decodeaza si nu mai trimite
+    inregistrarile. Fisierele mici, sau cele validate cu un singur proces ori pe un singur procesor,
+    sunt validate in procesul curent, pe aceleasi intervale. Fiecare inregistrare trebuie sa ocupe
+    o singura linie, ca in fisierele scrise de export_angajati.
+
+    Arguments:
+    cale: str -> calea fisierului
+    format_fisier: str -> 'csv' sau 'jsonl'; daca lipseste, este dedus din extensie
+    procese: int -> numarul de procese (optional)
+    salar_minim: float -> salarul minim pe economie folosit la validare (implicit cel din regula fiscala in vigoare)
+    cu_valide: bool -> daca sunt returnate si valorile randurilor valide; altfel sunt returnate numai erorile
+    marime_interval: int -> numarul aproximativ de octeti validati de un proces la un pas
+
+    Returns:
+    Generator -> pentru fiecare interval, in ordine, perechi (numar_valide, rezultate), unde rezultate
+                 este o lista de tupluri (numar_rand, inregistrare, valori, erori); la randurile valide
+                 inregistrarea este None
+    '''
+
+    format_fisier = _format_fisier(cale, format_fisier)
+    with open(cale, 'rb') as fisier:
+        antet = None
+        primul_rand = 1
+        if format_fisier == 'csv':
+            linie = fisier.readline()
+            if not linie.strip():
+                return
+            antet = next(csv.reader([linie.decode('utf-8-sig')]))
+            primul_rand = 2
+        intervale = list(_intervale_fisier(fisier, fisier.tell(), marime_interval))
+
+    procese = _numar_procese(procese)
+    if procese == 1 or os.path.getsize(cale) < PRAG_PARALEL:
+        rezultate = (_validare_interval(cale, format_fisier, antet, inceput, sfarsit, salar_minim, cu_valide)
+                     for inceput, sfarsit in intervale)
+        yield from _renumerotare(rezultate, primul_rand)
+        return
+
+    validare = partial(_validare_interval, cale, format_fisier, antet, salar_minim=salar_minim, cu_valide=cu_valide)
+    with ProcessPoolExecutor(max_workers=procese) as executor:
+        yield from _renumerotare(_rezultate_ordonate(executor, validare, intervale, procese), primul_rand)
+
+
+def _rezultate_ordonate(executor, validare, intervale, procese):
+    # in lucru sunt tinute cel mult doua intervale pentru fiecare proces
+    in_lucru = deque()
+    for inceput, sfarsit in intervale:
+        in_lucru.append(executor.submit(validare, inceput, sfarsit))
+        while len(in_lucru) > 2 * procese or (in_lucru and in_lucru[0].done()):
+            yield in_lucru.popleft().result()
+    while in_lucru:
+        yield in_lucru.popleft().result()
+
+
+def _renumerotare(rezultate_intervale, primul_rand):
+    # transforma numerele relative ale randurilor in numere de rand din fisier
+    for numar_randuri, numar_valide, rezultate in rezultate_intervale:
+        yield numar_valide, [(primul_rand + numar_rand, item, valori, erori) for numar_rand, item, valori, erori in rezultate]
+        primul_rand += numar_randuri
+
+
+def _scriere_respins(raport, numar_rand, item, erori):
+    valori = item if isinstance(item, dict) else {}
+    raport.writerow([numar_rand, '; '.join(erori)] + [valori.get(camp, '') for camp in CAMPURI_ANGAJAT])
+
+
+def _deschidere_raport(cale_respinse):
+    fisier = open(cale_respinse, 'w', encoding='utf-8', newline='')
+    raport = csv.writer(fisier)
+    raport.writerow(['Rand', 'Erori'] + CAMPURI_ANGAJAT)
+    return fisier, raport
+
+
+def _rezultate_validare(inregistrari, format_fisier, procese, salar_minim, cu_valide):
+    # un fisier este validat direct de procesele de lucru, pe intervale de octeti; celelalte surse
+    # sunt validate pe bucati de inregistrari
+    if isinstance(inregistrari, str):
+        return validare_paralela_fisier(inregistrari, format_fisier, procese, salar_minim, cu_valide)
+    rezultate = validare_paralela(inregistrari, procese, salar_minim=salar_minim)
+    return ((0, [rezultat]) if cu_valide or rezultat[3] else (1, []) for rezultat in rezultate)
+
+
+def import_angajati(companie, inregistrari, cale_respinse=None, marime_lot=MARIME_LOT, procese=None, format_fisier=None):
+    '''Valideaza inregistrarile si adauga angajatii valizi in firma, pe loturi. Inregistrarile
+    invalide sau cu un CNP deja existent sunt scrise in raportul de respingere.
+
+    Arguments:
+    companie: Companie -> firma in care sunt adaugati angajatii
+    inregistrari: Iterable | str -> perechi (numar_rand, inregistrare), ca cele din citire_inregistrari,
+                                    sau calea unui fisier CSV ori JSON Lines
+    cale_respinse: str -> calea raportului CSV cu randurile respinse (optional)
+    marime_lot: int -> numarul de randuri validate si adaugate la un pas
+    procese: int -> numarul de procese folosite la validare (optional)
+    format_fisier: str -> 'csv' sau 'jsonl', pentru un fisier; daca lipseste, este dedus din extensie
+
+    Returns:
+    Tuple -> (numar_importati, numar_respinsi)
+    '''
+
+    numar_importati = 0
+    numar_respinsi = 0
+    fisier_respinse, raport = _deschidere_raport(cale_respinse) if cale_respinse else (None, None)
+    try:
+        blocuri = _rezultate_validare(inregistrari, format_fisier, procese, None, True)
+        rezultate = (rezultat for _, rezultate_bloc in blocuri for rezultat in rezultate_bloc)
+        while True:
+            lot = list(islice(rezultate, marime_lot))
+            if not lot:
+                break
+
+            angajati = []
+            cnp_lot = set()
+            for numar_rand, item, valori, erori in lot:
+                if valori and (valori[2] in cnp_lot or companie.obtinere_angajat(valori[2]) is not None):
+                    erori = ['Exista deja un angajat cu acest CNP']
+                    if item is None:
+                        item = dict(zip(CAMPURI_ANGAJAT, valori))
+                if erori:
+                    numar_respinsi += 1
+                    if raport:
+                        _scriere_respins(raport, numar_rand, item, erori)
+                    continue
+                cnp_lot.add(valori[2])
+                angajati.append(Angajat.din_dictionar(dict(zip(CAMPURI_ANGAJAT, valori))))
+
+            companie.adaugare_angajati(angajati)
+            numar_importati += len(angajati)
+    finally:
+        if fisier_respinse:
+            fisier_respinse.close()
+
+    return numar_importati, numar_respinsi
+
+
+def validare_fisier(inregistrari, cale_respinse=None, procese=None, salar_minim=None, format_fisier=None):
+    '''Valideaza inregistrarile fara a le importa si scrie raportul randurilor invalide
+
+    Arguments:
+    inregistrari: Iterable | str -> perechi (numar_rand, inregistrare) sau calea unui fisier CSV ori JSON Lines
+    cale_respinse: str -> calea raportului CSV cu randurile invalide (optional)
+    procese: int -> numarul de procese folosite la validare (optional)
+    salar_minim: float -> salarul minim pe economie folosit la validare (implicit cel din regula fiscala in vigoare)
+    format_fisier: str -> 'csv' sau 'jsonl', pentru un fisier; daca lipseste, este dedus din extensie
+
+    Returns:
+    Tuple -> (numar_valide, numar_invalide)
+    '''
+
+    numar_valide = 0
+    numar_invalide = 0
+    fisier_respinse, raport = _deschidere_raport(cale_respinse) if cale_respinse else (None, None)
+    try:
+        # sunt returnate numai randurile invalide, iar cele valide sunt doar numarate
+        for numar_valide_bloc, rezultate in _rezultate_validare(inregistrari, format_fisier, procese, salar_minim, False):
+            numar_valide += numar_valide_bloc
+            for numar_rand, item, valori, erori in rezultate:
+                numar_invalide += 1
+                if raport:
+                    _scriere_respins(raport, numar_rand, item, erori)
+    finally:
+        if fisier_respinse:
+            fisier_respinse.close()
+
+    return numar_valide, numar_invalide
+
+
+def inregistrari_companie(companie):
+    '''Returneaza angajatii firmei sub forma de inregistrari, pentru revalidare
+
+    Arguments:
+    companie: Companie -> firma ai carei angajati sunt revalidati
+
+    Returns:
+    Generator -> perechi (numar_rand, inregistrare), numerotate de la 1
+    '''
+
+    for numar_rand, angajat in enumerate(companie.selectare_angajati(), start=1):
+        yield numar_rand, angajat.dictionar()
+
+
+def export_angajati(companie, cale, format_fisier=None):
+    '''Scrie angajatii firmei in format CSV sau JSON Lines, pe masura ce sunt parcursi
+
+    Arguments:
+    companie: Companie -> firma ai carei angajati sunt exportati
+    cale: str -> calea fisierului
+    format_fisier: str -> 'csv' sau 'jsonl'; daca lipseste, este dedus din extensie
+
+    Returns:
+    numar: int -> numarul de angajati exportati
+    '''
+
+    numar = 0
+    with open(cale, 'w', encoding='utf-8', newline='') as fisier:
+        if _format_fisier(cale, format_fisier) == 'jsonl':
+            for angajat in companie.selectare_angajati():
+                fisier.write(json.dumps(angajat.dictionar(), ensure_ascii=False) + '\n')
+                numar += 1
+        else:
+            writer = csv.DictWriter(fisier, fieldnames=CAMPURI_ANGAJAT)
+            writer.writeheader()
+            for angajat in companie.selectare_angajati():
+                writer.writerow(angajat.dictionar())
+                numar += 1
+
+    return numar
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import si export de angajati pe loturi')
+    parser.add_argument('operatie', choices=['import', 'export', 'validare', 'revalidare', 'import-json', 'export-json'])
+    parser.add_argument('fisier', nargs='?',
+                        help=f'fisierul CSV sau JSON Lines citit sau scris; pentru import-json si export-json, fisierul JSON (implicit {FISIER_DATE})')
+    parser.add_argument('--format', choices=['csv', 'jsonl'], help='formatul fisierului (implicit dedus din extensie)')
+    parser.add_argument('--respinse', help='raportul CSV cu randurile respinse sau invalide')
+    adaugare_argumente_stocare(parser)
+    parser.add_argument('--procese', type=int, default=None, help='numarul de procese folosite la validare (implicit numarul de procesoare)')
+    parser.add_argument('--salar-minim', type=float, default=None, help='salarul minim folosit la validare (implicit cel din regula fiscala in vigoare)')
+    parser.add_argument('--fragmentare', choices=CRITERII_FRAGMENTARE, default=None,
+                        help='imparte datele firmei in fragmente, in directorul dat prin --date')
+    argumente = parser.parse_args()
+    if argumente.operatie in ('import-json', 'export-json'):
+        argumente.fisier = argumente.fisier or FISIER_DATE
+    if argumente.operatie != 'revalidare' and not argumente.fisier:
+        parser.error(f'operatia {argumente.operatie} necesita un fisier')
+    # fragmentele sunt scrise intr-un director, deci --date este obligatoriu si nu poate fi un fisier existent
+    if argumente.fragmentare and not argumente.date:
+        parser.error('--fragmentare necesita directorul datelor, dat prin --date')
+    if argumente.fragmentare and os.path.exists(argumente.date) and not os.path.isdir(argumente.date):
+        parser.error(f'--date {argumente.date} este un fisier, nu un director de fragmente')
+
+    start = time.perf_counter()
+    if argumente.operatie == 'validare':
+        numar_valide, numar_invalide = validare_fisier(argumente.fisier, argumente.respinse, argumente.procese,
+                                                       argumente.salar_minim, argumente.format)
+        durata = time.perf_counter() - start
+        print(f'{numar_valide} randuri sunt valide, iar {numar_invalide} randuri sunt invalide ({durata:.2f} s).')
+        return
+
+    try:
+        cale_date = argumente.date if argumente.fragmentare else cale_date_argumente(argumente)
+    except ValueError as exception:
+        parser.error(str(exception))
+    if argumente.operatie in ('import-json', 'export-json') and os.path.abspath(argumente.fisier) == os.path.abspath(cale_date):
+        parser.error(f'{argumente.fisier} este chiar fisierul de date al stocarii alese')
+
+    companie = Companie(jurnal=True, cale_date=cale_date, fragmentare=argumente.fragmentare)
+    try:
+        companie.initializare()
+    except ValueError as exception:
+        sys.exit(str(exception))
+
+    if argumente.operatie == 'import':
+        numar_importati, numar_respinsi = import_angajati(companie, argumente.fisier, argumente.respinse,
+                                                          procese=argumente.procese, format_fisier=argumente.format)
+        companie.salvare_informatii()
+        durata = time.perf_counter() - start
+        print(f'Au fost importati {numar_importati} angajati, iar {numar_respinsi} randuri au fost respinse ({durata:.2f} s).')
+    elif argumente.operatie == 'revalidare':
+        numar_valide, numar_invalide = validare_fisier(inregistrari_companie(companie), argumente.respinse,
+                                                       argumente.procese, argumente.salar_minim)
+        durata = time.perf_counter() - start
+        print(f'{numar_valide} angajati respecta regulile curente, iar {numar_invalide} nu le respecta ({durata:.2f} s).')
+    elif argumente.operatie == 'import-json':
+        numar = companie.import_json(argumente.fisier)
+        companie.salvare_informatii()
+        durata = time.perf_counter() - start
+        print(f'Au fost importati {numar} angajati din fisierul {argumente.fisier} ({durata:.2f} s).')
+    elif argumente.operatie == 'export-json':
+        # stocarea este salvata si inchisa inainte de sincronizare, pentru ca data modificarii ei sa nu se mai schimbe
+        numar = companie.export_json(argumente.fisier)
+        companie.salvare_informatii()
+        sincronizare_json(cale_date, argumente.fisier)
+        durata = time.perf_counter() - start
+        print(f'Au fost exportati {numar} angajati in fisierul {argumente.fisier} ({durata:.2f} s).')
+    else:
+        numar = export_angajati(companie, argumente.fisier, argumente.format)
+        durata = time.perf_counter() - start
+        print(f'Au fost exportati {numar} angajati in fisierul {argumente.fisier} ({durata:.2f} s).')
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,9 @@ Aplicatia permite:
 - realizarea fuluturasului de salar pentru un angajat
 - afisarea tuturor angajatilor cu o anumita senioritate
 - afisarea tuturor angajatilor dintr-un departament
+- simularea unei modificari de salarii, fara modificarea datelor reale
+- cautarea angajatilor dupa inceputul CNP-ului, intervalul datelor de nastere sau judetul din CNP
+- cautarea angajatilor dupa nume si prenume, chiar scrise incomplet sau gresit
 
 Datele stocate referitor la un angajat sunt:
 - nume
@@ -23,10 +26,45 @@ Datele stocate referitor la un angajat sunt:
 '''
 
 
+import argparse
+import contextlib
 import json
+import math
+import os
+import sqlite3
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+
+from afisare import afisare_inregistrari
+from cautare import CRITERII_CAUTARE, LIMITA_REZULTATE, IndexCNP, IndexNume
+from metrici import adaugare_argumente, metrici, sesiune
+from reguli_fiscale import data_luna, regula_curenta, salar_minim_curent
+from salarizare import COLOANE_FLUTURAS, CacheFluturasi, calcul_fluturasi, salvare_fluturasi_csv
+from simulare import RegulaSalar, Scenariu, SimulareSalarii
+from stocare import (DepozitFragmentat, DepozitSQLite, IndexJSON, InstantaneuBinar, Jurnal, citire_json_incrementala, salvare_json_atomica,
+                     scriere_instantaneu_binar)
+
+
+FISIER_DATE = 'date_angajati.json'
+FISIER_BINAR = 'date_angajati.bin'
+FISIER_SQLITE = 'date_angajati.db'
+DIRECTOR_FRAGMENTE = 'date_angajati_fragmente'
+EXTENSII_SQLITE = ('.db', '.sqlite')
+# fisierul de date implicit al fiecarei stocari, aleasa cu --stocare; fisierul JSON este citit si de angajat.py
+STOCARI = {'json': FISIER_DATE, 'binar': FISIER_BINAR, 'sqlite': FISIER_SQLITE, 'fragmente': DIRECTOR_FRAGMENTE}
+# fisierele in care stocarile scriu modificarile inainte de fisierul de date (jurnalul, respectiv jurnalul WAL al SQLite)
+SUFIXE_MODIFICARI = ('.jurnal', '-wal')
+CAMPURI_ANGAJAT = ['Nume', 'Prenume', 'CNP', 'Varsta', 'Salar', 'Departament', 'Senioritate']
+# numarul de galeti in care sunt impartiti angajatii pentru vederile modului concurent (vezi IndexVedere)
+NUMAR_GALETI = 256
 
 
 class Angajat:
+    # fara __dict__ pe fiecare instanta, un angajat ocupa mult mai putina memorie
+    __slots__ = ('nume', 'prenume', 'cnp', 'varsta', 'salar', 'departament', 'senioritate')
+
     def __init__(self, nume, prenume, cnp, varsta, salar, departament, senioritate):
         self.nume = nume
         self.prenume = prenume
@@ -36,52 +74,1134 @@ class Angajat:
         self.departament = departament
         self.senioritate = senioritate
 
+    @classmethod
+    def din_dictionar(cls, item):
+        return cls(item.get('Nume'), item.get('Prenume'), item.get('CNP'), _internare(item.get('Varsta')), item.get('Salar'), _internare(item.get('Departament')), _internare(item.get('Senioritate')))
+
+    def dictionar(self):
+        return {
+            'Nume': self.nume,
+            'Prenume': self.prenume,
+            'CNP': self.cnp,
+            'Varsta': self.varsta,
+            'Salar': self.salar,
+            'Departament': self.departament,
+            'Senioritate': self.senioritate
+        }
+
     def afisare(self):
         delimitator = 10 * '-'
         afisaj = f'\n{delimitator}\nNume: {self.nume}\nPrenume: {self.prenume}\nCNP: {self.cnp}\nVarsta: {self.varsta}\nSalar: {self.salar}\nDepartament: {self.departament}\nSenioritate: {self.senioritate}'
         print(afisaj)
 
 
-class Companie:
+class IndexSecundar:
+    def __init__(self, atribut):
+        # fiecare valoare a atributului are propriul grup de angajati, indexat dupa CNP
+        self.atribut = atribut
+        self.grupuri = {}
+
+    def adauga(self, angajat):
+        self.grupuri.setdefault(getattr(angajat, self.atribut), {})[angajat.cnp] = angajat
+
+    def elimina(self, angajat):
+        valoare = getattr(angajat, self.atribut)
+        grup = self.grupuri.get(valoare)
+        if grup is not None:
+            grup.pop(angajat.cnp, None)
+            if not grup:
+                del self.grupuri[valoare]
+
+    def inlocuieste(self, vechi, nou):
+        # daca valoarea atributului nu se schimba, angajatul isi pastreaza pozitia in grup
+        if getattr(vechi, self.atribut) == getattr(nou, self.atribut):
+            self.grupuri[getattr(nou, self.atribut)][nou.cnp] = nou
+        else:
+            self.elimina(vechi)
+            self.adauga(nou)
+
+    def grup(self, valoare):
+        return self.grupuri.get(valoare, {})
+
+    def copie(self):
+        copie = IndexSecundar(self.atribut)
+        copie.grupuri = {valoare: dict(grup) for valoare, grup in self.grupuri.items()}
+        return copie
+
+
+class AgregateSalarii:
     def __init__(self):
-        self.angajati = []
+        # totalurile sunt actualizate la fiecare adaugare, modificare si stergere
+        self.total = 0
+        self.numar = 0
+        self.total_departament = {}
+        self.numar_departament = {}
+        self.total_senioritate = {}
+        self.numar_senioritate = {}
+        # frecventa fiecarui salar permite recalcularea extremelor dupa o stergere
+        self._frecvente_salarii = {}
+        self._minim = None
+        self._maxim = None
+
+    def adauga(self, angajat):
+        salar = angajat.salar
+        self.total += salar
+        self.numar += 1
+        self._actualizare_grup(self.total_departament, self.numar_departament, angajat.departament, salar, 1)
+        self._actualizare_grup(self.total_senioritate, self.numar_senioritate, angajat.senioritate, salar, 1)
+        self._frecvente_salarii[salar] = self._frecvente_salarii.get(salar, 0) + 1
+        if self._minim is not None and salar < self._minim:
+            self._minim = salar
+        if self._maxim is not None and salar > self._maxim:
+            self._maxim = salar
+
+    def elimina(self, angajat):
+        salar = angajat.salar
+        self.numar -= 1
+        # la golire totalul este resetat, pentru a nu acumula erori de rotunjire
+        self.total = self.total - salar if self.numar else 0
+        self._actualizare_grup(self.total_departament, self.numar_departament, angajat.departament, salar, -1)
+        self._actualizare_grup(self.total_senioritate, self.numar_senioritate, angajat.senioritate, salar, -1)
+        frecventa = self._frecvente_salarii[salar] - 1
+        if frecventa:
+            self._frecvente_salarii[salar] = frecventa
+        else:
+            del self._frecvente_salarii[salar]
+            if salar == self._minim:
+                self._minim = None
+            if salar == self._maxim:
+                self._maxim = None
+
+    def inlocuieste(self, vechi, nou):
+        self.elimina(vechi)
+        self.adauga(nou)
+
+    @property
+    def minim(self):
+        if self._minim is None and self._frecvente_salarii:
+            self._minim = min(self._frecvente_salarii)
+        return self._minim
+
+    @property
+    def maxim(self):
+        if self._maxim is None and self._frecvente_salarii:
+            self._maxim = max(self._frecvente_salarii)
+        return self._maxim
+
+    @property
+    def medie(self):
+        return self.total / self.numar if self.numar else None
+
+    def _actualizare_grup(self, totaluri, numere, cheie, salar, semn):
+        numar = numere.get(cheie, 0) + semn
+        if numar:
+            numere[cheie] = numar
+            totaluri[cheie] = totaluri.get(cheie, 0) + semn * salar
+        else:
+            numere.pop(cheie, None)
+            totaluri.pop(cheie, None)
+
+
+class GaleataVedere:
+    def __init__(self):
+        # o parte a angajatilor, dupa CNP, cu propriile indexuri de departament si senioritate
+        self.angajati = {}
+        self.index_departament = IndexSecundar('departament')
+        self.index_senioritate = IndexSecundar('senioritate')
+
+    def adauga(self, angajat):
+        self.angajati[angajat.cnp] = angajat
+        self.index_departament.adauga(angajat)
+        self.index_senioritate.adauga(angajat)
+
+    def elimina(self, angajat):
+        del self.angajati[angajat.cnp]
+        self.index_departament.elimina(angajat)
+        self.index_senioritate.elimina(angajat)
+
+    def inlocuieste(self, vechi, nou):
+        self.angajati[nou.cnp] = nou
+        self.index_departament.inlocuieste(vechi, nou)
+        self.index_senioritate.inlocuieste(vechi, nou)
+
+    def copie(self):
+        copie = GaleataVedere()
+        copie.angajati = dict(self.angajati)
+        copie.index_departament = self.index_departament.copie()
+        copie.index_senioritate = self.index_senioritate.copie()
+        return copie
+
+    def selectare(self, departament=None, senioritate=None):
+        if departament and senioritate:
+            grup_mic, grup_mare = sorted((self.index_departament.grup(departament), self.index_senioritate.grup(senioritate)), key=len)
+            return [angajat for cnp, angajat in grup_mic.items() if cnp in grup_mare]
+        if departament:
+            return self.index_departament.grup(departament).values()
+        if senioritate:
+            return self.index_senioritate.grup(senioritate).values()
+        return self.angajati.values()
+
+
+def _galeata(cnp):
+    return hash(cnp) % NUMAR_GALETI
+
+
+class IndexVedere:
+    def __init__(self, angajati=()):
+        # angajatii sunt impartiti dupa CNP in NUMAR_GALETI galeti; o vedere publicata pastreaza
+        # galetile existente, care nu mai sunt modificate pe loc: prima modificare de dupa publicare
+        # copiaza numai galeata atinsa, deci o scriere costa marimea unei galeti, nu a firmei
+        self.galeti = [GaleataVedere() for _ in range(NUMAR_GALETI)]
+        # galetile create sau copiate dupa ultima publicare, care pot fi modificate pe loc
+        self._proprii = set(range(NUMAR_GALETI))
+        for angajat in angajati:
+            self.adauga(angajat)
+
+    def adauga(self, angajat):
+        self._galeata_proprie(angajat.cnp).adauga(angajat)
+
+    def elimina(self, angajat):
+        self._galeata_proprie(angajat.cnp).elimina(angajat)
+
+    def inlocuieste(self, vechi, nou):
+        self._galeata_proprie(nou.cnp).inlocuieste(vechi, nou)
+
+    def publicare(self):
+        # dupa publicare toate galetile sunt partajate cu vederea
+        self._proprii.clear()
+        return tuple(self.galeti)
+
+    def _galeata_proprie(self, cnp):
+        pozitie = _galeata(cnp)
+        if pozitie not in self._proprii:
+            self.galeti[pozitie] = self.galeti[pozitie].copie()
+            self._proprii.add(pozitie)
+        return self.galeti[pozitie]
+
+
+class VedereCompanie:
+    def __init__(self, galeti, statistici):
+        # copie a firmei la un moment dat, formata din galetile publicate de IndexVedere; acestea nu mai
+        # sunt modificate, iar filtrele sunt rezolvate prin indexurile fiecarei galeti, fara a parcurge firma.
+        # angajatii sunt returnati in ordinea galetilor, nu in ordinea adaugarii
+        self.galeti = galeti
+        self.statistici = statistici
+
+    def __len__(self):
+        return sum(len(galeata.angajati) for galeata in self.galeti)
+
+    def obtinere_angajat(self, cnp):
+        return self.galeti[_galeata(cnp)].angajati.get(cnp)
+
+    def selectare_angajati(self, departament=None, senioritate=None):
+        return [angajat for galeata in self.galeti for angajat in galeata.selectare(departament, senioritate)]
+
+    def cost_salarii(self, departament=None):
+        if departament:
+            return self.statistici['total_departament'].get(departament, 0)
+        return self.statistici['total']
+
+
+def adaugare_argumente_stocare(parser):
+    # optiunile comune programelor care deschid datele firmei
+    parser.add_argument('--stocare', choices=list(STOCARI), default='json',
+                        help=f'stocarea datelor firmei (implicit json, fisierul {FISIER_DATE} folosit si de angajat.py)')
+    parser.add_argument('--date', default=None, help='fisierul de date al firmei (implicit cel al stocarii alese)')
+
+
+def cale_date_implicita(stocare='json'):
+    # stocarea este aleasa explicit, nu dedusa din fisierele existente; daca datele altei stocari
+    # si fisierul JSON nu mai sunt la fel, este afisat un avertisment
+    cale = STOCARI[stocare]
+    if stocare == 'fragmente' and not os.path.isdir(cale):
+        raise ValueError(f'Directorul de fragmente {cale} nu exista! Acesta este creat de import_export.py, cu --fragmentare.')
+    for cale_stocare in ([cale] if stocare != 'json' else [STOCARI[nume] for nume in STOCARI if nume != 'json']):
+        avertisment = divergenta_json(cale_stocare)
+        if avertisment:
+            print(avertisment)
+    return cale
+
+
+def cale_date_argumente(argumente):
+    # --date are prioritate fata de fisierul implicit al stocarii alese cu --stocare
+    return argumente.date or cale_date_implicita(argumente.stocare)
+
+
+def divergenta_json(cale, cale_json=FISIER_DATE):
+    # fisierul JSON si stocarea sunt considerate la fel cand au aceeasi data a ultimei modificari,
+    # pe care exportul in JSON o egaleaza (vezi sincronizare_json); altfel mesajul spune care dintre
+    # ele are modificari pe care cealalta nu le are
+    if os.path.abspath(cale) == os.path.abspath(cale_json) or not (os.path.exists(cale) and os.path.exists(cale_json)):
+        return None
+    modificare_stocare = _data_modificare(cale)
+    modificare_json = os.stat(cale_json).st_mtime_ns
+    if modificare_json > modificare_stocare:
+        return (f'Atentie! {cale_json} a fost modificat dupa {cale}: modificarile facute in fisierul JSON (de exemplu cu angajat.py) '
+                f'nu apar in {cale}. Angajatii noi pot fi adaugati cu: python import_export.py import-json {cale_json} --date {cale}')
+    if modificare_stocare > modificare_json:
+        return (f'Atentie! {cale} contine modificari care nu apar in {cale_json}, citit de angajat.py. '
+                f'Fisierul JSON poate fi refacut cu: python import_export.py export-json {cale_json} --date {cale}')
+    return None
+
+
+def sincronizare_json(cale, cale_json=FISIER_DATE):
+    # dupa exportul complet al stocarii in fisierul JSON, cele doua primesc aceeasi data a modificarii
+    stare = os.stat(cale_json)
+    os.utime(cale_json, ns=(stare.st_atime_ns, _data_modificare(cale)))
+
+
+def _data_modificare(cale):
+    # ultima modificare a datelor unei stocari: fisierul sau directorul de date si fisierele in care
+    # modificarile sunt scrise inaintea lui
+    cai = [cale] + [cale + sufix for sufix in SUFIXE_MODIFICARI]
+    return max(os.stat(cale).st_mtime_ns for cale in cai if os.path.exists(cale))
+
+
+def _internare(valoare):
+    # valorile care se repeta (departament, senioritate, varsta) sunt pastrate o singura data in memorie
+    return sys.intern(valoare) if isinstance(valoare, str) else valoare
+
+
+class Companie:
+    def __init__(self, jurnal=False, cale_date=FISIER_DATE, prag_compactare=10000, concurent=False,
+                 lenes=False, marime_cache=10000, fragmentare=None, numar_fragmente=16, procese=None):
+        self.cale_date = cale_date
+        # in modul lenes fisierul JSON este numai indexat la deschidere, ca instantaneul binar;
+        # angajatii cititi din fisier sau din instantaneu sunt pastrati intr-un cache LRU limitat
+        self._lenes = lenes
+        self.marime_cache = marime_cache
+        # fluturasii calculati pe angajat sunt refolositi pana la modificarea salarului sau a cotelor
+        self.cache_fluturasi = CacheFluturasi()
+        # in depozitul SQLite angajatii raman pe disc, iar fiecare operatie este delegata depozitului;
+        # SQLite are propriul jurnal, deci jurnalul modificarilor nu mai este necesar
+        self._depozit = None
+        # cu fragmentare ('departament' sau 'hash') sau daca cale_date este un director, angajatii sunt
+        # pastrati in fragmente separate, citite in paralel de cel mult procese procese; in modul lenes
+        # fragmentele sunt citite numai cand sunt folosite
+        self._fragmentare = fragmentare
+        self.numar_fragmente = numar_fragmente
+        self.procese = procese
+        self._fragmente = None
+        if self._format_sqlite():
+            if concurent:
+                raise ValueError('Modul concurent nu este disponibil pentru depozitul SQLite!')
+            jurnal = False
+        # modificarile sunt adaugate in jurnal, iar jurnalul este compactat in fisierul de date
+        # dupa cel putin prag_compactare inregistrari, pe un fir de executie separat, si la iesire;
+        # un jurnal ramas dupa o oprire neasteptata este aplicat la urmatoarea deschidere
+        self._jurnal = Jurnal(cale_date + '.jurnal') if jurnal else None
+        self.prag_compactare = prag_compactare
+        self._fir_compactare = None
+        # eroarea scrierii din fundal este retinuta de fir si tratata dupa ce firul este asteptat,
+        # impreuna cu angajatii si fragmentele pe care scrierea trebuia sa le salveze
+        self._eroare_compactare = None
+        self._compactare_in_curs = None
+        # in modul concurent modificarile sunt serializate de o blocare, iar cititorii nu o iau:
+        # listele sunt citite dintr-o vedere copiata la prima citire de dupa o modificare,
+        # iar statisticile sunt publicate ca un singur dictionar dupa fiecare modificare
+        self._blocare = threading.RLock() if concurent else None
+        self._vedere = None
+        self._statistici_publicate = None
+        self._resetare_date()
+
+    def _resetare_date(self):
+        # angajatii sunt indexati dupa CNP (dictionarul pastreaza ordinea de inserare)
+        self.angajati = {}
+        # instantaneul binar sau indexul JSON deschis si inca neincarcat in memorie (vezi _asigurare_incarcare)
+        self._instantaneu = None
+        self._cache = OrderedDict()
+        self._index_departament = IndexSecundar('departament')
+        self._index_senioritate = IndexSecundar('senioritate')
+        self._agregate = AgregateSalarii()
+        self._indexuri = [self._index_departament, self._index_senioritate, self._agregate]
+        # in modul concurent vederile cititorilor sunt publicate din galetile acestui index
+        self._index_vedere = None
+        if self._blocare is not None:
+            self._index_vedere = IndexVedere()
+            self._indexuri.append(self._index_vedere)
+        # indexurile de cautare (dupa CNP, data nasterii si judet, respectiv dupa nume), dupa clasa;
+        # fiecare este construit la prima cautare care il foloseste (vezi _index_cautare)
+        self._indexuri_cautare = {}
+        self._vedere = None
+        if self._blocare is not None:
+            self._statistici_publicate = self._statistici_curente()
+        # CNP-urile adaugate, modificate sau sterse de la ultima salvare a fisierului de date
+        self._modificate = set()
+        # fragmentele care nu au fost inca citite si cele care contin angajati nesalvati
+        self._fragmente_neincarcate = set()
+        self._fragmente_modificate = set()
+        # inregistrarile din jurnal inca neaplicate peste instantaneu sau peste fragmentele necitite,
+        # ultima pentru fiecare CNP, si CNP-urile din jurnal ale caror randuri din fragmente sunt invechite
+        self._suprapunere = {}
+        self._cnp_jurnal = set()
+
+
+    @contextlib.contextmanager
+    def _exclusiv(self, modificare=True):
+        with self._blocare or contextlib.nullcontext():
+            try:
+                yield
+            finally:
+                if modificare:
+                    self._vedere = None
+                    if self._blocare is not None:
+                        self._statistici_publicate = self._statistici_curente()
+
+    def _format_binar(self):
+        return self.cale_date.endswith('.bin')
+
+
+    def _format_fragmentat(self):
+        return self._fragmentare is not None or os.path.isdir(self.cale_date)
+
+
+    def _format_sqlite(self):
+        return self.cale_date.endswith(EXTENSII_SQLITE)
+
 
     def initializare(self):
+        if self._format_sqlite():
+            self._deschidere_depozit()
+            return
+
+        # un jurnal ramas de la o sesiune intrerupta este aplicat si de o firma deschisa fara jurnal,
+        # altfel datele citite ar fi cele dinaintea modificarilor
+        if self._jurnal is None and Jurnal(self.cale_date + '.jurnal').exista():
+            self._jurnal = Jurnal(self.cale_date + '.jurnal')
+
+        with self._exclusiv():
+            if self._format_fragmentat():
+                incarcat = self._deschidere_fragmente()
+            elif self._format_binar():
+                incarcat = self._deschidere_instantaneu()
+            elif self._lenes:
+                incarcat = self._indexare_json()
+            else:
+                incarcat = self._incarcare_json()
+
+            # jurnalul este aplicat numai peste un fisier de date citit corect
+            if incarcat and self._jurnal is not None:
+                self._reluare_jurnal()
+
+            # in modul concurent instantaneul binar este incarcat imediat, pentru ca
+            # cititorii sa nu il foloseasca in timp ce este inchis de un scriitor
+            if self._blocare is not None:
+                self._asigurare_incarcare()
+
+
+    def _deschidere_instantaneu(self):
+        # se citesc numai antetul si metadatele; angajatii sunt incarcati la prima operatie
+        # care are nevoie de toti angajatii, iar pana atunci cautarile dupa CNP si costurile
+        # salariale sunt servite direct din instantaneu
+        try:
+            self._instantaneu = InstantaneuBinar(self.cale_date)
+        except FileNotFoundError:
+            print('Fisierul binar care contine informatiile despre angajati nu a fost gasit! Initializare angajati nereusita.')
+            return True
+        except (ValueError, OSError) as exception:
+            print('Eroare la citirea fisierului binar! Initializare angajati nereusita.')
+            print(f'Eroare: {exception}')
+            return False
+        return True
+
+
+    def _deschidere_depozit(self):
+        # baza de date este creata daca nu exista; nu este citit niciun angajat
+        try:
+            self._depozit = DepozitSQLite(self.cale_date)
+        except sqlite3.Error as exception:
+            print('Eroare la deschiderea bazei de date SQLite! Initializare angajati nereusita.')
+            print(f'Eroare: {exception}')
+
+
+    def _deschidere_fragmente(self):
+        # se citeste numai descrierea fragmentelor; fara modul lenes, toate fragmentele sunt citite in paralel;
+        # daca directorul nu poate fi deschis initializarea este oprita, pentru ca o salvare ulterioara
+        # sa nu scrie datele firmei in alta parte
+        try:
+            self._fragmente = DepozitFragmentat(self.cale_date, self._fragmentare, self.numar_fragmente)
+        except (OSError, ValueError, KeyError) as exception:
+            raise ValueError(f'Datele fragmentate din {self.cale_date} nu au putut fi deschise! Eroare: {exception}')
+        self._fragmente_neincarcate = set(self._fragmente.chei())
+        if not self._lenes:
+            self._incarcare_fragmente()
+        return True
+
+
+    def _incarcare_fragmente(self, departament=None, cnp_uri=None, chei=None):
+        # citeste fragmentele necesare unei operatii: fragmentele cerute explicit, fragmentul departamentului
+        # sau fragmentele CNP-urilor, daca acestea pot fi stabilite din criteriul de fragmentare,
+        # altfel toate fragmentele neincarcate
+        if not self._fragmente_neincarcate:
+            return
+        if chei is not None:
+            chei = self._fragmente_neincarcate & set(chei)
+        elif departament and self._fragmente.criteriu == 'departament':
+            chei = self._fragmente_neincarcate & {departament}
+        elif cnp_uri is not None and self._fragmente.criteriu == 'hash':
+            chei = self._fragmente_neincarcate & {self._fragmente.cheie_cnp(cnp) for cnp in cnp_uri}
+        else:
+            chei = set(self._fragmente_neincarcate)
+        if not chei:
+            return
+
         try:
-            with open('date_angajati.json', 'r') as json_file:
-                json_data = json.load(json_file)
-            for item in json_data:
-                    angajat = Angajat(item.get('Nume'), item.get('Prenume'), item.get('CNP'), item.get('Varsta'), item.get('Salar'), item.get('Departament'), item.get('Senioritate'))
-                    self.angajati.append(angajat)
+            for cheie, lista_valori in self._fragmente.citire(sorted(chei), self.procese):
+                for nume, prenume, cnp_angajat, varsta, salar, departament_angajat, senioritate in lista_valori:
+                    if cnp_angajat in self._cnp_jurnal:
+                        # randul este inlocuit de jurnal, deci fragmentul trebuie rescris
+                        self._modificate.add(cnp_angajat)
+                        self._fragmente_modificate.add(cheie)
+                        continue
+                    if cnp_angajat in self.angajati:
+                        print(f'Exista deja un angajat cu CNP-ul: {cnp_angajat}! Inregistrarea duplicat a fost ignorata.')
+                        continue
+                    self._adaugare(Angajat(nume, prenume, cnp_angajat, _internare(varsta), salar,
+                                           _internare(departament_angajat), _internare(senioritate)))
+                self._fragmente_neincarcate.discard(cheie)
+                if metrici.activ:
+                    metrici.inregistrare(len(lista_valori), octeti_cititi=os.path.getsize(self._fragmente.cale(cheie)))
+        except (OSError, ValueError) as exception:
+            # fragmentele care nu au putut fi citite raman neincarcate
+            print(f'Eroare la citirea unui fragment de date! Eroare: {exception}')
+        self._aplicare_suprapunere()
+
+
+    def _indexare_json(self):
+        # se retin numai pozitiile angajatilor in fisier si agregatele salariilor
+        try:
+            self._instantaneu = IndexJSON(self.cale_date)
+        except FileNotFoundError:
+            print('Fisierul JSON care contine informatiile despre angajati nu a fost gasit! Initializare angajati nereusita.')
+            return True
+        except json.JSONDecodeError:
+            print('Eroare la decodarea fisierului JSON! Initializare angajati nereusita.')
+            return False
+        except Exception as exception:
+            print('A intervenit o eroare neasteptata! Initializare angajati nereusita.')
+            print(f'Eroare: {exception}')
+            return False
+
+        for cnp in self._instantaneu.duplicate:
+            print(f'Exista deja un angajat cu CNP-ul: {cnp}! Inregistrarea duplicat a fost ignorata.')
+        if metrici.activ:
+            metrici.inregistrare(len(self._instantaneu), octeti_cititi=os.path.getsize(self.cale_date))
+        return True
+
+
+    def _asigurare_incarcare(self, departament=None, cnp_uri=None):
+        # operatiile pe un singur departament au nevoie numai de fragmentul departamentului, iar
+        # modificarile unor CNP-uri, la fragmentarea dupa hash, numai de fragmentele acestora
+        if self._fragmente_neincarcate:
+            self._incarcare_fragmente(departament, cnp_uri)
+        if self._instantaneu is None:
+            return
+        instantaneu, self._instantaneu = self._instantaneu, None
+        self._cache.clear()
+        for rand in range(len(instantaneu)):
+            nume, prenume, cnp, varsta, salar, departament, senioritate = instantaneu.valori(rand)
+            self._adaugare(Angajat(nume, prenume, cnp, _internare(varsta), salar, _internare(departament), _internare(senioritate)))
+        instantaneu.inchidere()
+        self._aplicare_suprapunere()
+        if metrici.activ:
+            metrici.inregistrare(len(self.angajati))
+
+
+    def _incarcare_json(self, cale=None):
+        incarcat = False
+        try:
+            # angajatii sunt construiti pe masura ce fisierul este parcurs,
+            # fara a pastra in memorie intreg continutul JSON
+            for item in citire_json_incrementala(cale or self.cale_date):
+                angajat = Angajat.din_dictionar(item)
+                if angajat.cnp in self.angajati:
+                    print(f'Exista deja un angajat cu CNP-ul: {angajat.cnp}! Inregistrarea duplicat a fost ignorata.')
+                else:
+                    self._adaugare(angajat)
+            incarcat = True
+            if metrici.activ:
+                metrici.inregistrare(len(self.angajati), octeti_cititi=os.path.getsize(cale or self.cale_date))
 
         except FileNotFoundError:
+            incarcat = True
             print('Fisierul JSON care contine informatiile despre angajati nu a fost gasit! Initializare angajati nereusita.')
         except json.JSONDecodeError:
+            self._resetare_date()
             print('Eroare la decodarea fisierului JSON! Initializare angajati nereusita.')
         except Exception as exception:
+            self._resetare_date()
             print('A intervenit o eroare neasteptata! Initializare angajati nereusita.')
             print(f'Eroare: {exception}')
 
+        return incarcat
+
+
+    def import_json(self, cale):
+        # angajatii din fisier sunt adaugati la cei existenti (si scrisi in jurnal);
+        # returneaza numarul angajatilor adaugati
+        numar = 0
+        with self._exclusiv():
+            self._asigurare_incarcare()
+            for item in citire_json_incrementala(cale):
+                angajat = Angajat.din_dictionar(item)
+                if self.obtinere_angajat(angajat.cnp) is not None:
+                    print(f'Exista deja un angajat cu CNP-ul: {angajat.cnp}! Inregistrarea duplicat a fost ignorata.')
+                else:
+                    self.adaugare_angajat(angajat)
+                    numar += 1
+        return numar
+
+
+    def export_json(self, cale):
+        # toti angajatii sunt scrisi in fisierul JSON, in formatul citit si de angajat.py;
+        # returneaza numarul angajatilor exportati
+        numar = 0
+
+        def inregistrari():
+            nonlocal numar
+            for angajat in self.selectare_angajati():
+                numar += 1
+                yield angajat.dictionar()
+
+        salvare_json_atomica(cale, inregistrari())
+        return numar
+
+
+    def _reluare_jurnal(self):
+        if not self._jurnal.exista():
+            return
+        # peste instantaneu sau peste fragmentele necitite, jurnalul este pastrat ca suprapunere si
+        # aplicat la incarcarea datelor, astfel incat deschiderea ramane fara citirea tuturor angajatilor
+        amanare = self._instantaneu is not None or bool(self._fragmente_neincarcate)
+        numar_inregistrari = 0
+        try:
+            for operatie, date in self._jurnal.citire():
+                if amanare:
+                    cnp = date if operatie == 'S' else date[2]
+                    self._suprapunere[cnp] = (operatie, date)
+                    self._modificate.add(cnp)
+                else:
+                    self._aplicare_inregistrare_jurnal(operatie, date)
+                numar_inregistrari += 1
+        except (json.JSONDecodeError, ValueError, TypeError) as exception:
+            print(f'Jurnalul modificarilor este corupt si a fost aplicat partial! Eroare: {exception}')
+            return
+        if amanare:
+            self._cnp_jurnal = set(self._suprapunere)
+            if self._instantaneu is not None:
+                self._ajustare_agregate_instantaneu()
+            else:
+                self._aplicare_suprapunere()
+
+        # jurnalul ramas de la o compactare neterminata este compactat imediat
+        if self._jurnal.exista_vechi():
+            print(f'Au fost recuperate {numar_inregistrari} modificari din jurnal.')
+            self.compactare()
+        elif self._jurnal_plin():
+            self.compactare()
+
+
+    def _aplicare_inregistrare_jurnal(self, operatie, date):
+        # reluarea este idempotenta: adaugarea unui CNP existent il inlocuieste, iar
+        # stergerea unui CNP inexistent este ignorata
+        if operatie == 'S':
+            if date in self.angajati:
+                self._marcare_nesalvat(self._stergere(date))
+            return
+
+        angajat = self._angajat_jurnal(date)
+        if angajat.cnp in self.angajati:
+            self._marcare_nesalvat(self.angajati[angajat.cnp])
+            self._modificare(angajat)
+        else:
+            self._adaugare(angajat)
+        self._marcare_nesalvat(angajat)
+
+
+    def _angajat_jurnal(self, date):
+        return Angajat(date[0], date[1], date[2], _internare(date[3]), date[4], _internare(date[5]), _internare(date[6]))
+
+
+    def _aplicare_suprapunere(self):
+        # aplica inregistrarile amanate ale caror date pot fi deja in memorie: toate, dupa incarcarea
+        # instantaneului, sau cele din fragmentele citite (ori inexistente) ale datelor fragmentate
+        if not self._suprapunere or self._instantaneu is not None:
+            return
+        for cnp, (operatie, date) in list(self._suprapunere.items()):
+            if operatie != 'S' and self._fragmente is not None and \
+                    self._fragmente.cheie(date[5], cnp) in self._fragmente_neincarcate:
+                continue
+            self._aplicare_inregistrare_jurnal(operatie, date)
+            del self._suprapunere[cnp]
+        if not self._fragmente_neincarcate:
+            self._suprapunere.clear()
+            self._cnp_jurnal.clear()
+
+
+    def _ajustare_agregate_instantaneu(self):
+        # agregatele instantaneului sunt actualizate cu inregistrarile amanate; daca a fost eliminat
+        # salarul minim sau maxim, acesta nu poate fi recalculat fara toti angajatii, care sunt incarcati
+        agregate = dict(self._instantaneu.agregate)
+        for camp in ('total_departament', 'total_senioritate'):
+            agregate[camp] = dict(agregate[camp])
+        for cnp, (operatie, date) in self._suprapunere.items():
+            rand = self._instantaneu.cautare(cnp)
+            if rand is not None:
+                _, _, _, _, salar, departament, senioritate = self._instantaneu.valori(rand)
+                if salar in (agregate['minim'], agregate['maxim']):
+                    self._asigurare_incarcare()
+                    return
+                agregate['numar'] -= 1
+                agregate['total'] -= salar
+                agregate['total_departament'][departament] -= salar
+                agregate['total_senioritate'][senioritate] -= salar
+            if operatie != 'S':
+                salar, departament, senioritate = date[4], date[5], date[6]
+                agregate['numar'] += 1
+                agregate['total'] += salar
+                agregate['total_departament'][departament] = agregate['total_departament'].get(departament, 0) + salar
+                agregate['total_senioritate'][senioritate] = agregate['total_senioritate'].get(senioritate, 0) + salar
+                agregate['minim'] = salar if agregate['minim'] is None else min(agregate['minim'], salar)
+                agregate['maxim'] = salar if agregate['maxim'] is None else max(agregate['maxim'], salar)
+        if not agregate['numar']:
+            agregate['minim'] = agregate['maxim'] = None
+        agregate['medie'] = agregate['total'] / agregate['numar'] if agregate['numar'] else None
+        self._instantaneu.agregate = agregate
+
+
+    def _marcare_nesalvat(self, angajat):
+        # la o modificare sunt marcate atat datele vechi, cat si cele noi, pentru ca schimbarea
+        # departamentului muta angajatul dintr-un fragment in altul
+        self._modificate.add(angajat.cnp)
+        if self._fragmente is not None:
+            self._fragmente_modificate.add(self._fragmente.cheie(angajat.departament, angajat.cnp))
+
+
+    def _jurnalizare(self, operatie, *lista_date):
+        if self._jurnal is None:
+            return
+        self._jurnal.adaugare_lot(operatie, lista_date)
+        if self._jurnal_plin():
+            self.compactare(fundal=True)
+
+
+    def _jurnal_plin(self):
+        # pragul creste odata cu numarul de angajati, astfel incat costul compactarii
+        # sa fie impartit la un numar de modificari cel putin egal cu dimensiunea datelor
+        return self._jurnal.numar_inregistrari >= max(self.prag_compactare, len(self.angajati))
+
+
+    def marcare_modificati(self, cnp_uri=None):
+        # marcheaza angajatii primiti (implicit toti) ca nesalvati, astfel incat urmatoarea
+        # compactare sa ii rescrie chiar daca nu au fost modificati (de exemplu, dupa schimbarea formatului)
+        if self._depozit is not None:
+            return
+        with self._exclusiv(modificare=False):
+            self._asigurare_incarcare()
+            for cnp in self.angajati if cnp_uri is None else cnp_uri:
+                self._marcare_nesalvat(self.angajati[cnp])
+
+
+    def compactare(self, fundal=False):
+        # datele sunt copiate sincron, iar scrierea fisierului poate avea loc in fundal;
+        # jurnalul vechi este sters numai dupa ce fisierul de date a fost inlocuit
+        # (angajatii nu sunt modificati pe loc, ci inlocuiti, deci copia listei este suficienta);
+        # returneaza False daca nu exista modificari nesalvate, caz in care nu se scrie nimic
+        if self._depozit is not None:
+            # fiecare modificare a fost deja salvata in baza de date
+            return False
+        with self._exclusiv(modificare=False):
+            self._asteptare_compactare()
+            if not self._modificate:
+                return False
+            if self._fragmente is not None:
+                # sunt citite si rescrise numai fragmentele care contin angajati nesalvati
+                self._incarcare_fragmente(chei=self._chei_fragmente_nesalvate())
+                scriere = self._scriere_fragmente
+                chei = self._fragmente_modificate
+                date = self._date_fragmente(chei)
+                self._fragmente_modificate = set()
+            elif self._format_fragmentat():
+                # datele fragmentate nu au fost deschise; nu sunt scrise niciodata intr-un singur fisier
+                raise ValueError(f'Datele fragmentate din {self.cale_date} nu sunt deschise! Salvarea nu este posibila.')
+            else:
+                self._asigurare_incarcare()
+                scriere = self._scriere_date
+                chei = set()
+                date = (list(self.angajati.values()), self._statistici_curente())
+            modificate, self._modificate = self._modificate, set()
+            if self._jurnal is not None:
+                self._jurnal.rotire()
+
+        if fundal:
+            self._compactare_in_curs = (modificate, chei)
+            self._fir_compactare = threading.Thread(target=self._scriere_fundal, args=(scriere, date))
+            self._fir_compactare.start()
+        else:
+            try:
+                scriere(*date)
+            except (OSError, ValueError) as exception:
+                self._esec_compactare(exception, modificate, chei)
+        return True
+
+
+    def _chei_fragmente_nesalvate(self):
+        # fragmentele modificate in memorie si cele in care trebuie aplicate inregistrarile amanate din jurnal;
+        # la fragmentarea dupa departament, fragmentul din care a fost sters sau mutat un angajat nu poate fi
+        # stabilit fara citirea tuturor fragmentelor
+        chei = set(self._fragmente_modificate)
+        for cnp, (operatie, date) in self._suprapunere.items():
+            if self._fragmente.criteriu == 'hash':
+                chei.add(self._fragmente.cheie_cnp(cnp))
+            elif operatie == 'A':
+                chei.add(date[5])
+            else:
+                return set(self._fragmente_neincarcate) | chei
+        return chei
+
+
+    def _date_fragmente(self, chei):
+        # returneaza angajatii din fiecare fragment cerut
+        fragmente = {cheie: [] for cheie in chei}
+        if self._fragmente.criteriu == 'departament':
+            for cheie in chei:
+                fragmente[cheie] = list(self._index_departament.grup(cheie).values())
+        else:
+            for angajat in self.angajati.values():
+                lista = fragmente.get(self._fragmente.cheie(angajat.departament, angajat.cnp))
+                if lista is not None:
+                    lista.append(angajat)
+        return (fragmente,)
+
+
+    def _scriere_fragmente(self, fragmente):
+        for cheie, angajati in fragmente.items():
+            self._fragmente.scriere(cheie, [angajat.dictionar() for angajat in angajati])
+            if metrici.activ:
+                metrici.inregistrare(len(angajati))
+        if self._jurnal is not None:
+            self._jurnal.stergere_vechi()
+
+
+    def _scriere_date(self, angajati, agregate):
+        if self._format_binar():
+            scriere_instantaneu_binar(self.cale_date, angajati, agregate)
+        else:
+            salvare_json_atomica(self.cale_date, (angajat.dictionar() for angajat in angajati))
+        if metrici.activ:
+            metrici.inregistrare(len(angajati), octeti_scrisi=os.path.getsize(self.cale_date))
+        if self._jurnal is not None:
+            self._jurnal.stergere_vechi()
+
+
+    def _scriere_fundal(self, scriere, date):
+        # ruleaza pe firul de compactare; eroarea este doar retinuta, fara a lua blocarea,
+        # pentru ca firul principal poate astepta acest fir tinand blocarea
+        try:
+            scriere(*date)
+        except (OSError, ValueError) as exception:
+            self._eroare_compactare = exception
+
+
+    def _esec_compactare(self, exception, modificate, chei):
+        print(f'Salvarea datelor nu a reusit! Modificarile raman in jurnal. Eroare: {exception}')
+        # angajatii si fragmentele raman marcati ca nesalvati, pentru urmatoarea salvare
+        with self._exclusiv(modificare=False):
+            self._modificate |= modificate
+            self._fragmente_modificate |= chei
+
+
+    def _asteptare_compactare(self):
+        if self._fir_compactare is not None:
+            self._fir_compactare.join()
+            self._fir_compactare = None
+            if self._eroare_compactare is not None:
+                self._esec_compactare(self._eroare_compactare, *self._compactare_in_curs)
+                self._eroare_compactare = None
+            self._compactare_in_curs = None
+
 
     def salvare_informatii(self):
-        lista_angajati = []
-        for angajat in self.angajati:
-            item = {
-                'Nume': angajat.nume,
-                'Prenume': angajat.prenume,
-                'CNP': angajat.cnp,
-                'Varsta': angajat.varsta,
-                'Salar': angajat.salar,
-                'Departament': angajat.departament,
-                'Senioritate': angajat.senioritate
-            }
-            lista_angajati.append(item)
-
-        with open('date_angajati.json', 'w') as json_file:
-            json.dump(lista_angajati, json_file, indent=4)
-
-
-    def introducere_date_angajat(self, cnp=None, index=None):
+        # la iesire modificarile nesalvate sunt scrise in fisierul de date, care este citit si de
+        # alte programe (angajat.py); fara modificari nu se scrie nimic
+        self.compactare()
+        if self._jurnal is not None:
+            self._jurnal.inchidere()
+        if self._depozit is not None:
+            self._depozit.inchidere()
+
+
+    def obtinere_angajat(self, cnp):
+        if self._depozit is not None:
+            valori = self._depozit.obtinere(cnp)
+            return Angajat(*valori) if valori is not None else None
+        if cnp in self._suprapunere:
+            operatie, date = self._suprapunere[cnp]
+            return None if operatie == 'S' else self._angajat_jurnal(date)
+        if self._instantaneu is not None:
+            angajat = self._cache.get(cnp)
+            if angajat is not None:
+                self._cache.move_to_end(cnp)
+                return angajat
+            rand = self._instantaneu.cautare(cnp)
+            if rand is None:
+                return None
+            nume, prenume, cnp, varsta, salar, departament, senioritate = self._instantaneu.valori(rand)
+            angajat = Angajat(nume, prenume, cnp, _internare(varsta), salar, _internare(departament), _internare(senioritate))
+            # pana la incarcarea completa nu exista modificari, deci angajatii din cache nu se invechesc
+            self._cache[cnp] = angajat
+            if len(self._cache) > self.marime_cache:
+                self._cache.popitem(last=False)
+            return angajat
+        if self._fragmente_neincarcate:
+            self._incarcare_fragmente(cnp_uri=[cnp])
+        return self.angajati.get(cnp)
+
+
+    def adaugare_angajat(self, angajat):
+        if self._depozit is not None:
+            self._depozit.adaugare([self._valori_jurnal(angajat)])
+            return
+
+        with self._exclusiv():
+            self._asigurare_incarcare(cnp_uri=[angajat.cnp])
+            if angajat.cnp in self.angajati:
+                raise ValueError(f'Exista deja un angajat cu CNP-ul: {angajat.cnp}!')
+            self._adaugare(angajat)
+            self._marcare_nesalvat(angajat)
+            self._jurnalizare('A', self._valori_jurnal(angajat))
+
+
+    def adaugare_angajati(self, angajati):
+        # adaugare pe lot: CNP-urile sunt verificate inainte de orice modificare,
+        # iar jurnalul este scris o singura data pentru tot lotul
+        if self._depozit is not None:
+            self._depozit.adaugare([self._valori_jurnal(angajat) for angajat in angajati])
+            return
+
+        with self._exclusiv():
+            self._asigurare_incarcare(cnp_uri=[angajat.cnp for angajat in angajati])
+            cnp_lot = set()
+            for angajat in angajati:
+                if angajat.cnp in self.angajati or angajat.cnp in cnp_lot:
+                    raise ValueError(f'Exista deja un angajat cu CNP-ul: {angajat.cnp}!')
+                cnp_lot.add(angajat.cnp)
+
+            for angajat in angajati:
+                self._adaugare(angajat)
+                self._marcare_nesalvat(angajat)
+            self._jurnalizare('A', *(self._valori_jurnal(angajat) for angajat in angajati))
+
+
+    def modificare_angajat(self, angajat):
+        if self._depozit is not None:
+            if not self._depozit.modificare(self._valori_jurnal(angajat)):
+                raise KeyError(angajat.cnp)
+            self.cache_fluturasi.invalidare(angajat.cnp)
+            return
+
+        with self._exclusiv():
+            self._asigurare_incarcare(cnp_uri=[angajat.cnp])
+            if angajat.cnp not in self.angajati:
+                raise KeyError(angajat.cnp)
+            self._marcare_nesalvat(self.angajati[angajat.cnp])
+            self._modificare(angajat)
+            self._marcare_nesalvat(angajat)
+            self._jurnalizare('M', self._valori_jurnal(angajat))
+
+
+    def stergere_angajat(self, cnp):
+        if self._depozit is not None:
+            valori = self._depozit.stergere(cnp)
+            if valori is None:
+                raise KeyError(cnp)
+            self.cache_fluturasi.invalidare(cnp)
+            return Angajat(*valori)
+
+        with self._exclusiv():
+            self._asigurare_incarcare(cnp_uri=[cnp])
+            angajat = self._stergere(cnp)
+            self._marcare_nesalvat(angajat)
+            self._jurnalizare('S', cnp)
+        return angajat
+
+
+    def _valori_jurnal(self, angajat):
+        return [angajat.nume, angajat.prenume, angajat.cnp, angajat.varsta, angajat.salar, angajat.departament, angajat.senioritate]
+
+
+    def _adaugare(self, angajat):
+        self.angajati[angajat.cnp] = angajat
+        for index in self._indexuri:
+            index.adauga(angajat)
+
+
+    def _modificare(self, angajat):
+        vechi = self.angajati[angajat.cnp]
+        self.angajati[angajat.cnp] = angajat
+        for index in self._indexuri:
+            index.inlocuieste(vechi, angajat)
+        self.cache_fluturasi.invalidare(angajat.cnp)
+
+
+    def _stergere(self, cnp):
+        angajat = self.angajati.pop(cnp)
+        for index in self._indexuri:
+            index.elimina(angajat)
+        self.cache_fluturasi.invalidare(cnp)
+        return angajat
+
+
+    def vedere(self):
+        # vederea este publicata o singura data dupa fiecare modificare si apoi este partajata de toti
+        # cititorii, fara ca acestia sa ia blocarea scriitorilor; publicarea copiaza numai lista galetilor
+        vedere = self._vedere
+        if vedere is None:
+            if self._depozit is not None:
+                # depozitul SQLite nu pastreaza angajatii in memorie; vederea ii citeste pe toti
+                return VedereCompanie(IndexVedere(self.selectare_angajati()).publicare(), self._statistici_curente())
+            with self._exclusiv(modificare=False):
+                self._asigurare_incarcare()
+                vedere = self._vedere
+                if vedere is None:
+                    # in afara modului concurent galetile sunt construite pentru fiecare vedere
+                    index = self._index_vedere or IndexVedere(self.angajati.values())
+                    vedere = self._vedere = VedereCompanie(index.publicare(), self._statistici_curente())
+        return vedere
+
+
+    def selectare_angajati(self, departament=None, senioritate=None):
+        if self._depozit is not None:
+            # filtrele sunt rezolvate de indexurile bazei de date, iar angajatii sunt cititi pe masura ce sunt parcursi
+            return (Angajat(*valori) for valori in self._depozit.selectare(departament, senioritate))
+        if self._blocare is not None:
+            return self.vedere().selectare_angajati(departament, senioritate)
+
+        # filtrele sunt rezolvate prin indexurile secundare, fara a parcurge toti angajatii
+        self._asigurare_incarcare(departament)
+        if departament and senioritate:
+            grup_departament = self._index_departament.grup(departament)
+            grup_senioritate = self._index_senioritate.grup(senioritate)
+            grup_mic, grup_mare = sorted((grup_departament, grup_senioritate), key=len)
+            return [angajat for cnp, angajat in grup_mic.items() if cnp in grup_mare]
+        if departament:
+            return self._index_departament.grup(departament).values()
+        if senioritate:
+            return self._index_senioritate.grup(senioritate).values()
+        return self.angajati.values()
+
+
+    def cautare_angajati(self, criteriu, inceput, sfarsit=None):
+        # angajatii al caror CNP, data a nasterii (AAAA-LL-ZZ) sau judet incepe cu inceput sau,
+        # daca sfarsit este primit, se afla intre prefixele inceput si sfarsit, inclusiv
+        if criteriu not in CRITERII_CAUTARE:
+            raise ValueError(f'Criteriul de cautare {criteriu} nu este cunoscut!')
+        if self._depozit is not None:
+            return [Angajat(*valori) for valori in self._depozit.cautare(criteriu, inceput, sfarsit)]
+
+        with self._exclusiv(modificare=False):
+            angajati = self._index_cautare(IndexCNP).cautare(criteriu, inceput, sfarsit)
+        if metrici.activ:
+            metrici.inregistrare(len(angajati))
+        return angajati
+
+
+    def cautare_nume(self, text, limita=LIMITA_REZULTATE):
+        # cel mult limita angajati ale caror nume si prenume seamana cu cuvintele din text,
+        # ordonati descrescator dupa similaritate
+        if self._depozit is not None:
+            raise ValueError('Cautarea dupa nume nu este disponibila pentru depozitul SQLite!')
+        with self._exclusiv(modificare=False):
+            rezultate = self._index_cautare(IndexNume).cautare(text, limita)
+        if metrici.activ:
+            metrici.inregistrare(len(rezultate))
+        return [angajat for _, angajat in rezultate]
+
+
+    def _index_cautare(self, clasa):
+        # dupa construire, indexul este intretinut la fiecare modificare, ca indexurile secundare
+        index = self._indexuri_cautare.get(clasa)
+        if index is None:
+            self._asigurare_incarcare()
+            index = self._indexuri_cautare[clasa] = clasa(self.angajati.values())
+            self._indexuri.append(index)
+        return index
+
+
+    def cost_salarii(self, departament=None):
+        if self._depozit is not None:
+            return self._depozit.cost(departament)
+        if self._blocare is not None:
+            statistici = self._statistici_publicate
+            return statistici['total_departament'].get(departament, 0) if departament else statistici['total']
+        if self._instantaneu is not None:
+            agregate = self._instantaneu.agregate
+            return agregate['total_departament'].get(departament, 0) if departament else agregate['total']
+        if self._fragmente_neincarcate:
+            self._incarcare_fragmente(departament)
+        if departament:
+            return self._agregate.total_departament.get(departament, 0)
+        return self._agregate.total
+
+
+    def statistici_salarii(self):
+        if self._blocare is not None:
+            return dict(self._statistici_publicate)
+        if self._fragmente_neincarcate:
+            self._incarcare_fragmente()
+        return self._statistici_curente()
+
+
+    def _statistici_curente(self):
+        if self._depozit is not None:
+            return self._depozit.statistici()
+        if self._instantaneu is not None:
+            return dict(self._instantaneu.agregate)
+        return {
+            'numar': self._agregate.numar,
+            'total': self._agregate.total,
+            'minim': self._agregate.minim,
+            'maxim': self._agregate.maxim,
+            'medie': self._agregate.medie,
+            'total_departament': dict(self._agregate.total_departament),
+            'total_senioritate': dict(self._agregate.total_senioritate)
+        }
+
+
+    def verificare_agregate(self):
+        # compara agregatele intretinute incremental cu o recalculare completa
+        # si returneaza lista diferentelor gasite (lista goala daca sunt consistente)
+        if self._depozit is not None:
+            # agregatele depozitului SQLite sunt calculate la fiecare interogare, nu intretinute incremental
+            return []
+        with self._exclusiv(modificare=False):
+            self._asigurare_incarcare()
+            recalculat = AgregateSalarii()
+            for angajat in self.angajati.values():
+                recalculat.adauga(angajat)
+
+            def egale(valoare, referinta):
+                if valoare is None or referinta is None:
+                    return valoare is referinta
+                return math.isclose(valoare, referinta, rel_tol=1e-9, abs_tol=1e-6)
+
+            diferente = []
+            for camp in ('numar', 'total', 'minim', 'maxim'):
+                if not egale(getattr(self._agregate, camp), getattr(recalculat, camp)):
+                    diferente.append(f'{camp}: {getattr(self._agregate, camp)} != {getattr(recalculat, camp)}')
+            for camp in ('total_departament', 'numar_departament', 'total_senioritate', 'numar_senioritate'):
+                curent, referinta = getattr(self._agregate, camp), getattr(recalculat, camp)
+                for cheie in curent.keys() | referinta.keys():
+                    if not egale(curent.get(cheie), referinta.get(cheie)):
+                        diferente.append(f'{camp}[{cheie}]: {curent.get(cheie)} != {referinta.get(cheie)}')
+
+        return diferente
+
+
+    def introducere_date_angajat(self, cnp=None):
+        # daca CNP-ul este primit ca parametru, se modifica datele unui angajat existent
+        modificare = cnp is not None
+
         while True:
             nume = input('Introduceti numele: ')
             if self._validare_nume(nume):
@@ -96,13 +1216,15 @@ class Companie:
             else:
                 print('Prenumele nu este valid! Trebuie sa contina numai litere si sa inceapaca cu litera mare.')
 
-        if not cnp:
+        if not modificare:
             while True:
                 cnp = input('Introduceti CNPul: ')
-                if self._validare_cnp(cnp):
-                    break
-                else:
+                if not self._validare_cnp(cnp):
                     print('CNPul introdus nu este valid! Trebuie sa contina 13 cifre!')
+                elif self.obtinere_angajat(cnp) is not None:
+                    print('CNPul introdus apartine deja unui angajat! Introduceti un alt CNP.')
+                else:
+                    break
 
         while True:
             varsta = input('Introduceti varsta: ')
@@ -135,12 +1257,12 @@ class Companie:
             else:
                 print('Senioritatea introdusa nu este valida! Trebuie sa fie una din lista mentionata.')
 
-        angajat = Angajat(nume, prenume, cnp, varsta, salar, departament, senioritate)
-        if not index:
-            self.angajati.append(angajat)
+        angajat = Angajat(nume, prenume, cnp, _internare(varsta), salar, _internare(departament), _internare(senioritate))
+        if not modificare:
+            self.adaugare_angajat(angajat)
             print('Angajatul a fost introdus cu succes!')
         else:
-            self.angajati[index] = angajat
+            self.modificare_angajat(angajat)
             print('Datele angajatului au fost modificate cu succes!')
 
 
@@ -152,15 +1274,65 @@ class Companie:
             else:
                 print('CNPul introdus nu este valid! Trebuie sa contina 13 cifre!')
 
-        found = False
-        for angajat in self.angajati:
-            if angajat.cnp == cnp:
-                found = True
-                angajat.afisare()
+        angajat = self.obtinere_angajat(cnp)
+        if angajat:
+            angajat.afisare()
+        else:
+            print(f'Angajatul cu CNP-ul: {cnp} nu a fost gasit! Verificati si reintroduceti CNP-ul corect.')
+
+
+    def cautare_angajati_atribute_cnp(self):
+        criterii = {'1': 'cnp', '2': 'data_nasterii', '3': 'judet'}
+        formate = {'cnp': 'inceputul CNP-ului', 'data_nasterii': 'data nasterii (AAAA, AAAA-LL sau AAAA-LL-ZZ)',
+                   'judet': 'codul judetului (2 cifre)'}
+        while True:
+            optiune = input('Cautare dupa: 1. inceputul CNP-ului, 2. data nasterii, 3. judet: ')
+            if optiune in criterii:
                 break
+            else:
+                print('Optiune invalida! Introduceti 1, 2 sau 3.')
+        criteriu = criterii[optiune]
 
-        if not found:
-            print(f'Angajatul cu CNP-ul: {cnp} nu a fost gasit! Verificati si reintroduceti CNP-ul corect.')
+        while True:
+            inceput = input(f'Introduceti {formate[criteriu]}: ')
+            if self._validare_prefix_cautare(criteriu, inceput):
+                break
+            else:
+                print('Valoarea introdusa nu este valida! Verificati formatul si reintroduceti valoarea.')
+
+        while True:
+            sfarsit = input(f'Introduceti capatul intervalului, in acelasi format, sau Enter pentru o cautare dupa {inceput}: ')
+            if not sfarsit or self._validare_prefix_cautare(criteriu, sfarsit):
+                break
+            else:
+                print('Valoarea introdusa nu este valida! Verificati formatul si reintroduceti valoarea.')
+
+        angajati = self.cautare_angajati(criteriu, inceput, sfarsit or None)
+        if angajati:
+            afisare_inregistrari(angajat.dictionar() for angajat in angajati)
+            print(f'\nAu fost gasiti {len(angajati)} angajati.')
+        else:
+            print('Nu a fost gasit niciun angajat care sa corespunda cautarii.')
+
+
+    def cautare_angajati_nume(self):
+        while True:
+            text = input('Introduceti numele si/sau prenumele cautat: ')
+            if self._validare_text_cautare(text):
+                break
+            else:
+                print('Textul introdus nu este valid! Trebuie sa contina numai litere si spatii.')
+
+        try:
+            angajati = self.cautare_nume(text)
+        except ValueError as exception:
+            print(exception)
+            return
+        if angajati:
+            afisare_inregistrari(angajat.dictionar() for angajat in angajati)
+            print(f'\nAu fost afisati cei mai apropiati {len(angajati)} angajati.')
+        else:
+            print(f'Nu a fost gasit niciun angajat cu un nume asemanator cu: {text}.')
 
 
     def modificare_angajat_cnp(self):
@@ -171,16 +1343,12 @@ class Companie:
             else:
                 print('CNPul introdus nu este valid! Trebuie sa contina 13 cifre!')
 
-        found = False
-        for index, angajat in self.angajati:
-            if angajat.cnp == cnp:
-                found = True
-                print('Datele curente ale angajatului:')
-                angajat.afisare()
-                self.introducere_date_angajat(cnp, index)
-                break
-
-        if not found:
+        angajat = self.obtinere_angajat(cnp)
+        if angajat:
+            print('Datele curente ale angajatului:')
+            angajat.afisare()
+            self.introducere_date_angajat(cnp)
+        else:
             print(f'Angajatul cu CNP-ul: {cnp} nu a fost gasit! Verificati si reintroduceti CNP-ul corect.')
 
 
@@ -192,16 +1360,10 @@ class Companie:
             else:
                 print('CNPul introdus nu este valid! Trebuie sa contina 13 cifre!')
 
-        found = False
-        for angajat in self.angajati:
-            if angajat.cnp == cnp:
-                found = True
-                self.angajati.remove(angajat)
-                break
-
-        if not found:
+        if self.obtinere_angajat(cnp) is None:
             print(f'Angajatul cu CNP-ul: {cnp} nu a fost gasit! Verificati si reintroduceti CNP-ul corect.')
         else:
+            self.stergere_angajat(cnp)
             print('Angajatul a fost sters cu succes!')
 
 
@@ -222,15 +1384,19 @@ class Companie:
                 else:
                     print('Senioritatea introdusa nu este valida! Trebuie sa fie una din lista mentionata.')
 
-        for angajat in self.angajati:
-            if departament:
-                if angajat.departament == departament:
-                    angajat.afisare()
-            elif senioritate:
-                if angajat.senioritate == senioritate:
-                    angajat.afisare()
-            else:
-                angajat.afisare()
+        self.afisare_lista(departament, senioritate)
+
+
+    def afisare_lista(self, departament=None, senioritate=None, format_afisare='detaliat', limita=None, deplasare=0, iesire=None):
+        if self._instantaneu is not None and not self._suprapunere and not departament and not senioritate:
+            # lista completa este citita direct din instantaneul binar, numai pentru randurile afisate
+            instantaneu = self._instantaneu
+            stop = len(instantaneu) if limita is None else min(len(instantaneu), deplasare + limita)
+            angajati = (dict(zip(CAMPURI_ANGAJAT, instantaneu.valori(rand))) for rand in range(min(deplasare, stop), stop))
+            return afisare_inregistrari(angajati, format_afisare, iesire=iesire)
+
+        angajati = (angajat.dictionar() for angajat in self.selectare_angajati(departament, senioritate))
+        return afisare_inregistrari(angajati, format_afisare, limita, deplasare, iesire)
 
 
     def calculator_cost_salarii(self, firma=True):
@@ -243,18 +1409,17 @@ class Companie:
                 else:
                     print('Departamentul introdus este invalid! Trebuie sa fie unul din lista mentionata.')
 
-        cost_salarii = 0
-        for angajat in self.angajati:
-            if not departament:
-                cost_salarii += angajat.salar
-            else:
-                if angajat.get('Departament') == departament:
-                    cost_salarii += angajat.salar
+        cost_salarii = self.cost_salarii(departament)
 
         if not firma:
             print(f'Costul total al salariilor din departamentul {departament} este: {cost_salarii} lei')
         else:
             print(f'Costul total al salariilor este: {cost_salarii} lei')
+            # statisticile vin din stratul de date activ (agregate, instantaneu, fragmente sau SQLite)
+            statistici = self.statistici_salarii()
+            if statistici['numar']:
+                print(f'Numar angajati: {statistici["numar"]}, salar minim: {statistici["minim"]} lei, '
+                      f'salar maxim: {statistici["maxim"]} lei, salar mediu: {statistici["medie"]:.2f} lei')
 
 
     def calculator_fluturas_salar(self):
@@ -265,76 +1430,208 @@ class Companie:
             else:
                 print('CNPul introdus nu este valid! Trebuie sa contina 13 cifre!')
 
-        found = False
-        for angajat in self.angajati:
-            if angajat.cnp == cnp:
-                found = True
-                salar = angajat.get('Salar')
-                cas = 0.1 * salar
-                cass = 0.25 * salar
-                impozit = (salar - cas - cass) * 0.1
-                net = salar - cas - cass - impozit
-
-                delimitator = 10 * '-'
-                afisaj = f'\n{delimitator}\nNume: {angajat.nume}\nPrenume: {angajat.prenume}\nBrut: {angajat.salar}\n\
-                        \nCAS: {cas}\nCASS: {cass}\nImpozit: {impozit}\nNet: {net}'
-                print(afisaj)
-                break
+        angajat = self.obtinere_angajat(cnp)
+        if angajat:
+            cas, cass, impozit, net = self.cache_fluturasi.obtinere(cnp, angajat.salar)
 
-        if not found:
+            delimitator = 10 * '-'
+            afisaj = f'\n{delimitator}\nNume: {angajat.nume}\nPrenume: {angajat.prenume}\nBrut: {angajat.salar}\n\
+                    \nCAS: {cas}\nCASS: {cass}\nImpozit: {impozit}\nNet: {net}'
+            print(afisaj)
+        else:
             print(f'Angajatul cu CNP-ul: {cnp} nu a fost gasit! Verificati si reintroduceti CNP-ul corect.')
 
 
-    def _validare_nume(self, nume):
+    def calcul_fluturas_angajat(self, cnp, data=None):
+        # returneaza (cas, cass, impozit, net) sau None daca angajatul nu exista;
+        # se aplica regula fiscala in vigoare la data primita (implicit data curenta)
+        angajat = self.obtinere_angajat(cnp)
+        if angajat is None:
+            return None
+        return self.cache_fluturasi.obtinere(cnp, angajat.salar, regula_curenta(data))
+
+
+    def calcul_fluturasi_lot(self, departament=None, data=None):
+        # fluturasii sunt calculati intr-o singura trecere peste coloana de salarii,
+        # cu regula fiscala in vigoare la data primita, citita o singura data pentru tot lotul
+        regula = regula_curenta(data)
+        if self._depozit is not None:
+            # in depozitul SQLite fluturasii sunt calculati de interogare, rand cu rand
+            tabel = {coloana: array('d') for coloana in COLOANE_FLUTURAS}
+            tabel['cnp'] = []
+            for cnp, *valori in self._depozit.fluturasi(regula.cota_cas, regula.cota_cass, regula.cota_impozit, regula.deducere,
+                                                        departament):
+                tabel['cnp'].append(cnp)
+                for coloana, valoare in zip(COLOANE_FLUTURAS, valori):
+                    tabel[coloana].append(valoare)
+            return tabel
+        # coloana de salarii este extrasa din angajatii selectati prin indexul de departament
+        angajati = self.selectare_angajati(departament)
+        cnp = [angajat.cnp for angajat in angajati]
+        salarii = array('d', [angajat.salar for angajat in angajati])
+
+        tabel = calcul_fluturasi(salarii, regula)
+        tabel['cnp'] = cnp
+        if metrici.activ:
+            metrici.inregistrare(len(cnp))
+        return tabel
+
+
+    def generare_fluturasi_lot(self, cale='fluturasi_salar.csv'):
+        while True:
+            departament = input('Introduceti departamentul (HR, IT, Marketing, Finance) sau Enter pentru toata firma: ')
+            if not departament or self._validare_departament(departament):
+                break
+            else:
+                print('Departamentul introdus este invalid! Trebuie sa fie unul din lista mentionata.')
+
+        while True:
+            luna = input('Introduceti luna (AAAA-LL) sau Enter pentru luna curenta: ')
+            try:
+                data = data_luna(luna) if luna else None
+                regula_curenta(data)
+                break
+            except ValueError as exception:
+                print(f'Luna introdusa nu este valida! {exception}')
+
+        tabel = self.calcul_fluturasi_lot(departament, data)
+        salvare_fluturasi_csv(tabel, cale)
+        print(f'Au fost generati {len(tabel["cnp"])} fluturasi de salar in fisierul {cale}. Total net: {sum(tabel["net"])} lei')
+
+
+    def simulare_salarii(self, scenarii, data=None):
+        # scenariile sunt evaluate peste coloane de salarii construite din angajati; firma nu este modificata
+        simulare = SimulareSalarii.din_angajati(self.selectare_angajati())
+        if metrici.activ:
+            metrici.inregistrare(len(simulare) * (len(scenarii) + 1))
+        return simulare.evaluare(scenarii, data)
+
+
+    def simulare_marire_salarii(self):
+        while True:
+            departament = input('Introduceti departamentul (HR, IT, Marketing, Finance) sau Enter pentru toata firma: ')
+            if not departament or self._validare_departament(departament):
+                break
+            else:
+                print('Departamentul introdus este invalid! Trebuie sa fie unul din lista mentionata.')
+
+        while True:
+            senioritate = input('Introduceti senioritatea (junior, mid, senior) sau Enter pentru toate: ')
+            if not senioritate or self._validare_senioritate(senioritate):
+                break
+            else:
+                print('Senioritatea introdusa este invalida! Trebuie sa fie una din lista mentionata.')
+
+        while True:
+            try:
+                procent = float(input('Introduceti procentul de marire (negativ pentru scadere): '))
+                break
+            except ValueError:
+                print('Procentul introdus nu este un numar valid!')
+
+        scenariu = Scenariu(f'{procent:+}%', [RegulaSalar(procent, departament=departament or None,
+                                                          senioritate=senioritate or None)])
+        rezultat = self.simulare_salarii([scenariu])['scenarii'][scenariu.nume]
+
+        print(f'Angajati afectati: {rezultat["angajati_afectati"]}')
+        print(f'Cost total brut: {rezultat["brut"]:.2f} lei (diferenta: {rezultat["delta_brut"]:+.2f} lei)')
+        print(f'Total net: {rezultat["net"]:.2f} lei (diferenta: {rezultat["delta_net"]:+.2f} lei)')
+        for nume, date_departament in rezultat['departamente'].items():
+            if date_departament['angajati_afectati']:
+                print(f'{nume}: brut {date_departament["delta_brut"]:+.2f} lei, net {date_departament["delta_net"]:+.2f} lei')
+
+
+    # validarile nu depind de starea firmei, astfel incat pot fi folosite si in alte procese
+    @staticmethod
+    def _validare_nume(nume):
         return nume.isalpha() and nume[0].isupper()
 
 
-    def _validare_cnp(self, cnp):
+    @staticmethod
+    def _validare_cnp(cnp):
         return cnp.isdigit() and cnp.isascii() and len(cnp) == 13
 
 
-    def _validare_varsta(self, varsta):
+    @staticmethod
+    def _validare_prefix_cautare(criteriu, prefix):
+        if not prefix.replace('-', '').isdigit() or not prefix.isascii():
+            return False
+        if criteriu == 'cnp':
+            return len(prefix) <= 13 and prefix.isdigit()
+        if criteriu == 'judet':
+            return len(prefix) == 2 and prefix.isdigit()
+        return [len(parte) for parte in prefix.split('-')] in ([4], [4, 2], [4, 2, 2])
+
+
+    @staticmethod
+    def _validare_text_cautare(text):
+        cuvinte = text.split()
+        return bool(cuvinte) and all(cuvant.isalpha() for cuvant in cuvinte)
+
+
+    @staticmethod
+    def _validare_varsta(varsta):
         return varsta.isdigit() and varsta.isascii() and len(varsta) == 2 and 18 <= int(varsta) <= 65
 
 
-    def _validare_salar(self, salar):
-        return salar >= 4050
+    @staticmethod
+    def _validare_salar(salar, salar_minim=None):
+        # salarul minim este cel din regula fiscala in vigoare, daca nu este primit explicit
+        # inf si nan sunt convertite de float(), dar nu sunt salarii
+        return math.isfinite(salar) and salar >= (salar_minim_curent() if salar_minim is None else salar_minim)
 
 
-    def _validare_departament(self, departament):
+    @staticmethod
+    def _validare_departament(departament):
         departamente = ['HR', 'Marketing', 'IT', 'Finance']
         return departament in departamente and departament.isalpha()
 
 
-    def _validare_senioritate(self, senioritate):
+    @staticmethod
+    def _validare_senioritate(senioritate):
         senioritati = ['junior', 'mid', 'senior']
         return senioritate in senioritati and senioritate.isalpha()
 
 
 class Aplicatie:
-    def __init__(self):
-        self.companie = Companie()
+    def __init__(self, cale_date=FISIER_DATE):
+        self.companie = Companie(jurnal=True, cale_date=cale_date, lenes=True)
         self.companie.initializare()
 
 
     def ruleaza(self):
         while True:
             optiune = self._meniu()
-            match optiune:
-                case 1: self.companie.introducere_date_angajat()
-                case 2: self.companie.cautare_angajat_cnp()
-                case 3: self.companie.modificare_angajat_cnp()
-                case 4: self.companie.stergere_angajat_cnp()
-                case 5: self.companie.afisare_angajati()
-                case 6: self.companie.calculator_cost_salarii()
-                case 7: self.companie.calculator_cost_salarii(firma=False)
-                case 8: self.companie.calculator_fluturas_salar()
-                case 9: self.companie.afisare_angajati(departament=True)
-                case 10: self.companie.afisare_angajati(departament=True)
-                case 11:
+            if optiune is None:
+                # o optiune invalida nu este masurata, ca sa nu apara in metrici
+                continue
+            if optiune == 11:
+                with metrici.masurare('meniu.11'):
                     self.companie.salvare_informatii()
-                    print('Iesire din program.')
-                    break
+                print('Iesire din program.')
+                break
+            with metrici.masurare(f'meniu.{optiune}'):
+                match optiune:
+                    case 1: self.companie.introducere_date_angajat()
+                    case 2: self.companie.cautare_angajat_cnp()
+                    case 3: self.companie.modificare_angajat_cnp()
+                    case 4: self.companie.stergere_angajat_cnp()
+                    case 5: self.companie.afisare_angajati()
+                    case 6: self.companie.calculator_cost_salarii()
+                    case 7: self.companie.calculator_cost_salarii(firma=False)
+                    case 8: self.companie.calculator_fluturas_salar()
+                    case 9: self.companie.afisare_angajati(senioritate=True)
+                    case 10: self.companie.afisare_angajati(departament=True)
+                    case 12: self.companie.generare_fluturasi_lot()
+                    case 13: self.companie.simulare_marire_salarii()
+                    case 14:
+                        # meniul ramane disponibil cat timp fisierul de date este scris
+                        if self.companie.compactare(fundal=True):
+                            print('Salvarea datelor a pornit in fundal.')
+                        else:
+                            print('Nu exista modificari nesalvate.')
+                    case 15: self.companie.cautare_angajati_atribute_cnp()
+                    case 16: self.companie.cautare_angajati_nume()
 
 
     def _meniu(self):
@@ -351,14 +1648,21 @@ class Aplicatie:
             9. Afisarea angajatilor cu o anumita senioritate
             10. Afisarea angajatilor dintr-un departament
             11. Iesire
+            12. Generare fluturasi salariu pentru toti angajatii
+            13. Simulare marire salarii
+            14. Salvare date (in fundal)
+            15. Cautare angajati dupa CNP, data nasterii sau judet
+            16. Cautare angajati dupa nume
             -------------------------------------------------
             '''
 
         print(meniu)
+        optiune = None
         try:
             optiune = int(input('Introduceti optiunea: '))
-            if not 1 <= optiune <= 11:
+            if not 1 <= optiune <= 16:
                 print('Optiune invalida! Introduceti una din optiunile disponibile.')
+                optiune = None
 
         except ValueError:
             print('Optiune invalida! Optiunea trebuie sa fie un numar prezent in meniu!')
@@ -367,5 +1671,15 @@ class Aplicatie:
 
 
 if __name__ == '__main__':
-    aplicatie = Aplicatie()
-    aplicatie.ruleaza()
+    parser = argparse.ArgumentParser(description='Gestiunea angajatilor unei firme')
+    adaugare_argumente(parser)
+    adaugare_argumente_stocare(parser)
+    argumente = parser.parse_args()
+    try:
+        cale_date = cale_date_argumente(argumente)
+    except ValueError as exception:
+        parser.error(str(exception))
+    # cu --metrici sau --profil sunt masurate metodele publice ale clasei Companie si fiecare optiune din meniu
+    with sesiune(argumente.metrici, argumente.profil, [(Companie, 'Companie')]):
+        aplicatie = Aplicatie(cale_date)
+        aplicatie.ruleaza()
@@ -0,0 +1,237 @@
+'''Metrici de performanta pentru aplicatie.
+
+Modulul contine:
+- statisticile unei operatii: numarul de apeluri, histograma duratelor, inregistrarile parcurse
+  si octetii cititi sau scrisi
+- instrumentarea metodelor unei clase sau a functiilor unui modul, la activarea metricilor
+- exportul metricilor in format JSON sau in formatul text Prometheus
+- profilarea optionala a sesiunii cu cProfile
+
+Cand metricile nu sunt active, nicio metoda nu este inlocuita: codul aplicatiei ruleaza
+neschimbat, iar punctele de masurare din cod se reduc la verificarea atributului metrici.activ.
+
+Utilizare:
+python management_angajati.py --metrici metrici.prom --profil sesiune.prof
+python angajat.py --metrici metrici.json
+'''
+
+
+import bisect
+import contextlib
+import cProfile
+import functools
+import inspect
+import json
+import threading
+import time
+
+
+# limitele superioare ale intervalelor histogramei, in secunde; ultimul interval este +Inf
+LIMITE_HISTOGRAMA = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+PREFIX_PROMETHEUS = 'angajati'
+
+
+class StatisticaOperatie:
+    __slots__ = ('apeluri', 'durata_totala', 'intervale', 'inregistrari', 'octeti_cititi', 'octeti_scrisi')
+
+    def __init__(self):
+        self.apeluri = 0
+        self.durata_totala = 0.0
+        self.intervale = [0] * (len(LIMITE_HISTOGRAMA) + 1)
+        self.inregistrari = 0
+        self.octeti_cititi = 0
+        self.octeti_scrisi = 0
+
+    def observare(self, durata):
+        self.apeluri += 1
+        self.durata_totala += durata
+        self.intervale[bisect.bisect_left(LIMITE_HISTOGRAMA, durata)] += 1
+
+    def dictionar(self):
+        return {
+            'apeluri': self.apeluri,
+            'durata_totala': self.durata_totala,
+            'histograma': dict(zip([str(limita) for limita in LIMITE_HISTOGRAMA] + ['+Inf'], self.intervale)),
+            'inregistrari': self.inregistrari,
+            'octeti_cititi': self.octeti_cititi,
+            'octeti_scrisi': self.octeti_scrisi
+        }
+
+
+class Metrici:
+    def __init__(self):
+        self.activ = False
+        self.operatii = {}
+        self._blocare = threading.Lock()
+        # operatiile in curs, pe fiecare fir; contoarele sunt atribuite operatiei celei mai interioare
+        self._local = threading.local()
+        self._originale = []
+        self._profil = None
+
+    def activare(self, profil=False):
+        self.activ = True
+        if profil:
+            self._profil = cProfile.Profile()
+            self._profil.enable()
+
+    def dezactivare(self):
+        self.activ = False
+        if self._profil is not None:
+            self._profil.disable()
+        # metodele instrumentate sunt readuse la forma originala
+        for tinta, nume, original in reversed(self._originale):
+            setattr(tinta, nume, original)
+        self._originale.clear()
+
+    def resetare(self):
+        with self._blocare:
+            self.operatii.clear()
+
+    def instrumentare(self, tinta, prefix, excluse=()):
+        # inlocuieste metodele publice ale clasei (sau functiile publice ale modulului) cu versiuni masurate
+        for nume, valoare in list(vars(tinta).items()):
+            if nume.startswith('_') or nume in excluse or not inspect.isfunction(valoare):
+                continue
+            if inspect.ismodule(tinta) and valoare.__module__ != tinta.__name__:
+                continue
+            self._originale.append((tinta, nume, valoare))
+            setattr(tinta, nume, self._masurat(f'{prefix}.{nume}', valoare))
+
+    def _masurat(self, nume, functie):
+        @functools.wraps(functie)
+        def masurat(*args, **kwargs):
+            with self.masurare(nume):
+                return functie(*args, **kwargs)
+        return masurat
+
+    @contextlib.contextmanager
+    def masurare(self, nume):
+        if not self.activ:
+            yield
+            return
+        statistica = self._statistica(nume)
+        stiva = self._stiva()
+        stiva.append(statistica)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            durata = time.perf_counter() - start
+            stiva.pop()
+            with self._blocare:
+                statistica.observare(durata)
+
+    def inregistrare(self, inregistrari=0, octeti_cititi=0, octeti_scrisi=0):
+        # contoarele sunt adaugate la operatia in curs pe firul curent; fara operatie in curs sunt ignorate
+        stiva = self._stiva()
+        if not stiva:
+            return
+        statistica = stiva[-1]
+        with self._blocare:
+            statistica.inregistrari += inregistrari
+            statistica.octeti_cititi += octeti_cititi
+            statistica.octeti_scrisi += octeti_scrisi
+
+    def dictionar(self):
+        with self._blocare:
+            return {nume: statistica.dictionar() for nume, statistica in sorted(self.operatii.items())}
+
+    def text_prometheus(self):
+        linii = []
+        with self._blocare:
+            operatii = sorted(self.operatii.items())
+
+            def familie(metrica, tip, descriere, valori):
+                linii.append(f'# HELP {PREFIX_PROMETHEUS}_{metrica} {descriere}')
+                linii.append(f'# TYPE {PREFIX_PROMETHEUS}_{metrica} {tip}')
+                for nume, statistica in operatii:
+                    linii.append(f'{PREFIX_PROMETHEUS}_{metrica}{{operatie="{nume}"}} {valori(statistica)}')
+
+            linii.append(f'# HELP {PREFIX_PROMETHEUS}_durata_secunde Durata operatiilor')
+            linii.append(f'# TYPE {PREFIX_PROMETHEUS}_durata_secunde histogram')
+            for nume, statistica in operatii:
+                cumulat = 0
+                for limita, numar in zip([repr(limita) for limita in LIMITE_HISTOGRAMA] + ['+Inf'], statistica.intervale):
+                    cumulat += numar
+                    linii.append(f'{PREFIX_PROMETHEUS}_durata_secunde_bucket{{operatie="{nume}",le="{limita}"}} {cumulat}')
+                linii.append(f'{PREFIX_PROMETHEUS}_durata_secunde_sum{{operatie="{nume}"}} {statistica.durata_totala!r}')
+                linii.append(f'{PREFIX_PROMETHEUS}_durata_secunde_count{{operatie="{nume}"}} {statistica.apeluri}')
+            familie('inregistrari_total', 'counter', 'Inregistrari parcurse', lambda statistica: statistica.inregistrari)
+            familie('octeti_cititi_total', 'counter', 'Octeti cititi', lambda statistica: statistica.octeti_cititi)
+            familie('octeti_scrisi_total', 'counter', 'Octeti scrisi', lambda statistica: statistica.octeti_scrisi)
+        return '\n'.join(linii) + '\n'
+
+    def salvare(self, cale):
+        # formatul este ales dupa extensie: .prom sau .txt pentru Prometheus, altfel JSON
+        with open(cale, 'w') as fisier:
+            if cale.endswith(('.prom', '.txt')):
+                fisier.write(self.text_prometheus())
+            else:
+                json.dump(self.dictionar(), fisier, indent=4)
+
+    def salvare_profil(self, cale):
+        if self._profil is not None:
+            self._profil.dump_stats(cale)
+
+    def _statistica(self, nume):
+        statistica = self.operatii.get(nume)
+        if statistica is None:
+            with self._blocare:
+                statistica = self.operatii.setdefault(nume, StatisticaOperatie())
+        return statistica
+
+    def _stiva(self):
+        stiva = getattr(self._local, 'stiva', None)
+        if stiva is None:
+            stiva = self._local.stiva = []
+        return stiva
+
+
+# instanta folosita de toata aplicatia
+metrici = Metrici()
+
+
+def adaugare_argumente(parser):
+    '''Adauga in parserul liniei de comanda optiunile pentru metrici si profilare
+
+    Arguments:
+    parser: argparse.ArgumentParser -> parserul aplicatiei
+
+    Returns:
+    None
+    '''
+
+    parser.add_argument('--metrici', default=None,
+                        help='fisierul in care sunt scrise metricile la iesire (.prom sau .txt pentru Prometheus, altfel JSON)')
+    parser.add_argument('--profil', default=None, help='fisierul in care este scris profilul cProfile al sesiunii')
+
+
+@contextlib.contextmanager
+def sesiune(cale_metrici=None, cale_profil=None, tinte=()):
+    '''Activeaza metricile (si optional profilarea) pe durata blocului with, daca este primit
+    cel putin un fisier de iesire, si scrie rezultatele la iesirea din bloc
+
+    Arguments:
+    cale_metrici: str -> fisierul in care sunt scrise metricile (None pentru metrici dezactivate)
+    cale_profil: str -> fisierul in care este scris profilul cProfile (None fara profilare)
+    tinte: Iterable -> perechi (clasa sau modul, prefix) ale caror metode publice sunt masurate
+
+    Returns:
+    Generator -> folosit ca context manager
+    '''
+
+    if not cale_metrici and not cale_profil:
+        yield metrici
+        return
+
+    for tinta, prefix in tinte:
+        metrici.instrumentare(tinta, prefix)
+    metrici.activare(profil=bool(cale_profil))
+    try:
+        yield metrici
+    finally:
+        metrici.dezactivare()
+        if cale_metrici:
+            metrici.salvare(cale_metrici)
+        if cale_profil:
+            metrici.salvare_profil(cale_profil)
@@ -0,0 +1,202 @@
+'''Regulile fiscale folosite la salarizare.
+
+Modulul contine:
+- regula fiscala: cotele CAS, CASS si impozit, deducerea personala si salarul minim pe economie,
+  valabile de la o anumita data
+- motorul fiscal, care pastreaza regulile ordonate dupa data si o returneaza pe cea in vigoare la o data
+- citirea regulilor dintr-un fisier de configurare JSON, aflat langa modul; fisierul este citit
+  la prima cerere a unei reguli, nu la importul modulului
+
+Fiecare regula este compilata la creare intr-o functie de calcul care are cotele legate ca variabile
+locale, astfel incat calculul pentru un angajat nu mai citeste configurarea.
+
+Exemplu de fisier de configurare (reguli_fiscale.json):
+[
+    {"data_efectiva": "2025-01-01", "cota_cas": 0.1, "cota_cass": 0.25, "cota_impozit": 0.1,
+     "deducere": 0, "salar_minim": 4050}
+]
+'''
+
+
+import bisect
+import datetime
+import json
+import os
+
+
+# fisierul este cautat langa modul, indiferent de directorul curent
+FISIER_REGULI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reguli_fiscale.json')
+
+
+class RegulaFiscala:
+    def __init__(self, data_efectiva, cota_cas, cota_cass, cota_impozit, deducere=0.0, salar_minim=0.0):
+        # regula nu este modificata dupa creare; o schimbare de cote inseamna o regula noua
+        self.data_efectiva = data_efectiva
+        self.cota_cas = cota_cas
+        self.cota_cass = cota_cass
+        self.cota_impozit = cota_impozit
+        self.deducere = deducere
+        self.salar_minim = salar_minim
+        self.calcul = self._compilare()
+
+    def __repr__(self):
+        return (f'RegulaFiscala({self.data_efectiva.isoformat()}, cas={self.cota_cas}, cass={self.cota_cass}, '
+                f'impozit={self.cota_impozit}, deducere={self.deducere}, salar_minim={self.salar_minim})')
+
+    @classmethod
+    def din_dictionar(cls, item):
+        return cls(datetime.date.fromisoformat(item['data_efectiva']), float(item['cota_cas']), float(item['cota_cass']),
+                   float(item['cota_impozit']), float(item.get('deducere', 0)), float(item.get('salar_minim', 0)))
+
+    def dictionar(self):
+        return {
+            'data_efectiva': self.data_efectiva.isoformat(),
+            'cota_cas': self.cota_cas,
+            'cota_cass': self.cota_cass,
+            'cota_impozit': self.cota_impozit,
+            'deducere': self.deducere,
+            'salar_minim': self.salar_minim
+        }
+
+    def _compilare(self):
+        # cotele sunt legate ca variabile locale ale functiei returnate; ordinea operatiilor
+        # este aceeasi in toate implementarile calculului, deci rezultatele sunt identice
+        cota_cas, cota_cass, cota_impozit, deducere = self.cota_cas, self.cota_cass, self.cota_impozit, self.deducere
+
+        def calcul(salar):
+            cas = cota_cas * salar
+            cass = cota_cass * salar
+            baza = salar - cas - cass
+            impozit = max(baza - deducere, 0.0) * cota_impozit
+            return cas, cass, impozit, baza - impozit
+
+        return calcul
+
+
+class MotorFiscal:
+    def __init__(self, reguli=()):
+        # regulile sunt pastrate ordonate dupa data efectiva, pentru cautare binara
+        self._date = []
+        self._reguli = []
+        for regula in reguli:
+            self.adaugare(regula)
+
+    def __len__(self):
+        return len(self._reguli)
+
+    def __iter__(self):
+        return iter(self._reguli)
+
+    def adaugare(self, regula):
+        # o regula cu aceeasi data efectiva o inlocuieste pe cea existenta
+        pozitie = bisect.bisect_left(self._date, regula.data_efectiva)
+        if pozitie < len(self._date) and self._date[pozitie] == regula.data_efectiva:
+            self._reguli[pozitie] = regula
+        else:
+            self._date.insert(pozitie, regula.data_efectiva)
+            self._reguli.insert(pozitie, regula)
+
+    def regula(self, data=None):
+        # returneaza regula in vigoare la data primita (implicit data curenta)
+        data = data or datetime.date.today()
+        pozitie = bisect.bisect_right(self._date, data)
+        if not pozitie:
+            raise ValueError(f'Nu exista nicio regula fiscala in vigoare la data {data.isoformat()}!')
+        return self._reguli[pozitie - 1]
+
+
+REGULA_IMPLICITA = RegulaFiscala(datetime.date(2000, 1, 1), 0.1, 0.25, 0.1, 0.0, 4050)
+
+
+def incarcare_reguli(cale=FISIER_REGULI):
+    '''Creeaza motorul fiscal cu regulile din fisierul de configurare. Daca fisierul nu exista,
+    motorul contine numai regula implicita.
+
+    Arguments:
+    cale: str -> calea fisierului JSON cu regulile fiscale
+
+    Returns:
+    motor: MotorFiscal -> motorul cu regulile citite
+
+    Raises:
+    ValueError -> daca fisierul nu contine o lista valida de reguli
+    '''
+
+    if not os.path.exists(cale):
+        return MotorFiscal([REGULA_IMPLICITA])
+
+    with open(cale, 'r') as fisier:
+        try:
+            return MotorFiscal([RegulaFiscala.din_dictionar(item) for item in json.load(fisier)])
+        except (KeyError, TypeError) as exception:
+            raise ValueError(f'Fisierul {cale} nu contine reguli fiscale valide! Eroare: {exception}')
+
+
+def data_luna(text):
+    '''Transforma o luna de forma AAAA-LL in data primei zile a lunii
+
+    Arguments:
+    text: str -> luna, de exemplu 2025-03
+
+    Returns:
+    datetime.date -> prima zi a lunii
+
+    Raises:
+    ValueError -> daca textul nu este o luna valida
+    '''
+
+    an, luna = text.split('-')
+    return datetime.date(int(an), int(luna), 1)
+
+
+motor_fiscal = None
+
+
+def obtinere_motor_fiscal():
+    '''Returneaza motorul fiscal al aplicatiei, creat din fisierul de configurare la primul apel
+
+    Arguments:
+    None
+
+    Returns:
+    motor: MotorFiscal -> motorul cu regulile in vigoare
+
+    Raises:
+    ValueError -> daca fisierul nu contine o lista valida de reguli
+    '''
+
+    global motor_fiscal
+    if motor_fiscal is None:
+        motor_fiscal = incarcare_reguli()
+    return motor_fiscal
+
+
+def regula_curenta(data=None):
+    '''Returneaza regula fiscala in vigoare la data primita, din motorul fiscal al aplicatiei
+
+    Arguments:
+    data: datetime.date -> data pentru care se cauta regula (implicit data curenta)
+
+    Returns:
+    RegulaFiscala -> regula in vigoare
+    '''
+
+    return obtinere_motor_fiscal().regula(data)
+
+
+def salar_minim_curent():
+    '''Returneaza salarul minim pe economie folosit la validarea datelor introduse. Daca nicio regula
+    din configurare nu este in vigoare la data curenta (de exemplu, fisierul contine numai reguli
+    viitoare), se foloseste salarul minim din regula implicita.
+
+    Arguments:
+    None
+
+    Returns:
+    float -> salarul minim pe economie
+    '''
+
+    try:
+        return regula_curenta().salar_minim
+    except ValueError:
+        return REGULA_IMPLICITA.salar_minim
@@ -0,0 +1,163 @@
+'''Calculul fluturasilor de salar.
+
+Modulul contine:
+- calculul contributiilor (CAS, CASS), al impozitului si al salarului net pentru un angajat
+- calculul pe lot, intr-o singura trecere peste coloana de salarii, pentru toti angajatii
+- salvarea tabelului de fluturasi intr-un fisier CSV
+- un cache LRU pentru fluturasii calculati pe angajat, invalidat la modificarea salarului sau a regulii fiscale
+
+Cotele folosite sunt cele ale regulii fiscale in vigoare (vezi reguli_fiscale.py), daca
+nu este primita explicit o alta regula.
+
+Daca biblioteca numpy este instalata, calculul pe lot este vectorizat cu numpy,
+altfel este realizat cu tablouri array din biblioteca standard.
+'''
+
+
+import csv
+import operator
+import threading
+from array import array
+from collections import OrderedDict
+from itertools import repeat
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from reguli_fiscale import regula_curenta
+
+
+COLOANE_FLUTURAS = ('brut', 'cas', 'cass', 'impozit', 'net')
+
+
+def calcul_fluturas(salar, regula=None):
+    '''Calculeaza contributiile, impozitul si salarul net pentru un salar brut
+
+    Arguments:
+    salar: float -> salarul brut
+    regula: RegulaFiscala -> regula fiscala aplicata (implicit cea in vigoare la data curenta)
+
+    Returns:
+    Tuple -> (cas, cass, impozit, net)
+    '''
+
+    return (regula or regula_curenta()).calcul(salar)
+
+
+def calcul_fluturasi(salarii, regula=None):
+    '''Calculeaza fluturasii pentru toate salariile primite, intr-o singura trecere
+    peste coloana de salarii. Regula fiscala este citita o singura data pentru tot lotul,
+    iar rezultatele sunt identice cu cele ale functiei calcul_fluturas.
+
+    Arguments:
+    salarii: array('d') sau secventa de float -> salariile brute
+    regula: RegulaFiscala -> regula fiscala aplicata (implicit cea in vigoare la data curenta)
+
+    Returns:
+    tabel: Dict -> pentru fiecare coloana din COLOANE_FLUTURAS, valorile pe fiecare rand
+    '''
+
+    regula = regula or regula_curenta()
+    cota_cas, cota_cass, cota_impozit, deducere = regula.cota_cas, regula.cota_cass, regula.cota_impozit, regula.deducere
+
+    if numpy is not None:
+        # se lucreaza pe o copie, pentru ca tabloul sursa sa poata fi modificat in continuare
+        brut = numpy.array(salarii, dtype=numpy.float64)
+        cas = cota_cas * brut
+        cass = cota_cass * brut
+        baza = brut - cas - cass
+        impozit = numpy.maximum(baza - deducere, 0.0) * cota_impozit
+        net = baza - impozit
+    else:
+        # fiecare coloana este calculata cu map peste operatori nativi, fara bucle Python explicite;
+        # ordinea operatiilor este aceeasi ca in RegulaFiscala.calcul, deci rezultatele sunt identice
+        brut = array('d', salarii)
+        cas = array('d', map(cota_cas.__mul__, brut))
+        cass = array('d', map(cota_cass.__mul__, brut))
+        baza = array('d', map(operator.sub, map(operator.sub, brut, cas), cass))
+        impozabil = map(max, map(operator.sub, baza, repeat(deducere)), repeat(0.0))
+        impozit = array('d', map(cota_impozit.__rmul__, impozabil))
+        net = array('d', map(operator.sub, baza, impozit))
+
+    return {'brut': brut, 'cas': cas, 'cass': cass, 'impozit': impozit, 'net': net}
+
+
+def salvare_fluturasi_csv(tabel, cale):
+    '''Scrie tabelul de fluturasi intr-un fisier CSV, cu un rand pentru fiecare angajat
+
+    Arguments:
+    tabel: Dict -> tabelul returnat de calcul_fluturasi, completat cu coloana 'cnp'
+    cale: str -> calea fisierului CSV
+
+    Returns:
+    None
+    '''
+
+    coloane = ('cnp',) + COLOANE_FLUTURAS
+    with open(cale, 'w', newline='') as fisier:
+        writer = csv.writer(fisier)
+        writer.writerow(coloane)
+        writer.writerows(zip(*(tabel[coloana] for coloana in coloane)))
+
+
+
+class CacheFluturasi:
+    '''Cache LRU pentru fluturasii calculati pe angajat. O intrare este folosita numai daca
+    salarul angajatului si regula fiscala sunt aceleasi ca la calcul; la depasirea marimii
+    maxime este eliminata intrarea folosita cel mai de demult.
+    '''
+
+    def __init__(self, marime_maxima=10000):
+        self.marime_maxima = marime_maxima
+        self._intrari = OrderedDict()
+        # cache-ul poate fi folosit din mai multe fire (de exemplu in modul concurent al firmei)
+        self._blocare = threading.Lock()
+        self.hituri = 0
+        self.ratari = 0
+        self.eliminari = 0
+        self.invalidari = 0
+
+    def __len__(self):
+        return len(self._intrari)
+
+    def obtinere(self, cnp, salar, regula=None):
+        # regulile fiscale nu sunt modificate dupa creare, deci o regula noua inseamna alt obiect
+        regula = regula or regula_curenta()
+        with self._blocare:
+            intrare = self._intrari.get(cnp)
+            if intrare is not None and intrare[0] == salar and intrare[1] is regula:
+                self.hituri += 1
+                self._intrari.move_to_end(cnp)
+                return intrare[2]
+
+            self.ratari += 1
+            fluturas = regula.calcul(salar)
+            self._intrari[cnp] = (salar, regula, fluturas)
+            self._intrari.move_to_end(cnp)
+            if len(self._intrari) > self.marime_maxima:
+                self._intrari.popitem(last=False)
+                self.eliminari += 1
+            return fluturas
+
+    def invalidare(self, cnp):
+        with self._blocare:
+            if self._intrari.pop(cnp, None) is not None:
+                self.invalidari += 1
+
+    def golire(self):
+        with self._blocare:
+            self.invalidari += len(self._intrari)
+            self._intrari.clear()
+
+    def statistici(self):
+        with self._blocare:
+            return {
+                'marime': len(self._intrari),
+                'marime_maxima': self.marime_maxima,
+                'hituri': self.hituri,
+                'ratari': self.ratari,
+                'eliminari': self.eliminari,
+                'invalidari': self.invalidari
+            }
@@ -0,0 +1,366 @@
+'''Serviciu HTTP/JSON local pentru gestiunea angajatilor.
+
+Serviciul expune operatiile clasei Companie pe localhost:
+- GET    /angajati/<cnp>                    -> datele unui angajat
+- GET    /angajati?departament=&senioritate=&limita=&deplasare=
+                                            -> lista angajatilor, in format JSON Lines
+- GET    /cost?departament=                 -> costul total al salariilor
+- GET    /statistici                        -> statisticile salariilor
+- GET    /fluturas/<cnp>                    -> fluturasul de salar al unui angajat
+- GET    /cache                             -> contoarele cache-ului de fluturasi
+- POST   /angajati                          -> adaugarea unui angajat
+- PUT    /angajati/<cnp>                    -> modificarea unui angajat
+- DELETE /angajati/<cnp>                    -> stergerea unui angajat
+
+Cererile sunt tratate intr-o singura bucla asyncio. Citirile scurte se executa fara
+intrerupere, deci pot rula oricate in paralel; listele sunt trimise pe bucati, cu
+transfer chunked, iar pe durata trimiterii tin o blocare de citire. Modificarile iau
+blocarea de scriere, astfel incat sunt executate pe rand si nu modifica firma in timpul
+trimiterii unei liste.
+
+Utilizare:
+python serviciu.py --port 8080
+python serviciu.py --port 8080 --stocare sqlite
+'''
+
+
+import argparse
+import asyncio
+import contextlib
+import json
+from itertools import islice
+from urllib.parse import parse_qs, urlsplit
+
+from afisare import formatare_jsonl
+from import_export import validare_inregistrare
+from management_angajati import CAMPURI_ANGAJAT, Angajat, Companie, adaugare_argumente_stocare, cale_date_argumente
+
+
+GAZDA = '127.0.0.1'
+PORT = 8080
+MARIME_BUCATA = 500
+LUNGIME_MAXIMA_CORP = 1 << 20
+
+_MESAJE_STARE = {
+    200: 'OK',
+    201: 'Created',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    409: 'Conflict',
+    413: 'Content Too Large',
+    431: 'Request Header Fields Too Large',
+    500: 'Internal Server Error'
+}
+
+
+class EroareCerere(Exception):
+    def __init__(self, stare, mesaj):
+        super().__init__(mesaj)
+        self.stare = stare
+        self.mesaj = mesaj
+
+
+class RaspunsIntrerupt(Exception):
+    # antetul raspunsului a fost deja trimis, deci eroarea nu mai poate fi raportata prin stare
+    pass
+
+
+class BlocareCitireScriere:
+    def __init__(self):
+        # scriitorii care asteapta au prioritate, astfel incat un sir continuu de liste sa nu blocheze modificarile
+        self._conditie = asyncio.Condition()
+        self._cititori = 0
+        self._scriitor = False
+        self._scriitori_in_asteptare = 0
+
+
+    @contextlib.asynccontextmanager
+    async def citire(self):
+        async with self._conditie:
+            await self._conditie.wait_for(lambda: not self._scriitor and not self._scriitori_in_asteptare)
+            self._cititori += 1
+        try:
+            yield
+        finally:
+            async with self._conditie:
+                self._cititori -= 1
+                if not self._cititori:
+                    self._conditie.notify_all()
+
+
+    @contextlib.asynccontextmanager
+    async def scriere(self):
+        async with self._conditie:
+            self._scriitori_in_asteptare += 1
+            try:
+                await self._conditie.wait_for(lambda: not self._scriitor and not self._cititori)
+            finally:
+                self._scriitori_in_asteptare -= 1
+            self._scriitor = True
+        try:
+            yield
+        finally:
+            async with self._conditie:
+                self._scriitor = False
+                self._conditie.notify_all()
+
+
+class Serviciu:
+    def __init__(self, companie, marime_bucata=MARIME_BUCATA):
+        self.companie = companie
+        self.marime_bucata = marime_bucata
+        self._blocare = BlocareCitireScriere()
+
+
+    async def trateaza_conexiune(self, reader, writer):
+        # conexiunile raman deschise intre cereri (HTTP/1.1 keep-alive)
+        try:
+            while True:
+                try:
+                    cerere = await self._citire_cerere(reader)
+                except EroareCerere as eroare:
+                    # dupa o cerere care nu a putut fi citita, restul datelor din conexiune nu mai pot fi interpretate
+                    self._raspuns_json(writer, eroare.stare, {'eroare': eroare.mesaj})
+                    await writer.drain()
+                    break
+                if cerere is None:
+                    break
+                metoda, cale, parametri, corp, pastrare = cerere
+                try:
+                    await self._rutare(writer, metoda, cale, parametri, corp)
+                except EroareCerere as eroare:
+                    self._raspuns_json(writer, eroare.stare, {'eroare': eroare.mesaj})
+                except RaspunsIntrerupt:
+                    # clientul primeste un raspuns chunked fara bucata finala, deci il recunoaste ca incomplet
+                    break
+                except Exception as exception:
+                    # orice alta eroare este raportata clientului, iar serviciul continua
+                    print(f'Eroare la tratarea cererii {metoda} {cale}: {exception!r}')
+                    self._raspuns_json(writer, 500, {'eroare': 'Eroare interna a serviciului'})
+                    pastrare = False
+                await writer.drain()
+                if not pastrare:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+
+    async def _citire_linie(self, reader, stare, mesaj):
+        # o linie mai lunga decat limita bufferului este raportata cu starea si mesajul primite
+        try:
+            return await reader.readline()
+        except (ValueError, asyncio.LimitOverrunError):
+            raise EroareCerere(stare, mesaj)
+
+
+    async def _citire_cerere(self, reader):
+        # returneaza None daca clientul a inchis conexiunea; o cerere invalida ridica EroareCerere
+        linie = await self._citire_linie(reader, 400, 'Linia de cerere este prea lunga')
+        if not linie:
+            return None
+        try:
+            metoda, tinta, versiune = linie.decode('latin-1').split()
+        except ValueError:
+            raise EroareCerere(400, 'Linia de cerere nu este valida')
+
+        antete = {}
+        while True:
+            linie = await self._citire_linie(reader, 431, 'Un antet al cererii este prea lung')
+            if linie in (b'\r\n', b'\n', b''):
+                break
+            nume, _, valoare = linie.decode('latin-1').partition(':')
+            antete[nume.strip().lower()] = valoare.strip()
+
+        try:
+            lungime = int(antete.get('content-length', 0) or 0)
+        except ValueError:
+            raise EroareCerere(400, 'Antetul Content-Length nu este valid')
+        if lungime < 0:
+            raise EroareCerere(400, 'Antetul Content-Length nu este valid')
+        if lungime > LUNGIME_MAXIMA_CORP:
+            raise EroareCerere(413, 'Corpul cererii este prea mare')
+        corp = await reader.readexactly(lungime) if lungime else b''
+
+        conexiune = antete.get('connection', '').lower()
+        pastrare = conexiune != 'close' if versiune == 'HTTP/1.1' else conexiune == 'keep-alive'
+        adresa = urlsplit(tinta)
+        parametri = {cheie: valori[-1] for cheie, valori in parse_qs(adresa.query).items()}
+        return metoda.upper(), adresa.path.rstrip('/') or '/', parametri, corp, pastrare
+
+
+    async def _rutare(self, writer, metoda, cale, parametri, corp):
+        parti = cale.strip('/').split('/')
+        resursa, cnp = parti[0], '/'.join(parti[1:]) or None
+
+        if resursa == 'angajati' and cnp is None:
+            if metoda == 'GET':
+                await self._listare(writer, parametri)
+            elif metoda == 'POST':
+                await self._adaugare(writer, corp)
+            else:
+                raise EroareCerere(405, f'Metoda {metoda} nu este permisa')
+        elif resursa == 'angajati':
+            if metoda == 'GET':
+                self._raspuns_json(writer, 200, self._gasire_angajat(cnp).dictionar())
+            elif metoda == 'PUT':
+                await self._modificare(writer, cnp, corp)
+            elif metoda == 'DELETE':
+                await self._stergere(writer, cnp)
+            else:
+                raise EroareCerere(405, f'Metoda {metoda} nu este permisa')
+        elif metoda != 'GET':
+            raise EroareCerere(405, f'Metoda {metoda} nu este permisa')
+        elif resursa == 'cost' and cnp is None:
+            departament = parametri.get('departament')
+            self._raspuns_json(writer, 200, {'departament': departament, 'total': self.companie.cost_salarii(departament)})
+        elif resursa == 'statistici' and cnp is None:
+            self._raspuns_json(writer, 200, self.companie.statistici_salarii())
+        elif resursa == 'cache' and cnp is None:
+            self._raspuns_json(writer, 200, self.companie.cache_fluturasi.statistici())
+        elif resursa == 'fluturas' and cnp is not None:
+            angajat = self._gasire_angajat(cnp)
+            cas, cass, impozit, net = self.companie.cache_fluturasi.obtinere(cnp, angajat.salar)
+            self._raspuns_json(writer, 200, {'cnp': cnp, 'brut': angajat.salar, 'cas': cas, 'cass': cass, 'impozit': impozit, 'net': net})
+        else:
+            raise EroareCerere(404, f'Resursa {cale} nu exista')
+
+
+    def _gasire_angajat(self, cnp):
+        angajat = self.companie.obtinere_angajat(cnp)
+        if angajat is None:
+            raise EroareCerere(404, f'Angajatul cu CNP-ul {cnp} nu a fost gasit')
+        return angajat
+
+
+    async def _listare(self, writer, parametri):
+        try:
+            limita = int(parametri['limita']) if 'limita' in parametri else None
+            deplasare = int(parametri.get('deplasare', 0))
+        except ValueError:
+            raise EroareCerere(400, 'Parametrii limita si deplasare trebuie sa fie numere intregi')
+        if deplasare < 0 or (limita is not None and limita < 0):
+            raise EroareCerere(400, 'Parametrii limita si deplasare nu pot fi negativi')
+
+        async with self._blocare.citire():
+            angajati = self.companie.selectare_angajati(parametri.get('departament'), parametri.get('senioritate'))
+            stop = deplasare + limita if limita is not None else None
+            selectie = islice(angajati, deplasare, stop)
+
+            writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nTransfer-Encoding: chunked\r\n\r\n')
+            try:
+                while True:
+                    bucata = ''.join(formatare_jsonl(angajat.dictionar()) for angajat in islice(selectie, self.marime_bucata))
+                    if not bucata:
+                        break
+                    date = bucata.encode('utf-8')
+                    writer.write(b'%x\r\n%b\r\n' % (len(date), date))
+                    # intre bucati sunt servite si alte cereri
+                    await writer.drain()
+            except ConnectionError:
+                raise
+            except Exception as exception:
+                print(f'Eroare la trimiterea listei de angajati: {exception!r}')
+                raise RaspunsIntrerupt() from exception
+            writer.write(b'0\r\n\r\n')
+
+
+    def _citire_angajat(self, corp):
+        try:
+            item = json.loads(corp)
+        except ValueError:
+            raise EroareCerere(400, 'Corpul cererii nu este un obiect JSON valid')
+        valori, erori = validare_inregistrare(item)
+        if erori:
+            raise EroareCerere(400, '; '.join(erori))
+        return Angajat.din_dictionar(dict(zip(CAMPURI_ANGAJAT, valori)))
+
+
+    async def _adaugare(self, writer, corp):
+        angajat = self._citire_angajat(corp)
+        async with self._blocare.scriere():
+            try:
+                self.companie.adaugare_angajat(angajat)
+            except ValueError:
+                raise EroareCerere(409, f'Exista deja un angajat cu CNP-ul {angajat.cnp}')
+        self._raspuns_json(writer, 201, angajat.dictionar())
+
+
+    async def _modificare(self, writer, cnp, corp):
+        angajat = self._citire_angajat(corp)
+        if angajat.cnp != cnp:
+            raise EroareCerere(400, 'CNP-ul din corpul cererii nu corespunde cu cel din adresa')
+        async with self._blocare.scriere():
+            try:
+                self.companie.modificare_angajat(angajat)
+            except KeyError:
+                raise EroareCerere(404, f'Angajatul cu CNP-ul {cnp} nu a fost gasit')
+        self._raspuns_json(writer, 200, angajat.dictionar())
+
+
+    async def _stergere(self, writer, cnp):
+        async with self._blocare.scriere():
+            try:
+                angajat = self.companie.stergere_angajat(cnp)
+            except KeyError:
+                raise EroareCerere(404, f'Angajatul cu CNP-ul {cnp} nu a fost gasit')
+        self._raspuns_json(writer, 200, angajat.dictionar())
+
+
+    def _raspuns_json(self, writer, stare, continut):
+        corp = json.dumps(continut, ensure_ascii=False).encode('utf-8')
+        writer.write(b'HTTP/1.1 %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%b'
+                     % (stare, _MESAJE_STARE[stare].encode('ascii'), len(corp), corp))
+
+
+async def pornire_serviciu(companie, gazda=GAZDA, port=PORT):
+    '''Porneste serviciul HTTP pentru firma primita
+
+    Arguments:
+    companie: Companie -> firma ale carei operatii sunt expuse
+    gazda: str -> adresa pe care asculta serviciul
+    port: int -> portul pe care asculta serviciul
+
+    Returns:
+    asyncio.Server -> serverul pornit
+    '''
+
+    serviciu = Serviciu(companie)
+    return await asyncio.start_server(serviciu.trateaza_conexiune, gazda, port)
+
+
+async def _rulare(companie, gazda, port):
+    server = await pornire_serviciu(companie, gazda, port)
+    print(f'Serviciul asculta pe http://{gazda}:{port}')
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serviciu HTTP/JSON pentru gestiunea angajatilor')
+    parser.add_argument('--gazda', default=GAZDA, help='adresa pe care asculta serviciul')
+    parser.add_argument('--port', type=int, default=PORT, help='portul pe care asculta serviciul')
+    adaugare_argumente_stocare(parser)
+    argumente = parser.parse_args()
+    try:
+        cale_date = cale_date_argumente(argumente)
+    except ValueError as exception:
+        parser.error(str(exception))
+
+    companie = Companie(jurnal=True, cale_date=cale_date)
+    companie.initializare()
+    try:
+        asyncio.run(_rulare(companie, argumente.gazda, argumente.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        companie.salvare_informatii()
+        print('Serviciul a fost oprit.')
+
+
+if __name__ == '__main__':
+    main()
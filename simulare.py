@@ -0,0 +1,218 @@
+'''Simularea modificarilor de salar pentru toata firma.
+
+Modulul contine:
+- regula de modificare a salarului: o marire procentuala si/sau o suma fixa, aplicata
+  angajatilor dintr-un departament si/sau cu o anumita senioritate
+- scenariul: o lista de reguli de modificare aplicate in ordine, cu o regula fiscala optionala
+- simularea: o suprapunere virtuala peste coloanele de salarii ale firmei, care evalueaza
+  mai multe scenarii deodata, fara a modifica datele reale
+
+Regulile unui scenariu depind numai de departament si senioritate, deci pentru fiecare
+combinatie (departament, senioritate) efectul lor se reduce la salar * factor + adaos.
+Salariile noi sunt obtinute astfel intr-o singura trecere peste coloana de salarii, iar
+fluturasii tuturor scenariilor care folosesc aceeasi regula fiscala sunt calculati
+printr-un singur apel calcul_fluturasi.
+
+Exemplu (marire de 7% pentru seniorii din IT):
+scenariu = Scenariu('IT senior +7%', [RegulaSalar(procent=7, departament='IT', senioritate='senior')])
+rezultate = companie.simulare_salarii([scenariu])
+'''
+
+
+import operator
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from reguli_fiscale import regula_curenta
+from salarizare import calcul_fluturasi
+
+
+SCENARIU_BAZA = 'baza'
+
+
+class RegulaSalar:
+    def __init__(self, procent=0.0, suma=0.0, departament=None, senioritate=None):
+        # departament / senioritate None inseamna ca regula se aplica tuturor angajatilor
+        self.procent = procent
+        self.suma = suma
+        self.departament = departament
+        self.senioritate = senioritate
+
+    def __repr__(self):
+        return (f'RegulaSalar(procent={self.procent}, suma={self.suma}, departament={self.departament}, '
+                f'senioritate={self.senioritate})')
+
+    def se_aplica(self, departament, senioritate):
+        return (self.departament is None or self.departament == departament) and \
+            (self.senioritate is None or self.senioritate == senioritate)
+
+    def aplicare(self, factor, adaos):
+        # compunerea cu transformarea de pana acum: (salar * factor + adaos) * (1 + procent / 100) + suma
+        multiplicator = 1 + self.procent / 100
+        return factor * multiplicator, adaos * multiplicator + self.suma
+
+
+class Scenariu:
+    def __init__(self, nume, reguli_salar=(), regula_fiscala=None):
+        # fara regula fiscala explicita se foloseste regula in vigoare la data simularii
+        self.nume = nume
+        self.reguli_salar = list(reguli_salar)
+        self.regula_fiscala = regula_fiscala
+
+    def __repr__(self):
+        return f'Scenariu({self.nume!r}, {self.reguli_salar}, regula_fiscala={self.regula_fiscala})'
+
+
+class SimulareSalarii:
+    def __init__(self, salarii, departamente, senioritati, valori_departament, valori_senioritate):
+        # suprapunerea pastreaza o copie a coloanelor; salariile simulate nu ajung niciodata in firma
+        self.salarii = array('d', salarii)
+        self.valori_departament = list(valori_departament)
+        self.valori_senioritate = list(valori_senioritate)
+        self.departamente = array('H', departamente)
+        # fiecare rand primeste codul combinatiei (departament, senioritate) din care face parte
+        numar_senioritati = len(self.valori_senioritate)
+        self.grupuri = array('H', map(operator.add, map(numar_senioritati.__mul__, self.departamente), senioritati))
+
+    def __len__(self):
+        return len(self.salarii)
+
+    @classmethod
+    def din_angajati(cls, angajati):
+        # coloanele sunt construite intr-o singura trecere peste angajati
+        salarii = array('d')
+        departamente = array('H')
+        senioritati = array('H')
+        coduri_departament, valori_departament = {}, []
+        coduri_senioritate, valori_senioritate = {}, []
+        for angajat in angajati:
+            salarii.append(angajat.salar)
+            departamente.append(_codificare(angajat.departament, coduri_departament, valori_departament))
+            senioritati.append(_codificare(angajat.senioritate, coduri_senioritate, valori_senioritate))
+        return cls(salarii, departamente, senioritati, valori_departament, valori_senioritate)
+
+    def transformare(self, scenariu):
+        # returneaza factorul si adaosul pentru fiecare combinatie (departament, senioritate)
+        factori, adaosuri = array('d'), array('d')
+        for departament in self.valori_departament:
+            for senioritate in self.valori_senioritate:
+                factor, adaos = 1.0, 0.0
+                for regula in scenariu.reguli_salar:
+                    if regula.se_aplica(departament, senioritate):
+                        factor, adaos = regula.aplicare(factor, adaos)
+                factori.append(factor)
+                adaosuri.append(adaos)
+        return factori, adaosuri
+
+    def salarii_scenariu(self, scenariu):
+        # salariile simulate, rand cu rand; randurile neatinse de reguli raman identice cu cele reale
+        factori, adaosuri = self.transformare(scenariu)
+        if numpy is not None:
+            grupuri = numpy.frombuffer(self.grupuri, dtype=numpy.uint16)
+            salarii = numpy.frombuffer(self.salarii, dtype=numpy.float64)
+            return salarii * numpy.frombuffer(factori, dtype=numpy.float64)[grupuri] + \
+                numpy.frombuffer(adaosuri, dtype=numpy.float64)[grupuri]
+        return array('d', map(operator.add, map(operator.mul, self.salarii, map(factori.__getitem__, self.grupuri)),
+                              map(adaosuri.__getitem__, self.grupuri)))
+
+    def evaluare(self, scenarii, data=None):
+        # scenariile care folosesc aceeasi regula fiscala sunt evaluate impreuna: salariile lor sunt
+        # puse cap la cap si fluturasii sunt calculati printr-un singur apel pentru tot lotul
+        nume = [scenariu.nume for scenariu in scenarii]
+        if SCENARIU_BAZA in nume or len(set(nume)) != len(nume):
+            raise ValueError(f'Numele scenariilor trebuie sa fie unice si diferite de {SCENARIU_BAZA!r}!')
+
+        regula_implicita = regula_curenta(data)
+        loturi = {}
+        for scenariu in [Scenariu(SCENARIU_BAZA)] + list(scenarii):
+            regula = scenariu.regula_fiscala or regula_implicita
+            loturi.setdefault(id(regula), (regula, []))[1].append(scenariu)
+
+        totaluri = {}
+        for regula, scenarii_lot in loturi.values():
+            if numpy is not None:
+                salarii = numpy.concatenate([self.salarii_scenariu(scenariu) for scenariu in scenarii_lot])
+            else:
+                salarii = array('d')
+                for scenariu in scenarii_lot:
+                    salarii.extend(self.salarii_scenariu(scenariu))
+            tabel = calcul_fluturasi(salarii, regula)
+            for pozitie, scenariu in enumerate(scenarii_lot):
+                totaluri[scenariu.nume] = self._totaluri_departament(tabel, pozitie * len(self))
+
+        baza = self._rezultat(totaluri[SCENARIU_BAZA], None)
+        return {
+            SCENARIU_BAZA: baza,
+            'scenarii': {scenariu.nume: self._rezultat(totaluri[scenariu.nume], totaluri[SCENARIU_BAZA])
+                         for scenariu in scenarii}
+        }
+
+    def _totaluri_departament(self, tabel, start):
+        # returneaza (brut, net, angajati afectati) insumate pe fiecare departament, pentru randurile
+        # start .. start + len(self) din tabelul de fluturasi
+        stop = start + len(self)
+        numar_departamente = len(self.valori_departament)
+        if numpy is not None:
+            departamente = numpy.frombuffer(self.departamente, dtype=numpy.uint16)
+            brut = tabel['brut'][start:stop]
+            modificati = brut != numpy.frombuffer(self.salarii, dtype=numpy.float64)
+            return (numpy.bincount(departamente, weights=brut, minlength=numar_departamente).tolist(),
+                    numpy.bincount(departamente, weights=tabel['net'][start:stop], minlength=numar_departamente).tolist(),
+                    numpy.bincount(departamente, weights=modificati, minlength=numar_departamente).astype(int).tolist())
+
+        total_brut = [0.0] * numar_departamente
+        total_net = [0.0] * numar_departamente
+        modificati = [0] * numar_departamente
+        for departament, brut, net, salar in zip(self.departamente, tabel['brut'][start:stop], tabel['net'][start:stop],
+                                                 self.salarii):
+            total_brut[departament] += brut
+            total_net[departament] += net
+            modificati[departament] += brut != salar
+        return total_brut, total_net, modificati
+
+    def _rezultat(self, totaluri, totaluri_baza):
+        total_brut, total_net, modificati = totaluri
+        departamente = {}
+        for cod, departament in enumerate(self.valori_departament):
+            departamente[departament] = {'brut': total_brut[cod], 'net': total_net[cod]}
+        rezultat = {'brut': sum(total_brut), 'net': sum(total_net), 'departamente': departamente}
+
+        if totaluri_baza is not None:
+            baza_brut, baza_net, _ = totaluri_baza
+            rezultat['delta_brut'] = rezultat['brut'] - sum(baza_brut)
+            rezultat['delta_net'] = rezultat['net'] - sum(baza_net)
+            rezultat['angajati_afectati'] = sum(modificati)
+            for cod, date_departament in enumerate(departamente.values()):
+                date_departament['delta_brut'] = total_brut[cod] - baza_brut[cod]
+                date_departament['delta_net'] = total_net[cod] - baza_net[cod]
+                date_departament['angajati_afectati'] = modificati[cod]
+        return rezultat
+
+
+def _codificare(valoare, coduri, valori):
+    cod = coduri.get(valoare)
+    if cod is None:
+        cod = coduri[valoare] = len(valori)
+        valori.append(valoare)
+    return cod
+
+
+def simulare(angajati, scenarii, data=None):
+    '''Evalueaza mai multe scenarii de modificare a salariilor peste aceiasi angajati,
+    fara a modifica angajatii
+
+    Arguments:
+    angajati: Iterable -> angajatii firmei (obiecte Angajat)
+    scenarii: Lista de Scenariu -> scenariile evaluate
+    data: datetime.date -> data pentru care se aplica regula fiscala (implicit data curenta)
+
+    Returns:
+    rezultate: Dict -> totalurile brut si net ale firmei si ale fiecarui departament in situatia
+    actuala ('baza') si, pentru fiecare scenariu, totalurile simulate si diferentele fata de situatia actuala
+    '''
+
+    return SimulareSalarii.din_angajati(angajati).evaluare(scenarii, data)
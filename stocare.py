@@ -0,0 +1,728 @@
+'''Functii pentru stocarea datelor angajatilor.
+
+Modulul contine:
+- citirea incrementala a fisierului JSON folosit ca baza de date
+- salvarea fisierului JSON in format compact, scris pe bucati intr-un fisier temporar care este
+  sincronizat pe disc si apoi inlocuieste atomic fisierul existent
+- jurnalul in care sunt adaugate modificarile facute intre doua salvari
+- instantaneul binar al datelor, care poate fi deschis prin mmap fara a citi tot fisierul
+- indexul pozitiilor din fisierul JSON, prin care angajatii sunt cititi la cerere
+- depozitul SQLite, in care angajatii sunt cititi si modificati rand cu rand, fara a fi incarcati in memorie
+- depozitul fragmentat, in care angajatii sunt impartiti in fisiere JSON separate dupa departament sau
+  dupa un hash al CNP-ului, citite in paralel si rescrise numai daca s-au modificat
+'''
+
+
+import contextlib
+import json
+import mmap
+import os
+import re
+import sqlite3
+import struct
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+
+SPATII = re.compile(r'[ \t\n\r]*')
+CRITERII_FRAGMENTARE = ('departament', 'hash')
+FISIER_DESCRIERE_FRAGMENTE = 'fragmente.json'
+
+
+def citire_json_incrementala(cale, marime_bloc=1 << 16):
+    '''Parcurge tabloul JSON de pe primul nivel al fisierului si returneaza elementele
+    unul cate unul, pe masura ce sunt citite, fara a incarca tot fisierul in memorie
+
+    Arguments:
+    cale: str -> calea catre fisierul JSON
+    marime_bloc: int -> numarul de caractere citite din fisier la un pas
+
+    Returns:
+    Generator -> elementele tabloului, in ordinea din fisier
+
+    Raises:
+    json.JSONDecodeError -> daca fisierul nu contine un tablou JSON valid
+    '''
+
+    with open(cale, 'r') as fisier:
+        for _, _, element in _parcurgere_json(fisier, marime_bloc):
+            yield element
+
+
+def _parcurgere_json(fisier, marime_bloc):
+    # returneaza (inceput, sfarsit, element) pentru fiecare element al tabloului; pozitiile sunt
+    # numarate in caractere de la inceputul fisierului
+    decodor = json.JSONDecoder()
+    buffer = ''
+    # pozitia in fisier a primului caracter din buffer
+    baza = 0
+    pozitie = 0
+    sfarsit_fisier = False
+    # starile posibile: '[' - inceputul tabloului, 'primul' - primul element sau ']',
+    # ',' - separator sau ']', 'element' - un element dupa separator
+    stare = '['
+
+    while True:
+        pozitie = SPATII.match(buffer, pozitie).end()
+        if pozitie == len(buffer) and not sfarsit_fisier:
+            bloc = fisier.read(marime_bloc)
+            sfarsit_fisier = not bloc
+            baza += pozitie
+            buffer = buffer[pozitie:] + bloc
+            pozitie = 0
+            continue
+
+        if pozitie == len(buffer):
+            raise json.JSONDecodeError('Sfarsit neasteptat al fisierului', buffer, pozitie)
+
+        caracter = buffer[pozitie]
+        if stare == '[':
+            if caracter != '[':
+                raise json.JSONDecodeError('Fisierul trebuie sa contina un tablou', buffer, pozitie)
+            pozitie += 1
+            stare = 'primul'
+        elif caracter == ']' and stare in ('primul', ','):
+            pozitie = SPATII.match(buffer, pozitie + 1).end()
+            if pozitie != len(buffer) or fisier.read().strip():
+                raise json.JSONDecodeError('Date suplimentare dupa tablou', buffer, pozitie)
+            return
+        elif stare == ',':
+            if caracter != ',':
+                raise json.JSONDecodeError("Se astepta ',' sau ']'", buffer, pozitie)
+            pozitie += 1
+            stare = 'element'
+        else:
+            try:
+                element, sfarsit = decodor.raw_decode(buffer, pozitie)
+                # elementul este complet numai daca este urmat de separator sau de ']'
+                # (un numar poate fi trunchiat la capatul blocului, de exemplu '4050.2|5')
+                urmator = SPATII.match(buffer, sfarsit).end()
+                complet = sfarsit_fisier or (urmator < len(buffer) and buffer[urmator] in ',]')
+            except json.JSONDecodeError:
+                if sfarsit_fisier:
+                    raise
+                complet = False
+
+            if not complet:
+                bloc = fisier.read(marime_bloc)
+                sfarsit_fisier = not bloc
+                baza += pozitie
+                buffer = buffer[pozitie:] + bloc
+                pozitie = 0
+                continue
+
+            yield baza + pozitie, baza + sfarsit, element
+            pozitie = sfarsit
+            stare = ','
+
+
+def salvare_json_atomica(cale, inregistrari, marime_bucata=1000, sincronizare=True):
+    '''Salveaza inregistrarile intr-un fisier temporar, care inlocuieste apoi fisierul existent,
+    astfel incat o intrerupere in timpul scrierii sa nu afecteze datele salvate anterior.
+    Fiecare inregistrare este codificata compact, pe cate un rand, iar randurile sunt scrise
+    in bucati, fara a construi in memorie tot textul fisierului.
+
+    Arguments:
+    cale: str -> calea fisierului JSON
+    inregistrari: Iterable -> inregistrarile care sunt salvate (pot fi generate pe masura ce sunt scrise)
+    marime_bucata: int -> numarul de inregistrari scrise printr-un singur apel write
+    sincronizare: bool -> daca este True, fisierul este scris pe disc cu fsync inainte de inlocuire
+
+    Returns:
+    None
+    '''
+
+    codificator = json.JSONEncoder(separators=(',', ':'))
+    cale_temporara = cale + '.tmp'
+    try:
+        with open(cale_temporara, 'w') as json_file:
+            bucata = ['[']
+            separator = '\n'
+            for inregistrare in inregistrari:
+                bucata.append(separator)
+                bucata.append(codificator.encode(inregistrare))
+                separator = ',\n'
+                if len(bucata) >= 2 * marime_bucata:
+                    json_file.write(''.join(bucata))
+                    bucata.clear()
+            bucata.append('\n]\n')
+            json_file.write(''.join(bucata))
+            _finalizare_scriere(json_file, sincronizare)
+        _inlocuire_atomica(cale_temporara, cale, sincronizare)
+    except BaseException:
+        # fisierul existent ramane neatins; fisierul temporar incomplet este sters
+        with contextlib.suppress(OSError):
+            os.remove(cale_temporara)
+        raise
+
+
+def _finalizare_scriere(fisier, sincronizare):
+    fisier.flush()
+    if sincronizare:
+        os.fsync(fisier.fileno())
+
+
+def _inlocuire_atomica(cale_temporara, cale, sincronizare):
+    os.replace(cale_temporara, cale)
+    # redenumirea este pastrata dupa o cadere numai daca directorul este si el sincronizat
+    # (pe Windows directoarele nu pot fi deschise, iar os.replace este suficient)
+    if sincronizare and hasattr(os, 'O_DIRECTORY'):
+        descriptor = os.open(os.path.dirname(os.path.abspath(cale)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+
+class Jurnal:
+    '''Jurnal in care fiecare modificare este adaugata la sfarsitul fisierului, pe cate o linie.
+
+    O inregistrare are forma [operatie, date]. La compactare, jurnalul curent este mutat in
+    fisierul .vechi, care este sters dupa ce noul fisier cu datele complete a fost salvat.
+    '''
+
+    def __init__(self, cale, sincronizare=False):
+        self.cale = cale
+        self.cale_veche = cale + '.vechi'
+        # daca sincronizare este True, fiecare inregistrare este scrisa pe disc cu fsync
+        self.sincronizare = sincronizare
+        self.numar_inregistrari = 0
+        self._fisier = None
+
+    def adaugare(self, operatie, date):
+        self.adaugare_lot(operatie, [date])
+
+    def adaugare_lot(self, operatie, lista_date):
+        # toate inregistrarile lotului sunt scrise printr-o singura operatie de scriere
+        if self._fisier is None:
+            self._fisier = open(self.cale, 'a', encoding='utf-8')
+        self._fisier.write(''.join(json.dumps([operatie, date], separators=(',', ':')) + '\n' for date in lista_date))
+        self._fisier.flush()
+        if self.sincronizare:
+            os.fsync(self._fisier.fileno())
+        self.numar_inregistrari += len(lista_date)
+
+    def citire(self):
+        # se citeste intai jurnalul ramas de la o compactare neterminata, apoi jurnalul curent
+        self.numar_inregistrari = 0
+        for cale in (self.cale_veche, self.cale):
+            if not os.path.exists(cale):
+                continue
+            with open(cale, 'r', encoding='utf-8') as fisier:
+                linii = fisier.readlines()
+            for numar_linie, linie in enumerate(linii):
+                try:
+                    operatie, date = json.loads(linie)
+                except json.JSONDecodeError:
+                    # ultima linie poate fi incompleta daca programul s-a oprit in timpul scrierii
+                    if numar_linie == len(linii) - 1:
+                        break
+                    raise
+                if cale == self.cale:
+                    self.numar_inregistrari += 1
+                yield operatie, date
+
+    def rotire(self):
+        self.inchidere()
+        if not os.path.exists(self.cale):
+            return
+        if os.path.exists(self.cale_veche):
+            # o compactare anterioara nu s-a terminat, deci jurnalul vechi trebuie pastrat
+            with open(self.cale, 'r', encoding='utf-8') as sursa, open(self.cale_veche, 'a', encoding='utf-8') as destinatie:
+                destinatie.write(sursa.read())
+            os.remove(self.cale)
+        else:
+            os.replace(self.cale, self.cale_veche)
+        self.numar_inregistrari = 0
+
+    def exista(self):
+        return any(os.path.exists(cale) and os.path.getsize(cale) for cale in (self.cale_veche, self.cale))
+
+    def exista_vechi(self):
+        # jurnalul vechi ramane numai daca o compactare nu s-a terminat
+        return os.path.exists(self.cale_veche)
+
+    def stergere_vechi(self):
+        if os.path.exists(self.cale_veche):
+            os.remove(self.cale_veche)
+
+    def inchidere(self):
+        if self._fisier is not None:
+            self._fisier.close()
+            self._fisier = None
+
+
+# Formatul instantaneului binar (valorile numerice sunt in ordinea nativa a octetilor):
+# - antet: semnatura, versiune, numarul de angajati, lungimea metadatelor
+# - metadate JSON: valorile codificate pentru departament si senioritate, agregatele salariale
+# - coloane, fiecare aliniata la 8 octeti:
+#   salarii (float64), deplasarile numelor in tabela de siruri (uint64, 2 * numar + 1),
+#   ordinea randurilor dupa CNP (uint32), CNP (13 octeti ASCII), varste, coduri departament
+#   si coduri senioritate (uint8), tabela de siruri cu numele si prenumele (UTF-8)
+SEMNATURA_BINAR = b'ANGB'
+VERSIUNE_BINAR = 1
+ANTET_BINAR = struct.Struct('<4sHHQQ')
+LUNGIME_CNP = 13
+
+
+def _aliniere(pozitie):
+    return (pozitie + 7) // 8 * 8
+
+
+def _dimensiuni_coloane(numar):
+    return [
+        ('salarii', 8 * numar),
+        ('deplasari', 8 * (2 * numar + 1)),
+        ('ordine', 4 * numar),
+        ('cnp', LUNGIME_CNP * numar),
+        ('varste', numar),
+        ('departamente', numar),
+        ('senioritati', numar)
+    ]
+
+
+def scriere_instantaneu_binar(cale, angajati, agregate):
+    '''Scrie instantaneul binar al angajatilor, printr-un fisier temporar care este sincronizat
+    pe disc si inlocuieste apoi fisierul existent
+
+    Arguments:
+    cale: str -> calea instantaneului binar
+    angajati: List -> angajatii firmei (obiecte cu atributele clasei Angajat)
+    agregate: Dict -> agregatele salariale, salvate in metadate
+
+    Returns:
+    None
+
+    Raises:
+    ValueError -> daca un CNP nu are exact 13 caractere ASCII
+    '''
+
+    numar = len(angajati)
+    coduri_departament = {}
+    coduri_senioritate = {}
+    cnp = bytearray()
+    salarii = array('d')
+    varste = array('B')
+    departamente = array('B')
+    senioritati = array('B')
+    deplasari = array('Q', [0])
+    siruri = bytearray()
+
+    for angajat in angajati:
+        cod_cnp = angajat.cnp.encode('ascii')
+        if len(cod_cnp) != LUNGIME_CNP:
+            raise ValueError(f'CNP-ul {angajat.cnp} nu poate fi salvat in instantaneul binar!')
+        cnp += cod_cnp
+        salarii.append(angajat.salar)
+        varste.append(int(angajat.varsta))
+        departamente.append(coduri_departament.setdefault(angajat.departament, len(coduri_departament)))
+        senioritati.append(coduri_senioritate.setdefault(angajat.senioritate, len(coduri_senioritate)))
+        siruri += angajat.nume.encode('utf-8')
+        deplasari.append(len(siruri))
+        siruri += angajat.prenume.encode('utf-8')
+        deplasari.append(len(siruri))
+
+    ordine = array('I', sorted(range(numar), key=lambda rand: cnp[LUNGIME_CNP * rand:LUNGIME_CNP * (rand + 1)]))
+    metadate = json.dumps({
+        'departamente': list(coduri_departament),
+        'senioritati': list(coduri_senioritate),
+        'agregate': agregate
+    }).encode('utf-8')
+
+    cale_temporara = cale + '.tmp'
+    try:
+        with open(cale_temporara, 'wb') as fisier:
+            fisier.write(ANTET_BINAR.pack(SEMNATURA_BINAR, VERSIUNE_BINAR, 0, numar, len(metadate)))
+            fisier.write(metadate)
+            for coloana in (salarii, deplasari, ordine, cnp, varste, departamente, senioritati, siruri):
+                fisier.write(bytes(_aliniere(fisier.tell()) - fisier.tell()))
+                fisier.write(coloana)
+            _finalizare_scriere(fisier, True)
+        _inlocuire_atomica(cale_temporara, cale, True)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(cale_temporara)
+        raise
+
+
+class InstantaneuBinar:
+    '''Instantaneu binar deschis prin mmap. Deschiderea citeste numai antetul si metadatele,
+    iar randurile sunt decodate la cerere, astfel incat timpul de deschidere nu depinde de
+    numarul de angajati.
+    '''
+
+    def __init__(self, cale):
+        self._fisier = open(cale, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._fisier.fileno(), 0, access=mmap.ACCESS_READ)
+            semnatura, versiune, _, self.numar, lungime_metadate = ANTET_BINAR.unpack_from(self._mmap, 0)
+            if semnatura != SEMNATURA_BINAR or versiune != VERSIUNE_BINAR:
+                raise ValueError('Fisierul nu este un instantaneu binar al angajatilor!')
+            metadate = json.loads(self._mmap[ANTET_BINAR.size:ANTET_BINAR.size + lungime_metadate])
+        except Exception:
+            self.inchidere()
+            raise
+
+        self.departamente = metadate['departamente']
+        self.senioritati = metadate['senioritati']
+        self.agregate = metadate['agregate']
+
+        self._vederi = [memoryview(self._mmap)]
+        pozitie = ANTET_BINAR.size + lungime_metadate
+        coloane = {}
+        for nume, dimensiune in _dimensiuni_coloane(self.numar):
+            pozitie = _aliniere(pozitie)
+            coloane[nume] = self._vederi[0][pozitie:pozitie + dimensiune]
+            pozitie += dimensiune
+        pozitie = _aliniere(pozitie)
+        coloane['siruri'] = self._vederi[0][pozitie:]
+
+        self.salarii = coloane['salarii'].cast('d')
+        self._deplasari = coloane['deplasari'].cast('Q')
+        self._ordine = coloane['ordine'].cast('I')
+        self._cnp = coloane['cnp']
+        self.varste = coloane['varste']
+        self.coduri_departament = coloane['departamente']
+        self.coduri_senioritate = coloane['senioritati']
+        self._siruri = coloane['siruri']
+        self._vederi += list(coloane.values()) + [self.salarii, self._deplasari, self._ordine]
+
+    def __len__(self):
+        return self.numar
+
+    def cnp(self, rand):
+        return bytes(self._cnp[LUNGIME_CNP * rand:LUNGIME_CNP * (rand + 1)]).decode('ascii')
+
+    def valori(self, rand):
+        # returneaza campurile angajatului in ordinea parametrilor clasei Angajat
+        deplasari = self._deplasari
+        return (
+            bytes(self._siruri[deplasari[2 * rand]:deplasari[2 * rand + 1]]).decode('utf-8'),
+            bytes(self._siruri[deplasari[2 * rand + 1]:deplasari[2 * rand + 2]]).decode('utf-8'),
+            self.cnp(rand),
+            str(self.varste[rand]),
+            self.salarii[rand],
+            self.departamente[self.coduri_departament[rand]],
+            self.senioritati[self.coduri_senioritate[rand]]
+        )
+
+    def cautare(self, cnp):
+        # cautare binara in ordinea randurilor dupa CNP; returneaza randul sau None
+        cheie = cnp.encode('ascii', 'replace')
+        stanga, dreapta = 0, self.numar
+        while stanga < dreapta:
+            mijloc = (stanga + dreapta) // 2
+            rand = self._ordine[mijloc]
+            if bytes(self._cnp[LUNGIME_CNP * rand:LUNGIME_CNP * (rand + 1)]) < cheie:
+                stanga = mijloc + 1
+            else:
+                dreapta = mijloc
+        if stanga < self.numar and self.cnp(self._ordine[stanga]) == cnp:
+            return self._ordine[stanga]
+        return None
+
+    def inchidere(self):
+        # vederile asupra fisierului trebuie eliberate inainte de inchiderea mmap
+        for vedere in reversed(getattr(self, '_vederi', [])):
+            vedere.release()
+        self._vederi = []
+        if getattr(self, '_mmap', None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._fisier.close()
+
+
+
+class IndexJSON:
+    '''Indexul pozitiilor angajatilor in fisierul JSON. La deschidere fisierul este parcurs o
+    singura data si sunt retinute numai CNP-ul si intervalul de octeti al fiecarui angajat,
+    impreuna cu agregatele salariilor; un angajat este decodat din fisier numai la cerere.
+
+    Interfata este aceeasi cu a clasei InstantaneuBinar, astfel incat ambele pot fi folosite
+    pentru servirea cautarilor inainte de incarcarea tuturor angajatilor.
+    '''
+
+    def __init__(self, cale, marime_bloc=1 << 16):
+        self._fisier = open(cale, 'rb')
+        self._mmap = None
+        self._cnp = []
+        self._randuri = {}
+        self._inceputuri = array('Q')
+        self._sfarsituri = array('Q')
+        # inregistrarile cu un CNP deja indexat sunt ignorate, ca la incarcarea completa
+        self.duplicate = []
+        salarii = array('d')
+        total_departament = {}
+        total_senioritate = {}
+        try:
+            # fiecare octet devine un caracter, deci pozitiile din parcurgere sunt pozitii in octeti
+            with open(cale, 'r', encoding='latin-1', newline='') as fisier:
+                for inceput, sfarsit, item in _parcurgere_json(fisier, marime_bloc):
+                    cnp = item['CNP']
+                    if cnp in self._randuri:
+                        self.duplicate.append(cnp)
+                        continue
+                    self._randuri[cnp] = len(self._cnp)
+                    self._cnp.append(cnp)
+                    self._inceputuri.append(inceput)
+                    self._sfarsituri.append(sfarsit)
+
+                    salar = item['Salar']
+                    salarii.append(salar)
+                    total_departament[item['Departament']] = total_departament.get(item['Departament'], 0) + salar
+                    total_senioritate[item['Senioritate']] = total_senioritate.get(item['Senioritate'], 0) + salar
+            if self._cnp:
+                self._mmap = mmap.mmap(self._fisier.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.inchidere()
+            raise
+
+        self.numar = numar = len(salarii)
+        total = sum(salarii, 0)
+        self.agregate = {
+            'numar': numar,
+            'total': total,
+            'minim': min(salarii, default=None),
+            'maxim': max(salarii, default=None),
+            'medie': total / numar if numar else None,
+            'total_departament': total_departament,
+            'total_senioritate': total_senioritate
+        }
+
+    def __len__(self):
+        return self.numar
+
+    def cnp(self, rand):
+        return self._cnp[rand]
+
+    def valori(self, rand):
+        # returneaza campurile angajatului in ordinea parametrilor clasei Angajat
+        item = json.loads(self._mmap[self._inceputuri[rand]:self._sfarsituri[rand]])
+        return item['Nume'], item['Prenume'], item['CNP'], item['Varsta'], item['Salar'], item['Departament'], item['Senioritate']
+
+    def cautare(self, cnp):
+        return self._randuri.get(cnp)
+
+    def inchidere(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._fisier.close()
+
+
+class DepozitSQLite:
+    '''Depozit SQLite pentru angajati. CNP-ul este cheia primara, iar departamentul si
+    senioritatea sunt indexate; sumele salariilor si fluturasii sunt calculati prin interogari
+    SQL, astfel incat depozitul poate fi folosit fara a incarca toti angajatii in memorie.
+
+    Valorile unui angajat sunt primite si returnate ca tupluri, in ordinea parametrilor
+    clasei Angajat. Fiecare modificare este o tranzactie; adaugarea pe lot foloseste o
+    singura tranzactie pentru tot lotul.
+    '''
+
+    _COLOANE = 'nume, prenume, cnp, varsta, salar, departament, senioritate'
+    # cheile de cautare decodificate din CNP, ca in modulul cautare; interogarile folosesc exact
+    # expresiile indexate, astfel incat SQLite rezolva cautarile prin indexuri; spre deosebire de
+    # modulul cautare, data nasterii nu este validata
+    _EXPRESII_CAUTARE = {
+        'cnp': 'cnp',
+        'data_nasterii': "(CASE substr(cnp, 1, 1) WHEN '0' THEN NULL WHEN '3' THEN '18' WHEN '4' THEN '18' "
+                         "WHEN '5' THEN '20' WHEN '6' THEN '20' ELSE '19' END "
+                         "|| substr(cnp, 2, 2) || '-' || substr(cnp, 4, 2) || '-' || substr(cnp, 6, 2))",
+        'judet': 'substr(cnp, 8, 2)'
+    }
+
+    def __init__(self, cale):
+        self._conexiune = sqlite3.connect(cale)
+        try:
+            self._conexiune.execute('PRAGMA journal_mode=WAL')
+            self._conexiune.execute('PRAGMA synchronous=NORMAL')
+            with self._conexiune:
+                self._conexiune.execute('''CREATE TABLE IF NOT EXISTS angajati (
+                    cnp TEXT PRIMARY KEY NOT NULL,
+                    nume TEXT NOT NULL,
+                    prenume TEXT NOT NULL,
+                    varsta TEXT NOT NULL,
+                    salar REAL NOT NULL,
+                    departament TEXT NOT NULL,
+                    senioritate TEXT NOT NULL)''')
+                # indexul pe departament include salarul, astfel incat suma pe departament
+                # este calculata numai din index
+                self._conexiune.execute('CREATE INDEX IF NOT EXISTS angajati_departament ON angajati (departament, salar)')
+                self._conexiune.execute('CREATE INDEX IF NOT EXISTS angajati_senioritate ON angajati (senioritate)')
+                for criteriu in ('data_nasterii', 'judet'):
+                    self._conexiune.execute(f'CREATE INDEX IF NOT EXISTS angajati_{criteriu} '
+                                            f'ON angajati ({self._EXPRESII_CAUTARE[criteriu]}, cnp)')
+        except Exception:
+            self._conexiune.close()
+            raise
+
+    def __len__(self):
+        return self._conexiune.execute('SELECT COUNT(*) FROM angajati').fetchone()[0]
+
+    def obtinere(self, cnp):
+        return self._conexiune.execute(f'SELECT {self._COLOANE} FROM angajati WHERE cnp = ?', (cnp,)).fetchone()
+
+    def selectare(self, departament=None, senioritate=None):
+        # angajatii sunt returnati in ordinea adaugarii, pe masura ce sunt cititi
+        conditii, parametri = self._filtre(departament, senioritate)
+        return self._conexiune.execute(f'SELECT {self._COLOANE} FROM angajati{conditii} ORDER BY rowid', parametri)
+
+    def cautare(self, criteriu, inceput, sfarsit=None):
+        # angajatii ale caror chei sunt intre prefixele inceput si sfarsit, inclusiv, ordonati dupa cheie si CNP
+        expresie = self._EXPRESII_CAUTARE[criteriu]
+        return self._conexiune.execute(
+            f'SELECT {self._COLOANE} FROM angajati WHERE {expresie} >= ? AND {expresie} < ? ORDER BY {expresie}, cnp',
+            (inceput, (inceput if sfarsit is None else sfarsit) + '\uffff'))
+
+    def adaugare(self, lista_valori):
+        # un CNP existent anuleaza tot lotul
+        try:
+            with self._conexiune:
+                self._conexiune.executemany(
+                    'INSERT INTO angajati (nume, prenume, cnp, varsta, salar, departament, senioritate) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    lista_valori)
+        except sqlite3.IntegrityError as exception:
+            raise ValueError(f'Exista deja un angajat cu acelasi CNP! {exception}')
+
+    def modificare(self, valori):
+        nume, prenume, cnp, varsta, salar, departament, senioritate = valori
+        with self._conexiune:
+            cursor = self._conexiune.execute(
+                'UPDATE angajati SET nume = ?, prenume = ?, varsta = ?, salar = ?, departament = ?, senioritate = ? WHERE cnp = ?',
+                (nume, prenume, varsta, salar, departament, senioritate, cnp))
+        return cursor.rowcount > 0
+
+    def stergere(self, cnp):
+        # returneaza valorile angajatului sters sau None daca CNP-ul nu exista
+        with self._conexiune:
+            valori = self.obtinere(cnp)
+            if valori is not None:
+                self._conexiune.execute('DELETE FROM angajati WHERE cnp = ?', (cnp,))
+        return valori
+
+    def cost(self, departament=None):
+        conditii, parametri = self._filtre(departament, None)
+        return self._conexiune.execute(f'SELECT TOTAL(salar) FROM angajati{conditii}', parametri).fetchone()[0]
+
+    def statistici(self):
+        numar, total, minim, maxim = self._conexiune.execute(
+            'SELECT COUNT(*), TOTAL(salar), MIN(salar), MAX(salar) FROM angajati').fetchone()
+        return {
+            'numar': numar,
+            'total': total,
+            'minim': minim,
+            'maxim': maxim,
+            'medie': total / numar if numar else None,
+            'total_departament': dict(self._conexiune.execute(
+                'SELECT departament, TOTAL(salar) FROM angajati GROUP BY departament')),
+            'total_senioritate': dict(self._conexiune.execute(
+                'SELECT senioritate, TOTAL(salar) FROM angajati GROUP BY senioritate'))
+        }
+
+    def fluturasi(self, cota_cas, cota_cass, cota_impozit, deducere=0.0, departament=None):
+        # ordinea operatiilor este aceeasi ca in RegulaFiscala.calcul, deci rezultatele sunt identice
+        conditii, parametri = self._filtre(departament, None)
+        return self._conexiune.execute(f'''
+            SELECT cnp, salar, cas, cass, impozit, salar - cas - cass - impozit FROM (
+                SELECT ordine, cnp, salar, cas, cass, MAX(salar - cas - cass - ?, 0.0) * ? AS impozit FROM (
+                    SELECT rowid AS ordine, cnp, salar, ? * salar AS cas, ? * salar AS cass FROM angajati{conditii}))
+            ORDER BY ordine''', (deducere, cota_impozit, cota_cas, cota_cass) + parametri)
+
+    def inchidere(self):
+        self._conexiune.close()
+
+    def _filtre(self, departament, senioritate):
+        conditii = []
+        parametri = ()
+        if departament:
+            conditii.append('departament = ?')
+            parametri += (departament,)
+        if senioritate:
+            conditii.append('senioritate = ?')
+            parametri += (senioritate,)
+        return (' WHERE ' + ' AND '.join(conditii) if conditii else ''), parametri
+
+
+def _citire_fragment(cale):
+    # functia este executata si in procesele de citire, deci returneaza numai valori simple,
+    # in ordinea parametrilor clasei Angajat
+    return [(item['Nume'], item['Prenume'], item['CNP'], item['Varsta'], item['Salar'], item['Departament'], item['Senioritate'])
+            for item in citire_json_incrementala(cale)]
+
+
+class DepozitFragmentat:
+    '''Angajatii impartiti in mai multe fisiere JSON (fragmente) dintr-un director, dupa departament
+    sau dupa un hash al CNP-ului. Fiecare fragment poate fi citit si rescris independent, astfel incat
+    o interogare pe un departament citeste numai fragmentul departamentului, iar la salvare sunt
+    rescrise numai fragmentele modificate.
+
+    Criteriul si numarul de fragmente sunt pastrate in fisierul fragmente.json din director.
+    '''
+
+    def __init__(self, director, criteriu=None, numar_fragmente=16):
+        self.director = director
+        os.makedirs(director, exist_ok=True)
+        cale_descriere = os.path.join(director, FISIER_DESCRIERE_FRAGMENTE)
+        if os.path.exists(cale_descriere):
+            with open(cale_descriere, 'r') as fisier:
+                descriere = json.load(fisier)
+            if criteriu is not None and criteriu != descriere['criteriu']:
+                raise ValueError(f'Directorul {director} este fragmentat dupa {descriere["criteriu"]}, nu dupa {criteriu}!')
+            self.criteriu = descriere['criteriu']
+            self.numar_fragmente = descriere['numar_fragmente']
+            return
+
+        self.criteriu = criteriu or CRITERII_FRAGMENTARE[0]
+        if self.criteriu not in CRITERII_FRAGMENTARE:
+            raise ValueError(f'Criteriul de fragmentare {self.criteriu} nu este cunoscut!')
+        self.numar_fragmente = numar_fragmente
+        with open(cale_descriere, 'w') as fisier:
+            json.dump({'criteriu': self.criteriu, 'numar_fragmente': self.numar_fragmente}, fisier)
+
+    def cheie(self, departament, cnp):
+        # crc32 este stabil intre rulari, spre deosebire de hash() pentru siruri de caractere
+        if self.criteriu == 'departament':
+            return departament
+        return zlib.crc32(cnp.encode('ascii')) % self.numar_fragmente
+
+    def cheie_cnp(self, cnp):
+        # returneaza fragmentul unui CNP, daca acesta poate fi stabilit numai din CNP
+        return self.cheie(None, cnp) if self.criteriu == 'hash' else None
+
+    def cale(self, cheie):
+        if self.criteriu == 'departament':
+            return os.path.join(self.director, f'departament_{cheie}.json')
+        return os.path.join(self.director, f'fragment_{cheie:03d}.json')
+
+    def chei(self):
+        chei = []
+        for nume in os.listdir(self.director):
+            baza, extensie = os.path.splitext(nume)
+            if extensie != '.json':
+                continue
+            if self.criteriu == 'departament' and baza.startswith('departament_'):
+                chei.append(baza[len('departament_'):])
+            elif self.criteriu == 'hash' and baza.startswith('fragment_') and baza[len('fragment_'):].isdigit():
+                chei.append(int(baza[len('fragment_'):]))
+        return sorted(chei)
+
+    def citire(self, chei, procese=None):
+        # returneaza (cheie, valori) pentru fiecare fragment; mai multe fragmente sunt citite
+        # in paralel, in procese separate, pentru ca decodarea JSON nu elibereaza GIL-ul
+        chei = list(chei)
+        procese = min(len(chei), procese or os.cpu_count() or 1)
+        if procese <= 1:
+            for cheie in chei:
+                yield cheie, _citire_fragment(self.cale(cheie))
+            return
+        with ProcessPoolExecutor(max_workers=procese) as executor:
+            yield from zip(chei, executor.map(_citire_fragment, [self.cale(cheie) for cheie in chei]))
+
+    def scriere(self, cheie, inregistrari):
+        # un fragment ramas fara angajati este sters, ca sa nu mai fie citit la deschidere
+        if inregistrari:
+            salvare_json_atomica(self.cale(cheie), inregistrari)
+        elif os.path.exists(self.cale(cheie)):
+            os.remove(self.cale(cheie))
@@ -0,0 +1,40 @@
+import os
+import sys
+
+import pytest
+
+# modulele aplicatiei sunt in directorul parinte, nu intr-un pachet
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import generare_angajati
+from management_angajati import Angajat, Companie
+
+
+@pytest.fixture
+def angajati():
+    # angajati generati determinist, cu CNP-uri unice, care trec toate validarile
+    return [Angajat.din_dictionar(item) for item in generare_angajati(300, seed=7)]
+
+
+@pytest.fixture(autouse=True)
+def director_lucru(tmp_path, monkeypatch):
+    # fisierele scrise de aplicatie (fluturasi, rapoarte) ajung in directorul temporar al testului
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def deschidere(cale, **optiuni):
+    companie = Companie(cale_date=str(cale), **optiuni)
+    companie.initializare()
+    return companie
+
+
+def continut(companie):
+    # toti angajatii firmei, dupa CNP, sub forma de dictionar
+    return {angajat.cnp: angajat.dictionar() for angajat in companie.selectare_angajati()}
+
+
+def modificat(angajat, **campuri):
+    valori = angajat.dictionar()
+    valori.update(campuri)
+    return Angajat.din_dictionar(valori)
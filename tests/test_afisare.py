@@ -0,0 +1,47 @@
+import io
+import json
+
+import pytest
+
+from afisare import afisare_inregistrari
+from management_angajati import Companie
+
+
+class IesireNumarata(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.scrieri = 0
+
+    def write(self, text):
+        self.scrieri += 1
+        return super().write(text)
+
+
+def test_scrieri_tamponate(angajati):
+    iesire = IesireNumarata()
+    inregistrari = [angajat.dictionar() for angajat in angajati]
+    assert afisare_inregistrari(inregistrari, 'jsonl', iesire=iesire, marime_tampon=4096) == len(angajati)
+    assert [json.loads(linie) for linie in iesire.getvalue().splitlines()] == inregistrari
+    assert iesire.scrieri <= len(iesire.getvalue()) // 4096 + 1
+
+
+def test_limita_si_deplasare(angajati):
+    iesire = io.StringIO()
+    inregistrari = [angajat.dictionar() for angajat in angajati]
+    assert afisare_inregistrari(inregistrari, 'tabel', limita=5, deplasare=10, iesire=iesire) == 5
+    randuri = iesire.getvalue().splitlines()
+    assert randuri[0].split() == ['Nume', 'Prenume', 'CNP', 'Varsta', 'Salar', 'Departament', 'Senioritate']
+    assert [rand.split()[2] for rand in randuri[1:]] == [angajat.cnp for angajat in angajati[10:15]]
+
+    with pytest.raises(ValueError):
+        afisare_inregistrari(inregistrari, 'xml', iesire=iesire)
+
+
+def test_formatul_detaliat_este_cel_al_unui_angajat(angajati, capsys):
+    companie = Companie()
+    companie.adaugare_angajati(angajati[:3])
+    iesire = io.StringIO()
+    companie.afisare_lista(format_afisare='detaliat', iesire=iesire)
+    for angajat in angajati[:3]:
+        angajat.afisare()
+    assert iesire.getvalue() == capsys.readouterr().out
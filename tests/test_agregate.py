@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from conftest import modificat
+from management_angajati import AgregateSalarii, Companie
+
+
+def test_agregatele_urmeaza_modificarile(angajati):
+    companie = Companie()
+    companie.adaugare_angajati(angajati[:200])
+    generator = random.Random(1)
+    for angajat in angajati[200:]:
+        companie.adaugare_angajat(angajat)
+        companie.modificare_angajat(modificat(generator.choice(list(companie.selectare_angajati())), Salar=round(generator.uniform(4050, 30000), 2),
+                                              Departament=generator.choice(['HR', 'IT'])))
+        companie.stergere_angajat(generator.choice(list(companie.selectare_angajati())).cnp)
+    assert companie.verificare_agregate() == []
+
+    curenti = list(companie.selectare_angajati())
+    statistici = companie.statistici_salarii()
+    assert statistici['numar'] == len(curenti)
+    assert statistici['total'] == pytest.approx(sum(angajat.salar for angajat in curenti))
+    assert statistici['minim'] == min(angajat.salar for angajat in curenti)
+    assert statistici['maxim'] == max(angajat.salar for angajat in curenti)
+    for departament in ('HR', 'IT', 'Marketing', 'Finance'):
+        cost = sum(angajat.salar for angajat in curenti if angajat.departament == departament)
+        assert companie.cost_salarii(departament) == pytest.approx(cost)
+
+
+def test_extremele_dupa_stergere(angajati):
+    agregate = AgregateSalarii()
+    salarii = [modificat(angajat, Salar=salar) for angajat, salar in zip(angajati, [5000.0, 7000.0, 9000.0, 9000.0])]
+    for angajat in salarii:
+        agregate.adauga(angajat)
+    agregate.elimina(salarii[0])
+    assert agregate.minim == 7000.0
+    # un salar maxim repetat ramane maxim pana la stergerea ultimei aparitii
+    agregate.elimina(salarii[2])
+    assert agregate.maxim == 9000.0
+    agregate.elimina(salarii[3])
+    assert agregate.maxim == 7000.0
+
+    agregate.elimina(salarii[1])
+    assert (agregate.numar, agregate.total, agregate.minim, agregate.maxim, agregate.medie) == (0, 0, None, None, None)
+    assert agregate.total_departament == {} and agregate.numar_senioritate == {}
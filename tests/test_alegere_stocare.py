@@ -0,0 +1,59 @@
+import os
+import sys
+
+import pytest
+
+import import_export
+from conftest import continut, deschidere, modificat
+from management_angajati import FISIER_DATE, FISIER_SQLITE, cale_date_implicita, divergenta_json
+from stocare import salvare_json_atomica
+
+
+def rulare(monkeypatch, *argumente):
+    monkeypatch.setattr(sys, 'argv', ['import_export.py', *argumente])
+    import_export.main()
+
+
+def test_stocarea_nu_este_dedusa_din_fisiere(angajati, capsys):
+    companie = deschidere(FISIER_SQLITE)
+    companie.adaugare_angajati(angajati[:10])
+    companie.salvare_informatii()
+    assert cale_date_implicita() == FISIER_DATE
+    assert cale_date_implicita('sqlite') == FISIER_SQLITE
+    # fara fisier JSON nu exista nimic cu care datele sa difere
+    assert capsys.readouterr().out == ''
+    with pytest.raises(ValueError):
+        cale_date_implicita('fragmente')
+
+
+def test_conversie_si_divergenta(angajati, monkeypatch, capsys):
+    salvare_json_atomica(FISIER_DATE, (angajat.dictionar() for angajat in angajati))
+    rulare(monkeypatch, 'import-json', '--stocare', 'sqlite')
+    assert continut(deschidere(FISIER_SQLITE)) == {angajat.cnp: angajat.dictionar() for angajat in angajati}
+    assert 'export-json' in divergenta_json(FISIER_SQLITE)
+
+    rulare(monkeypatch, 'export-json', '--stocare', 'sqlite')
+    assert divergenta_json(FISIER_SQLITE) is None
+    capsys.readouterr()
+    cale_date_implicita('sqlite')
+    cale_date_implicita()
+    assert capsys.readouterr().out == ''
+
+    # o modificare in depozit lipseste din fisierul JSON
+    companie = deschidere(FISIER_SQLITE)
+    companie.modificare_angajat(modificat(angajati[0], Salar=25000.0))
+    companie.salvare_informatii()
+    modificare = os.stat(FISIER_SQLITE).st_mtime_ns + 10 ** 9
+    os.utime(FISIER_SQLITE, ns=(modificare, modificare))
+    assert 'export-json' in divergenta_json(FISIER_SQLITE)
+    cale_date_implicita()
+    assert FISIER_SQLITE in capsys.readouterr().out
+
+    # fisierul JSON modificat ulterior (de exemplu de angajat.py) are modificari care lipsesc din depozit
+    os.utime(FISIER_DATE, ns=(modificare + 10 ** 9, modificare + 10 ** 9))
+    assert 'import-json' in divergenta_json(FISIER_SQLITE)
+
+
+def test_export_json_in_fisierul_stocarii(monkeypatch):
+    with pytest.raises(SystemExit):
+        rulare(monkeypatch, 'export-json', FISIER_DATE)
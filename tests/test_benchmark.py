@@ -0,0 +1,42 @@
+import json
+
+from conftest import continut, deschidere
+from benchmark import cifra_control_cnp, generare_angajati, scriere_date_sintetice
+from import_export import validare_inregistrare
+
+
+def test_generare_determinista():
+    assert list(generare_angajati(200, seed=3)) == list(generare_angajati(200, seed=3))
+    assert list(generare_angajati(200, seed=3)) != list(generare_angajati(200, seed=4))
+
+
+def test_angajati_generati_sunt_valizi():
+    angajati = list(generare_angajati(5000, seed=1))
+    cnp_uri = [item['CNP'] for item in angajati]
+    assert len(set(cnp_uri)) == len(cnp_uri)
+    for item in angajati:
+        assert cifra_control_cnp(item['CNP'][:12]) == item['CNP'][12]
+        assert validare_inregistrare(item)[1] == []
+
+
+def test_cifra_control_cnp():
+    # 1*2 + 9*7 + 6*9 + 0*1 + 1*4 + 0*6 + 1*3 + 1*5 + 2*8 + 3*2 + 4*7 + 5*9 = 226, iar 226 % 11 = 6
+    assert cifra_control_cnp('196010112345') == '6'
+    # restul 10 este inlocuit cu cifra 1
+    assert cifra_control_cnp('100000000007') == '1'
+
+
+def test_date_sintetice_si_marcare_modificati(director_lucru):
+    cale = director_lucru / 'angajati.json'
+    scriere_date_sintetice(str(cale), 100, seed=2)
+    assert json.loads(cale.read_text()) == list(generare_angajati(100, seed=2))
+
+    companie = deschidere(cale)
+    assert len(continut(companie)) == 100
+    # fara modificari nu se scrie nimic; dupa marcare fisierul este rescris in formatul aplicatiei
+    assert companie.compactare() is False
+    companie.marcare_modificati()
+    assert companie.compactare() is True
+    assert companie.compactare() is False
+    companie.salvare_informatii()
+    assert continut(deschidere(cale)) == continut(companie)
@@ -0,0 +1,46 @@
+import datetime
+
+from conftest import modificat
+from management_angajati import Companie
+from reguli_fiscale import RegulaFiscala
+from salarizare import CacheFluturasi, calcul_fluturas
+
+
+def test_hituri_si_invalidare_la_modificare(angajati):
+    companie = Companie()
+    companie.adaugare_angajati(angajati[:10])
+    cnp = angajati[0].cnp
+    primul = companie.calcul_fluturas_angajat(cnp)
+    assert companie.calcul_fluturas_angajat(cnp) is primul
+    assert (companie.cache_fluturasi.hituri, companie.cache_fluturasi.ratari) == (1, 1)
+
+    companie.modificare_angajat(modificat(angajati[0], Salar=angajati[0].salar + 1000))
+    assert companie.cache_fluturasi.invalidari == 1
+    assert companie.calcul_fluturas_angajat(cnp) == calcul_fluturas(angajati[0].salar + 1000)
+    companie.stergere_angajat(cnp)
+    assert len(companie.cache_fluturasi) == 0
+
+
+def test_salar_sau_regula_diferita():
+    cache = CacheFluturasi()
+    regula = RegulaFiscala(datetime.date(2020, 1, 1), 0.1, 0.2, 0.1)
+    alta_regula = RegulaFiscala(datetime.date(2021, 1, 1), 0.25, 0.1, 0.1)
+    cache.obtinere('1', 5000.0, regula)
+    # intrarea este recalculata, nu folosita, daca salarul sau regula s-au schimbat
+    assert cache.obtinere('1', 6000.0, regula) == regula.calcul(6000.0)
+    assert cache.obtinere('1', 6000.0, alta_regula) == alta_regula.calcul(6000.0)
+    assert cache.obtinere('1', 6000.0, alta_regula) == alta_regula.calcul(6000.0)
+    assert cache.statistici()['hituri'] == 1 and cache.statistici()['ratari'] == 3
+
+
+def test_eliminarea_celei_mai_vechi_intrari():
+    cache = CacheFluturasi(marime_maxima=2)
+    for cnp in ('1', '2'):
+        cache.obtinere(cnp, 5000.0)
+    # '1' este folosit din nou, deci '2' este cea mai veche intrare
+    cache.obtinere('1', 5000.0)
+    cache.obtinere('3', 5000.0)
+    assert cache.statistici()['eliminari'] == 1
+    cache.obtinere('1', 5000.0)
+    cache.obtinere('2', 5000.0)
+    assert (cache.hituri, cache.ratari) == (2, 4)
@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+import cautare
+from cautare import ListaOrdonata, data_nasterii, judet
+from management_angajati import Companie
+
+
+CHEI = {'cnp': lambda cnp: cnp, 'data_nasterii': data_nasterii, 'judet': judet}
+
+
+def test_lista_ordonata_fata_de_lista_sortata(monkeypatch):
+    # blocuri mici, ca impartirea si golirea blocurilor sa apara des
+    monkeypatch.setattr(cautare, 'MARIME_BLOC', 4)
+    generator = random.Random(11)
+    referinta = sorted(generator.sample(range(1000), 50))
+    lista = ListaOrdonata(referinta)
+    for _ in range(2000):
+        valoare = generator.randrange(1000)
+        if generator.random() < 0.55:
+            if valoare not in referinta:
+                referinta.append(valoare)
+                referinta.sort()
+                lista.adauga(valoare)
+        else:
+            assert lista.elimina(valoare) == (valoare in referinta)
+            if valoare in referinta:
+                referinta.remove(valoare)
+        inceput = generator.randrange(1000)
+        sfarsit = inceput + generator.randrange(100)
+        assert list(lista.interval(inceput, sfarsit)) == [x for x in referinta if inceput <= x < sfarsit]
+    assert list(lista) == referinta
+    assert len(lista) == len(referinta)
+
+
+def test_lista_goala():
+    lista = ListaOrdonata()
+    assert list(lista.interval(0, 10)) == []
+    assert lista.elimina(5) is False
+    lista.adauga(5)
+    assert list(lista) == [5]
+
+
+def test_decodificare_cnp():
+    assert data_nasterii('1960101123456') == '1996-01-01'
+    assert data_nasterii('5020229123456') is None
+    assert data_nasterii('0960101123456') is None
+    assert judet('1960101403456') == '40'
+    assert judet('123') is None
+
+
+def cautare_directa(angajati, criteriu, inceput, sfarsit=None):
+    rezultate = []
+    for angajat in angajati:
+        cheie = CHEI[criteriu](angajat.cnp)
+        if cheie is None:
+            continue
+        if sfarsit is None:
+            potrivit = cheie.startswith(inceput)
+        else:
+            # sfarsit este inclus ca prefix: '1990-11' cuprinde toate zilele din noiembrie
+            potrivit = inceput <= cheie and cheie[:len(sfarsit)] <= sfarsit
+        if potrivit:
+            rezultate.append((cheie, angajat.cnp))
+    return [cnp for _, cnp in sorted(rezultate)]
+
+
+@pytest.mark.parametrize('criteriu, inceput, sfarsit', [
+    ('cnp', '1', None), ('cnp', '19', '28'), ('cnp', '5', None),
+    ('data_nasterii', '1980', None), ('data_nasterii', '1975-03', '1990-11'), ('data_nasterii', '1985-06', None),
+    ('judet', '40', None), ('judet', '10', '20'),
+])
+def test_cautare_fata_de_parcurgere(monkeypatch, angajati, criteriu, inceput, sfarsit):
+    monkeypatch.setattr(cautare, 'MARIME_BLOC', 8)
+    companie = Companie()
+    companie.adaugare_angajati(angajati[:200])
+    assert [angajat.cnp for angajat in companie.cautare_angajati(criteriu, inceput, sfarsit)] == \
+        cautare_directa(angajati[:200], criteriu, inceput, sfarsit)
+
+    # indexul urmeaza adaugarile si stergerile facute dupa prima cautare
+    companie.adaugare_angajati(angajati[200:])
+    for angajat in angajati[:50]:
+        companie.stergere_angajat(angajat.cnp)
+    assert [angajat.cnp for angajat in companie.cautare_angajati(criteriu, inceput, sfarsit)] == \
+        cautare_directa(angajati[50:], criteriu, inceput, sfarsit)
+
+
+def test_criteriu_necunoscut():
+    with pytest.raises(ValueError):
+        Companie().cautare_angajati('nume', 'Pop')
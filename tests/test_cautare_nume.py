@@ -0,0 +1,83 @@
+import pytest
+
+from cautare import PRAGURI_SIMILARITATE, IndexNume, normalizare_nume, trigrame
+from conftest import modificat
+from management_angajati import Angajat, Companie
+
+
+def persoana(nume, prenume, cnp):
+    return Angajat(nume, prenume, cnp, '40', 6000.0, 'IT', 'mid')
+
+
+@pytest.fixture
+def companie(angajati):
+    companie = Companie()
+    companie.adaugare_angajati(angajati)
+    companie.adaugare_angajati([persoana('Constantinescu', 'Mirela', '2850101400011'),
+                                persoana('\u0218tef\u0103nescu', 'Ioana', '2850101400022')])
+    return companie
+
+
+def similaritate(cuvant, nume, prag):
+    # calculul de referinta, fara index: egalitate, prefix sau similaritatea Dice a trigramelor;
+    # o similaritate sub prag nu conteaza
+    if nume == cuvant:
+        return 1.0
+    if nume.startswith(cuvant) and 0.5 + 0.4 * len(cuvant) / len(nume) >= prag:
+        return 0.5 + 0.4 * len(cuvant) / len(nume)
+    trigrame_cuvant, trigrame_nume = trigrame(cuvant), trigrame(nume)
+    scor = 2 * len(trigrame_cuvant & trigrame_nume) / (len(trigrame_cuvant) + len(trigrame_nume))
+    return scor if scor >= prag else 0.0
+
+
+@pytest.mark.parametrize('text, cnp', [
+    ('Konstantinescu Mirella', '2850101400011'),
+    ('mirela constantinesku', '2850101400011'),
+    ('Stefanescu', '2850101400022'),
+    ('STEFANESCU ioana', '2850101400022'),
+    ('Constantinesc', '2850101400011'),
+])
+def test_greseli_de_scriere(companie, text, cnp):
+    assert companie.cautare_nume(text)[0].cnp == cnp
+
+
+def test_limita_si_text_gol(companie):
+    assert len(companie.cautare_nume('Popescu', limita=3)) == 3
+    assert companie.cautare_nume('Popescu', limita=0) == []
+    assert companie.cautare_nume('   ') == []
+    assert companie.cautare_nume('Xyzqw') == []
+
+
+def test_scoruri_fata_de_parcurgere(angajati):
+    # cu o limita mare sunt folosite toate pragurile: rezultatul contine cel putin persoanele la care
+    # fiecare cuvant are un nume suficient de asemanator, iar scorul este media celor mai bune similaritati
+    index = IndexNume(angajati)
+    prag = PRAGURI_SIMILARITATE[-1]
+    for text in ('Popesku Andrei', 'Mateii', 'Ion Elena', 'Diana'):
+        cuvinte = [normalizare_nume(cuvant) for cuvant in text.split()]
+        asteptat = {}
+        for angajat in angajati:
+            parti = (normalizare_nume(angajat.nume), normalizare_nume(angajat.prenume))
+            maxime = [max(similaritate(cuvant, parte, prag) for parte in parti) for cuvant in cuvinte]
+            asteptat[angajat.cnp] = sum(maxime) / len(maxime), min(maxime) > 0
+
+        rezultate = index.cautare(text, limita=len(angajati))
+        assert rezultate
+        assert {cnp for cnp, (_, complet) in asteptat.items() if complet} <= {angajat.cnp for _, angajat in rezultate}
+        for scor, angajat in rezultate:
+            assert scor == pytest.approx(asteptat[angajat.cnp][0])
+        assert [scor for scor, _ in rezultate] == sorted((scor for scor, _ in rezultate), reverse=True)
+
+
+def test_indexul_urmeaza_modificarile(companie):
+    mirela = companie.cautare_nume('Constantinescu Mirela')[0]
+    companie.stergere_angajat(mirela.cnp)
+    assert all(angajat.cnp != mirela.cnp for angajat in companie.cautare_nume('Constantinescu Mirela'))
+
+    ioana = companie.obtinere_angajat('2850101400022')
+    companie.modificare_angajat(modificat(ioana, Nume='Vasilescu'))
+    assert companie.cautare_nume('Vasilescu Ioana')[0].cnp == ioana.cnp
+    assert all(angajat.cnp != ioana.cnp for angajat in companie.cautare_nume('Stefanescu'))
+
+    companie.adaugare_angajati([persoana('\u0218tef\u0103nescu', 'Ioana', '2850101400033')])
+    assert companie.cautare_nume('Stefanescu Ioana')[0].cnp == '2850101400033'
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from stocare import citire_json_incrementala, salvare_json_atomica
+
+
+@pytest.mark.parametrize('indentare', [4, None])
+@pytest.mark.parametrize('marime_bloc', [1, 7, 1 << 16])
+def test_citire_pe_blocuri(tmp_path, indentare, marime_bloc):
+    elemente = [{'Nume': 'Pop', 'Prenume': 'Ana', 'Salar': 5000.5},
+                {'Nume': 'Ion [,] "x" \\ }', 'Prenume': 'Dan\n', 'Salar': 1e4},
+                {'Nume': 'Stan', 'Prenume': 'Ilie', 'Note': [1, {'a': []}]}]
+    cale = tmp_path / 'date.json'
+    cale.write_text(json.dumps(elemente, indent=indentare))
+    assert list(citire_json_incrementala(cale, marime_bloc)) == elemente
+
+
+def test_tablou_gol_si_fisier_salvat(tmp_path, angajati):
+    cale = tmp_path / 'date.json'
+    cale.write_text(' [ \n ] \n')
+    assert list(citire_json_incrementala(cale)) == []
+
+    salvare_json_atomica(str(cale), (angajat.dictionar() for angajat in angajati))
+    assert list(citire_json_incrementala(cale, 100)) == [angajat.dictionar() for angajat in angajati]
+
+
+@pytest.mark.parametrize('text', ['{"Nume": "Pop"}', '[{"Nume": "Pop"} {"Nume": "Ion"}]', '[{"Nume": "Pop"},', '[{"Nume": "Pop"}] x'])
+def test_fisier_invalid(tmp_path, text):
+    cale = tmp_path / 'date.json'
+    cale.write_text(text)
+    with pytest.raises(json.JSONDecodeError):
+        list(citire_json_incrementala(cale, 4))
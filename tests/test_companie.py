@@ -0,0 +1,51 @@
+import pytest
+
+from conftest import continut, deschidere, modificat
+from management_angajati import Companie
+from salarizare import calcul_fluturas
+
+
+def test_operatii_dupa_cnp(angajati):
+    companie = Companie()
+    companie.adaugare_angajati(angajati)
+    angajat = angajati[10]
+    assert companie.obtinere_angajat(angajat.cnp) is angajat
+    assert companie.obtinere_angajat('0000000000000') is None
+
+    companie.modificare_angajat(modificat(angajat, Salar=15000.0))
+    assert companie.obtinere_angajat(angajat.cnp).salar == 15000.0
+    assert companie.calcul_fluturas_angajat(angajat.cnp) == calcul_fluturas(15000.0)
+
+    assert companie.stergere_angajat(angajat.cnp).salar == 15000.0
+    assert companie.obtinere_angajat(angajat.cnp) is None
+    assert companie.calcul_fluturas_angajat(angajat.cnp) is None
+    assert len(continut(companie)) == len(angajati) - 1
+
+
+def test_cnp_duplicat_si_cnp_inexistent(angajati):
+    companie = Companie()
+    companie.adaugare_angajat(angajati[0])
+    with pytest.raises(ValueError):
+        companie.adaugare_angajat(angajati[0])
+    # un lot cu un CNP existent sau repetat nu adauga niciun angajat
+    with pytest.raises(ValueError):
+        companie.adaugare_angajati([angajati[1], angajati[0]])
+    with pytest.raises(ValueError):
+        companie.adaugare_angajati([angajati[1], angajati[1]])
+    assert list(continut(companie)) == [angajati[0].cnp]
+
+    with pytest.raises(KeyError):
+        companie.modificare_angajat(angajati[2])
+    with pytest.raises(KeyError):
+        companie.stergere_angajat(angajati[2].cnp)
+
+
+def test_salvare_si_redeschidere(tmp_path, angajati):
+    cale = tmp_path / 'date.json'
+    companie = deschidere(cale)
+    companie.adaugare_angajati(angajati)
+    companie.stergere_angajat(angajati[0].cnp)
+    asteptat = continut(companie)
+    companie.salvare_informatii()
+
+    assert continut(deschidere(cale)) == asteptat
@@ -0,0 +1,91 @@
+import json
+import random
+import threading
+
+import pytest
+
+import management_angajati
+from conftest import continut, deschidere, modificat
+from management_angajati import Companie
+
+
+def test_vederea_publicata_nu_se_schimba(angajati):
+    companie = Companie(concurent=True)
+    companie.adaugare_angajati(angajati[:200])
+    vedere = companie.vedere()
+    asteptat = {angajat.cnp: angajat.dictionar() for angajat in vedere.selectare_angajati()}
+    it = sorted(angajat.cnp for angajat in vedere.selectare_angajati('IT'))
+
+    companie.adaugare_angajati(angajati[200:])
+    for angajat in angajati[:50]:
+        companie.modificare_angajat(modificat(angajat, Salar=99999.0, Departament='IT'))
+    companie.stergere_angajat(angajati[60].cnp)
+
+    assert {angajat.cnp: angajat.dictionar() for angajat in vedere.selectare_angajati()} == asteptat
+    assert sorted(angajat.cnp for angajat in vedere.selectare_angajati('IT')) == it
+    assert vedere.obtinere_angajat(angajati[60].cnp) is angajati[60]
+    assert companie.vedere() is not vedere
+    assert companie.vedere().obtinere_angajat(angajati[60].cnp) is None
+
+
+@pytest.mark.parametrize('departament, senioritate', [(None, None), ('IT', None), (None, 'mid'), ('HR', 'senior')])
+def test_vederea_are_aceleasi_rezultate(angajati, departament, senioritate):
+    concurent, simplu = Companie(concurent=True), Companie()
+    for companie in (concurent, simplu):
+        companie.adaugare_angajati(angajati)
+        companie.modificare_angajat(modificat(angajati[5], Departament='HR', Senioritate='senior'))
+        companie.stergere_angajat(angajati[6].cnp)
+    rezultat = concurent.selectare_angajati(departament, senioritate)
+    assert sorted(angajat.cnp for angajat in rezultat) == sorted(angajat.cnp for angajat in simplu.selectare_angajati(departament, senioritate))
+    assert len(concurent.vedere()) == len(angajati) - 1
+
+
+def test_cititorii_vad_stari_consistente(angajati):
+    companie = Companie(concurent=True)
+    companie.adaugare_angajati(angajati)
+    oprire = threading.Event()
+    erori = []
+
+    def cititor():
+        while not oprire.is_set():
+            vedere = companie.vedere()
+            salarii = [angajat.salar for angajat in vedere.selectare_angajati()]
+            if len(salarii) != vedere.statistici['numar'] or sum(salarii) != pytest.approx(vedere.cost_salarii()):
+                erori.append((len(salarii), vedere.statistici['numar']))
+
+    cititori = [threading.Thread(target=cititor) for _ in range(3)]
+    for fir in cititori:
+        fir.start()
+    generator = random.Random(0)
+    for index in range(300):
+        angajat = angajati[generator.randrange(len(angajati))]
+        if companie.obtinere_angajat(angajat.cnp) is None:
+            companie.adaugare_angajat(angajat)
+        elif index % 3:
+            companie.modificare_angajat(modificat(angajat, Salar=round(generator.uniform(4050, 30000), 2)))
+        else:
+            companie.stergere_angajat(angajat.cnp)
+    oprire.set()
+    for fir in cititori:
+        fir.join()
+    assert erori == []
+    assert companie.verificare_agregate() == []
+
+
+def test_eroarea_scrierii_din_fundal(tmp_path, angajati, monkeypatch):
+    cale = tmp_path / 'date.json'
+    companie = deschidere(cale, jurnal=True, concurent=True)
+    companie.adaugare_angajati(angajati)
+
+    def eroare(*argumente, **optiuni):
+        raise OSError('disc plin')
+    monkeypatch.setattr(management_angajati, 'salvare_json_atomica', eroare)
+    assert companie.compactare(fundal=True)
+    companie._asteptare_compactare()
+    monkeypatch.undo()
+
+    # angajatii raman nesalvati, deci urmatoarea salvare ii scrie
+    asteptat = continut(companie)
+    assert companie.compactare()
+    with open(cale) as fisier:
+        assert {item['CNP']: item for item in json.load(fisier)} == asteptat
@@ -0,0 +1,149 @@
+import pytest
+
+from conftest import continut, deschidere, modificat
+from stocare import DepozitFragmentat
+
+
+@pytest.fixture
+def scrieri(monkeypatch):
+    # retine fragmentele rescrise la compactare
+    chei = []
+    scriere = DepozitFragmentat.scriere
+
+    def inregistrare(self, cheie, inregistrari):
+        chei.append(cheie)
+        scriere(self, cheie, inregistrari)
+    monkeypatch.setattr(DepozitFragmentat, 'scriere', inregistrare)
+    return chei
+
+
+def test_compactare_rescrie_numai_departamentul_modificat(tmp_path, angajati, scrieri):
+    director = tmp_path / 'date'
+    companie = deschidere(director, fragmentare='departament')
+    companie.adaugare_angajati(angajati)
+    companie.salvare_informatii()
+    assert sorted(scrieri) == ['Finance', 'HR', 'IT', 'Marketing']
+
+    companie = deschidere(director)
+    angajat = next(angajat for angajat in angajati if angajat.departament == 'IT')
+    companie.modificare_angajat(modificat(angajat, Salar=20000.0))
+    asteptat = continut(companie)
+    scrieri.clear()
+    assert companie.compactare()
+    assert scrieri == ['IT']
+    assert not companie.compactare()
+
+    assert continut(deschidere(director)) == asteptat
+
+
+def test_mutare_intre_departamente(tmp_path, angajati, scrieri):
+    director = tmp_path / 'date'
+    companie = deschidere(director, fragmentare='departament')
+    companie.adaugare_angajati(angajati)
+    companie.salvare_informatii()
+
+    companie = deschidere(director, lenes=True)
+    angajat = next(angajat for angajat in angajati if angajat.departament == 'HR')
+    scrieri.clear()
+    companie.modificare_angajat(modificat(angajat, Departament='IT'))
+    asteptat = continut(companie)
+    companie.salvare_informatii()
+    assert sorted(scrieri) == ['HR', 'IT']
+
+    companie = deschidere(director, lenes=True)
+    cost = sum(item['Salar'] for item in asteptat.values() if item['Departament'] == 'IT')
+    assert companie.cost_salarii('IT') == pytest.approx(cost)
+    assert continut(companie) == asteptat
+
+
+def test_compactare_fragmente_hash(tmp_path, angajati, scrieri):
+    director = tmp_path / 'date'
+    companie = deschidere(director, fragmentare='hash', numar_fragmente=8)
+    companie.adaugare_angajati(angajati)
+    companie.salvare_informatii()
+    assert len(DepozitFragmentat(str(director)).chei()) == 8
+
+    companie = deschidere(director, jurnal=True)
+    companie.stergere_angajat(angajati[0].cnp)
+    asteptat = continut(companie)
+    scrieri.clear()
+    companie.salvare_informatii()
+    assert scrieri == [companie._fragmente.cheie_cnp(angajati[0].cnp)]
+    assert not (director / 'date.jurnal').exists()
+
+    companie = deschidere(director)
+    assert continut(companie) == asteptat
+    assert companie.verificare_agregate() == []
+
+
+def test_jurnal_aplicat_peste_fragmente(tmp_path, angajati):
+    director = tmp_path / 'date'
+    companie = deschidere(director, fragmentare='departament', jurnal=True)
+    companie.adaugare_angajati(angajati[:200])
+    companie.salvare_informatii()
+
+    companie = deschidere(director, jurnal=True)
+    companie.adaugare_angajati(angajati[200:])
+    companie.stergere_angajat(angajati[0].cnp)
+    asteptat = continut(companie)
+    # oprire fara salvare: modificarile raman numai in jurnal
+    companie._jurnal.inchidere()
+
+    companie = deschidere(director, lenes=True)
+    assert companie.obtinere_angajat(angajati[0].cnp) is None
+    assert companie.obtinere_angajat(angajati[250].cnp).dictionar() == asteptat[angajati[250].cnp]
+    assert continut(companie) == asteptat
+
+
+@pytest.fixture
+def citiri(monkeypatch):
+    # retine fragmentele citite de pe disc
+    chei = []
+    citire = DepozitFragmentat.citire
+
+    def inregistrare(self, chei_cerute, procese=None):
+        chei_cerute = list(chei_cerute)
+        chei.extend(chei_cerute)
+        return citire(self, chei_cerute, procese)
+    monkeypatch.setattr(DepozitFragmentat, 'citire', inregistrare)
+    return chei
+
+
+def test_salvare_lenesa_citeste_numai_fragmentul_modificat(tmp_path, angajati, scrieri, citiri):
+    director = tmp_path / 'date'
+    companie = deschidere(director, fragmentare='hash', numar_fragmente=8)
+    companie.adaugare_angajati(angajati)
+    companie.salvare_informatii()
+
+    companie = deschidere(director, lenes=True, jurnal=True)
+    cheie = companie._fragmente.cheie_cnp(angajati[0].cnp)
+    citiri.clear()
+    scrieri.clear()
+    companie.modificare_angajat(modificat(angajati[0], Salar=11111.0))
+    companie.salvare_informatii()
+    assert citiri == [cheie]
+    assert scrieri == [cheie]
+
+    companie = deschidere(director)
+    assert companie.obtinere_angajat(angajati[0].cnp).salar == 11111.0
+    assert len(companie.angajati) == len(angajati)
+
+
+def test_compactarea_jurnalului_citeste_numai_departamentul_adaugat(tmp_path, angajati, scrieri, citiri):
+    director = tmp_path / 'date'
+    companie = deschidere(director, fragmentare='departament', jurnal=True)
+    companie.adaugare_angajati(angajati[:200])
+    companie.salvare_informatii()
+
+    companie = deschidere(director, jurnal=True)
+    nou = modificat(angajati[200], Departament='HR')
+    companie.adaugare_angajat(nou)
+    companie._jurnal.inchidere()
+
+    companie = deschidere(director, lenes=True, jurnal=True)
+    citiri.clear()
+    scrieri.clear()
+    companie.salvare_informatii()
+    assert citiri == ['HR']
+    assert scrieri == ['HR']
+    assert deschidere(director).obtinere_angajat(nou.cnp).dictionar() == nou.dictionar()
@@ -0,0 +1,95 @@
+import csv
+import json
+import os
+
+import pytest
+
+import import_export
+from conftest import continut
+from import_export import (citire_inregistrari, export_angajati, import_angajati, validare_fisier, validare_inregistrare,
+                           validare_paralela_fisier)
+from management_angajati import Companie
+
+
+@pytest.mark.parametrize('format_fisier', ['csv', 'jsonl'])
+def test_export_si_import(tmp_path, angajati, format_fisier):
+    companie = Companie()
+    companie.adaugare_angajati(angajati)
+    cale = tmp_path / f'angajati.{format_fisier}'
+    assert export_angajati(companie, str(cale)) == len(angajati)
+
+    importat = Companie()
+    assert import_angajati(importat, str(cale), marime_lot=64) == (len(angajati), 0)
+    assert continut(importat) == continut(companie)
+
+
+def test_randurile_respinse(tmp_path, angajati):
+    companie = Companie()
+    companie.adaugare_angajat(angajati[0])
+    randuri = [angajati[1].dictionar(), angajati[0].dictionar(), dict(angajati[2].dictionar(), Salar='mult'),
+               angajati[1].dictionar(), dict(angajati[3].dictionar(), Departament='Legal', CNP='123')]
+    cale = tmp_path / 'angajati.jsonl'
+    cale.write_text(''.join(json.dumps(rand) + '\n' for rand in randuri) + 'nu este json\n')
+
+    assert import_angajati(companie, str(cale), str(tmp_path / 'respinse.csv')) == (1, 5)
+    assert sorted(continut(companie)) == sorted([angajati[0].cnp, angajati[1].cnp])
+    with open(tmp_path / 'respinse.csv', newline='') as fisier:
+        respinse = {int(rand['Rand']): rand['Erori'] for rand in csv.DictReader(fisier)}
+    assert respinse == {
+        2: 'Exista deja un angajat cu acest CNP',
+        3: 'Salarul nu este un numar',
+        4: 'Exista deja un angajat cu acest CNP',
+        5: 'CNPul nu este valid; Departamentul nu este valid',
+        6: 'Inregistrarea nu este un obiect JSON valid'
+    }
+
+
+def fisier_mixt(cale, angajati, format_fisier):
+    # randuri valide si invalide amestecate, cu randuri goale intre ele
+    randuri = []
+    for index, angajat in enumerate(angajati):
+        item = angajat.dictionar()
+        if index % 7 == 0:
+            item['Salar'] = ['inf', 'nan', '100', 'x'][index % 4]
+        if index % 11 == 0:
+            item['CNP'] = item['CNP'][:-1]
+        randuri.append(item)
+    with open(cale, 'w', encoding='utf-8-sig', newline='') as fisier:
+        if format_fisier == 'csv':
+            writer = csv.DictWriter(fisier, fieldnames=list(randuri[0]))
+            writer.writeheader()
+            for index, item in enumerate(randuri):
+                writer.writerow(item)
+                if index % 13 == 0:
+                    fisier.write('\r\n')
+        else:
+            for index, item in enumerate(randuri):
+                fisier.write(json.dumps(item) + '\n' + ('\n' if index % 13 == 0 else ''))
+
+
+@pytest.mark.parametrize('format_fisier', ['csv', 'jsonl'])
+@pytest.mark.parametrize('procesoare', [1, 2])
+def test_validarea_paralela_este_identica_cu_cea_seriala(tmp_path, angajati, monkeypatch, format_fisier, procesoare):
+    cale = tmp_path / f'angajati.{format_fisier}'
+    fisier_mixt(cale, angajati, format_fisier)
+    seriale = [(numar_rand, erori) for numar_rand, item in citire_inregistrari(str(cale))
+               for erori in [validare_inregistrare(item)[1]] if erori]
+    assert len(seriale) > 40
+
+    # fisierul este mic, deci pragul este coborat pentru ca intervalele sa ajunga la procese
+    monkeypatch.setattr(os, 'cpu_count', lambda: procesoare)
+    monkeypatch.setattr(import_export, 'PRAG_PARALEL', 0)
+    blocuri = list(validare_paralela_fisier(str(cale), procese=2, cu_valide=False, marime_interval=1000))
+    assert len(blocuri) > 5
+    assert [(numar_rand, erori) for _, rezultate in blocuri for numar_rand, _, _, erori in rezultate] == seriale
+    assert sum(numar_valide for numar_valide, _ in blocuri) == len(angajati) - len(seriale)
+
+
+def test_numerele_randurilor_si_salariile_infinite(tmp_path, angajati):
+    cale = tmp_path / 'angajati.jsonl'
+    cale.write_text('\ufeff' + json.dumps(angajati[0].dictionar()) + '\n\n' + json.dumps(dict(angajati[1].dictionar(), Salar='inf')) + '\n',
+                    encoding='utf-8')
+    assert [numar_rand for numar_rand, _ in citire_inregistrari(str(cale))] == [1, 3]
+    assert validare_fisier(str(cale), str(tmp_path / 'respinse.csv')) == (1, 1)
+    with open(tmp_path / 'respinse.csv', newline='') as fisier:
+        assert [(rand['Rand'], rand['Erori']) for rand in csv.DictReader(fisier)] == [('3', 'Salarul nu este un numar finit')]
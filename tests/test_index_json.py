@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from conftest import continut, deschidere, modificat
+from stocare import IndexJSON, salvare_json_atomica
+
+
+def _valori(item):
+    return item['Nume'], item['Prenume'], item['CNP'], item['Varsta'], item['Salar'], item['Departament'], item['Senioritate']
+
+
+def test_citire_partiala_cu_index(tmp_path, angajati):
+    cale = str(tmp_path / 'date.json')
+    inregistrari = [angajat.dictionar() for angajat in angajati]
+    inregistrari[10]['Nume'] = 'Ștefănescu'
+    salvare_json_atomica(cale, inregistrari)
+
+    # un bloc mic face ca obiectele sa fie impartite intre mai multe citiri
+    index = IndexJSON(cale, marime_bloc=64)
+    try:
+        assert len(index) == len(inregistrari)
+        for item in inregistrari:
+            assert index.valori(index.cautare(item['CNP'])) == _valori(item)
+        assert index.cautare('1111111111111') is None
+
+        salarii = [item['Salar'] for item in inregistrari]
+        assert index.agregate['numar'] == len(salarii)
+        assert index.agregate['minim'] == min(salarii)
+        assert index.agregate['maxim'] == max(salarii)
+        assert index.agregate['total'] == pytest.approx(sum(salarii))
+    finally:
+        index.inchidere()
+
+
+def test_duplicate_si_fisier_formatat(tmp_path, angajati):
+    cale = tmp_path / 'date.json'
+    inregistrari = [angajat.dictionar() for angajat in angajati[:20]]
+    duplicat = dict(inregistrari[3], Nume='Altul')
+    # fisierul scris cu indentare, ca de versiunile vechi ale aplicatiei
+    cale.write_text(json.dumps(inregistrari + [duplicat], indent=4))
+
+    index = IndexJSON(str(cale))
+    try:
+        assert len(index) == 20
+        assert index.duplicate == [duplicat['CNP']]
+        assert index.valori(index.cautare(duplicat['CNP'])) == _valori(inregistrari[3])
+    finally:
+        index.inchidere()
+
+
+def test_companie_lenesa(tmp_path, angajati):
+    cale = tmp_path / 'date.json'
+    companie = deschidere(cale)
+    companie.adaugare_angajati(angajati)
+    asteptat = continut(companie)
+    companie.salvare_informatii()
+
+    companie = deschidere(cale, lenes=True)
+    assert companie.obtinere_angajat(angajati[7].cnp).dictionar() == asteptat[angajati[7].cnp]
+    assert companie.obtinere_angajat('1111111111111') is None
+    assert companie.cost_salarii() == pytest.approx(sum(item['Salar'] for item in asteptat.values()))
+    # angajatii sunt incarcati numai la prima operatie care are nevoie de toti
+    assert not companie.angajati
+
+    companie.modificare_angajat(modificat(angajati[7], Salar=15000.0))
+    asteptat[angajati[7].cnp]['Salar'] = 15000.0
+    assert continut(companie) == asteptat
+    assert companie.verificare_agregate() == []
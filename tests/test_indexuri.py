@@ -0,0 +1,48 @@
+import pytest
+
+import angajat as functii
+from benchmark import generare_angajati
+from conftest import modificat
+from management_angajati import Companie
+
+
+def filtrare(angajati, departament=None, senioritate=None):
+    return sorted(angajat.cnp for angajat in angajati
+                  if (not departament or angajat.departament == departament) and (not senioritate or angajat.senioritate == senioritate))
+
+
+@pytest.mark.parametrize('departament, senioritate', [('IT', None), (None, 'senior'), ('HR', 'junior'), ('Legal', None)])
+def test_selectare_dupa_indexuri(angajati, departament, senioritate):
+    companie = Companie()
+    companie.adaugare_angajati(angajati)
+    # un angajat este mutat intre departamente, altul isi schimba senioritatea, altul este sters
+    mutat = next(angajat for angajat in angajati if angajat.departament == 'HR')
+    promovat = next(angajat for angajat in angajati if angajat.senioritate == 'junior')
+    companie.modificare_angajat(modificat(mutat, Departament='IT'))
+    companie.modificare_angajat(modificat(promovat, Senioritate='senior'))
+    companie.stergere_angajat(angajati[-1].cnp)
+
+    curenti = list(companie.selectare_angajati())
+    selectati = companie.selectare_angajati(departament, senioritate)
+    assert sorted(angajat.cnp for angajat in selectati) == filtrare(curenti, departament, senioritate)
+
+
+def test_grupurile_goale_sunt_eliminate(angajati):
+    companie = Companie()
+    companie.adaugare_angajat(angajati[0])
+    companie.modificare_angajat(modificat(angajati[0], Departament='Finance' if angajati[0].departament != 'Finance' else 'HR'))
+    assert list(companie._index_departament.grupuri) == [companie.obtinere_angajat(angajati[0].cnp).departament]
+    companie.stergere_angajat(angajati[0].cnp)
+    assert companie._index_departament.grupuri == {}
+    assert companie._index_senioritate.grupuri == {}
+
+
+def test_indexurile_aplicatiei_cu_functii():
+    lista = list(generare_angajati(200, seed=3))
+    indexuri = functii.construire_indexuri(lista)
+    functii.deindexare_angajat(indexuri, lista[0])
+    del lista[0]
+    for departament, senioritate in [('IT', None), (None, 'mid'), ('Marketing', 'senior')]:
+        cu_index = functii.selectare_angajati(lista, indexuri, departament, senioritate)
+        fara_index = functii.selectare_angajati(lista, None, departament, senioritate)
+        assert sorted(angajat['CNP'] for angajat in cu_index) == sorted(angajat['CNP'] for angajat in fara_index)
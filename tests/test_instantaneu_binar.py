@@ -0,0 +1,75 @@
+import pytest
+
+from conftest import continut, deschidere, modificat
+from management_angajati import Angajat
+from stocare import InstantaneuBinar, scriere_instantaneu_binar
+
+
+def test_scriere_si_citire_instantaneu(tmp_path):
+    angajati = [
+        Angajat('Popescu', 'Ștefan', '1900101010011', '35', 5000.5, 'IT', 'mid'),
+        Angajat('Ionescu', 'Ana', '2900101010012', '35', 7000.0, 'HR', 'senior'),
+        Angajat('Pop', 'Ion', '1800101010013', '45', 4100.25, 'IT', 'junior')
+    ]
+    agregate = {'numar': 3, 'total': 16100.75}
+    cale = str(tmp_path / 'date.bin')
+    scriere_instantaneu_binar(cale, angajati, agregate)
+
+    instantaneu = InstantaneuBinar(cale)
+    try:
+        assert len(instantaneu) == 3
+        assert instantaneu.agregate == agregate
+        for angajat in angajati:
+            rand = instantaneu.cautare(angajat.cnp)
+            assert instantaneu.valori(rand) == (angajat.nume, angajat.prenume, angajat.cnp, angajat.varsta,
+                                                angajat.salar, angajat.departament, angajat.senioritate)
+        assert instantaneu.cautare('1111111111111') is None
+    finally:
+        instantaneu.inchidere()
+
+
+def test_cnp_invalid_nu_inlocuieste_instantaneul(tmp_path):
+    cale = str(tmp_path / 'date.bin')
+    scriere_instantaneu_binar(cale, [Angajat('Pop', 'Ion', '1800101010013', '45', 4100.0, 'IT', 'junior')], {})
+    with pytest.raises(ValueError):
+        scriere_instantaneu_binar(cale, [Angajat('Pop', 'Ion', '180', '45', 4100.0, 'IT', 'junior')], {})
+
+    instantaneu = InstantaneuBinar(cale)
+    try:
+        assert len(instantaneu) == 1
+    finally:
+        instantaneu.inchidere()
+    assert not (tmp_path / 'date.bin.tmp').exists()
+
+
+def test_companie_cu_instantaneu_binar(tmp_path, angajati):
+    cale = tmp_path / 'date.bin'
+    companie = deschidere(cale)
+    companie.adaugare_angajati(angajati)
+    asteptat = continut(companie)
+    statistici = companie.statistici_salarii()
+    companie.salvare_informatii()
+
+    companie = deschidere(cale)
+    # cautarile si statisticile sunt servite din instantaneu, fara incarcarea angajatilor
+    assert companie.obtinere_angajat(angajati[5].cnp).dictionar() == asteptat[angajati[5].cnp]
+    assert companie.statistici_salarii() == statistici
+    assert not companie.angajati
+
+    assert continut(companie) == asteptat
+    assert companie.verificare_agregate() == []
+
+
+def test_modificari_dupa_redeschidere_binar(tmp_path, angajati):
+    cale = tmp_path / 'date.bin'
+    companie = deschidere(cale)
+    companie.adaugare_angajati(angajati[:100])
+    companie.salvare_informatii()
+
+    companie = deschidere(cale)
+    companie.modificare_angajat(modificat(angajati[3], Departament='HR', Salar=8000.0))
+    companie.stergere_angajat(angajati[4].cnp)
+    asteptat = continut(companie)
+    companie.salvare_informatii()
+
+    assert continut(deschidere(cale)) == asteptat
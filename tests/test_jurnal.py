@@ -0,0 +1,87 @@
+import json
+import os
+
+import pytest
+
+import management_angajati
+from conftest import continut, deschidere, modificat
+from stocare import Jurnal
+
+
+def test_reluare_dupa_oprire_intre_rotire_si_scriere(tmp_path, angajati, monkeypatch):
+    cale = tmp_path / 'date.json'
+    companie = deschidere(cale, jurnal=True)
+    companie.adaugare_angajati(angajati[:200])
+    companie.salvare_informatii()
+
+    companie = deschidere(cale, jurnal=True)
+    companie.adaugare_angajati(angajati[200:])
+    companie.modificare_angajat(modificat(angajati[0], Salar=12345.0))
+    companie.stergere_angajat(angajati[1].cnp)
+    asteptat = continut(companie)
+
+    # programul se opreste dupa ce jurnalul a fost mutat in .vechi, dar inainte de inlocuirea fisierului de date
+    def oprire(*argumente, **optiuni):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(management_angajati, 'salvare_json_atomica', oprire)
+    with pytest.raises(KeyboardInterrupt):
+        companie.compactare()
+    companie._jurnal.inchidere()
+    monkeypatch.undo()
+
+    assert os.path.exists(f'{cale}.jurnal.vechi')
+    with open(cale) as fisier:
+        assert len(json.load(fisier)) == 200
+
+    companie = deschidere(cale, jurnal=True)
+    assert continut(companie) == asteptat
+    # jurnalul vechi este compactat la deschidere, apoi sters
+    assert not os.path.exists(f'{cale}.jurnal.vechi')
+    with open(cale) as fisier:
+        assert {item['CNP']: item for item in json.load(fisier)} == asteptat
+    assert companie.verificare_agregate() == []
+
+
+def test_reluare_jurnal_vechi_si_curent(tmp_path, angajati):
+    cale = tmp_path / 'date.json'
+    companie = deschidere(cale, jurnal=True)
+    companie.adaugare_angajati(angajati[:100])
+    companie.salvare_informatii()
+
+    # o modificare ramane in jurnalul rotit, iar urmatoarele in jurnalul curent
+    jurnal = Jurnal(f'{cale}.jurnal')
+    jurnal.adaugare('M', companie._valori_jurnal(modificat(angajati[0], Salar=9999.0)))
+    jurnal.rotire()
+    jurnal.adaugare('A', companie._valori_jurnal(angajati[100]))
+    jurnal.adaugare('S', angajati[2].cnp)
+    jurnal.inchidere()
+
+    companie = deschidere(cale, jurnal=True)
+    rezultat = continut(companie)
+    assert rezultat[angajati[0].cnp]['Salar'] == 9999.0
+    assert angajati[100].cnp in rezultat
+    assert angajati[2].cnp not in rezultat
+    assert len(rezultat) == 100
+
+
+def test_ultima_linie_incompleta_este_ignorata(tmp_path):
+    jurnal = Jurnal(str(tmp_path / 'date.json.jurnal'))
+    jurnal.adaugare('S', '1')
+    jurnal.adaugare('S', '2')
+    jurnal.inchidere()
+    with open(jurnal.cale, 'a') as fisier:
+        fisier.write('["S","3')
+
+    assert list(jurnal.citire()) == [('S', '1'), ('S', '2')]
+    assert jurnal.numar_inregistrari == 2
+
+
+def test_linie_corupta_in_mijlocul_jurnalului(tmp_path):
+    jurnal = Jurnal(str(tmp_path / 'date.json.jurnal'))
+    jurnal.adaugare('S', '1')
+    jurnal.inchidere()
+    with open(jurnal.cale, 'a') as fisier:
+        fisier.write('["S",\n["S","2"]\n')
+
+    with pytest.raises(json.JSONDecodeError):
+        list(jurnal.citire())
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from conftest import deschidere
+from management_angajati import Aplicatie, Companie
+from metrici import Metrici, metrici, sesiune
+
+
+@pytest.fixture(autouse=True)
+def metrici_goale():
+    metrici.resetare()
+    yield
+    metrici.resetare()
+
+
+def test_inregistrari_atribuite_operatiei_interioare():
+    masuratori = Metrici()
+    masuratori.inregistrare(5)
+    with masuratori.masurare('exterior'):
+        pass
+    assert masuratori.dictionar() == {}
+
+    masuratori.activare()
+    masuratori.inregistrare(5)
+    with masuratori.masurare('exterior'):
+        masuratori.inregistrare(1)
+        with masuratori.masurare('interior'):
+            masuratori.inregistrare(10, octeti_scrisi=100)
+    masuratori.dezactivare()
+    rezultat = masuratori.dictionar()
+    assert (rezultat['exterior']['apeluri'], rezultat['exterior']['inregistrari']) == (1, 1)
+    assert (rezultat['interior']['inregistrari'], rezultat['interior']['octeti_scrisi']) == (10, 100)
+    assert sum(rezultat['interior']['histograma'].values()) == 1
+
+
+def test_sesiune_instrumenteaza_si_restaureaza(director_lucru, angajati):
+    original = Companie.adaugare_angajati
+    cale_metrici = director_lucru / 'metrici.json'
+    with sesiune(str(cale_metrici), tinte=[(Companie, 'Companie')]):
+        assert Companie.adaugare_angajati is not original
+        companie = Companie()
+        companie.adaugare_angajati(angajati)
+        companie.calcul_fluturasi_lot()
+    assert Companie.adaugare_angajati is original
+    assert not metrici.activ
+
+    rezultat = json.loads(cale_metrici.read_text())
+    assert rezultat['Companie.adaugare_angajati']['apeluri'] == 1
+    assert rezultat['Companie.calcul_fluturasi_lot']['inregistrari'] == len(angajati)
+
+
+def test_sesiune_fara_fisiere_nu_schimba_nimic():
+    original = Companie.adaugare_angajati
+    with sesiune(None, None, [(Companie, 'Companie')]):
+        assert Companie.adaugare_angajati is original
+        assert not metrici.activ
+
+
+def test_format_prometheus(director_lucru):
+    cale_metrici = director_lucru / 'metrici.prom'
+    with sesiune(str(cale_metrici)):
+        with metrici.masurare('citire'):
+            metrici.inregistrare(3, octeti_cititi=42)
+    text = cale_metrici.read_text()
+    assert 'angajati_durata_secunde_bucket{operatie="citire",le="+Inf"} 1' in text
+    assert 'angajati_durata_secunde_count{operatie="citire"} 1' in text
+    assert 'angajati_octeti_cititi_total{operatie="citire"} 42' in text
+
+
+def test_meniu_masurat_fara_optiuni_invalide(director_lucru, angajati, monkeypatch):
+    cale = director_lucru / 'angajati.json'
+    companie = deschidere(cale)
+    companie.adaugare_angajati(angajati[:20])
+    companie.salvare_informatii()
+
+    raspunsuri = iter(['99', 'abc', '0', '6', '11'])
+    monkeypatch.setattr('builtins.input', lambda mesaj='': next(raspunsuri))
+    with sesiune(str(director_lucru / 'metrici.json')):
+        aplicatie = Aplicatie(str(cale))
+        assert [aplicatie._meniu() for _ in range(3)] == [None, None, None]
+        aplicatie.ruleaza()
+    assert sorted(json.loads((director_lucru / 'metrici.json').read_text())) == ['meniu.11', 'meniu.6']
@@ -0,0 +1,77 @@
+import datetime
+import json
+
+import pytest
+
+import reguli_fiscale
+from management_angajati import Companie
+from reguli_fiscale import (REGULA_IMPLICITA, MotorFiscal, RegulaFiscala, data_luna, incarcare_reguli,
+                            salar_minim_curent)
+
+
+def regula(an, cota_impozit=0.1, salar_minim=3000.0):
+    return RegulaFiscala(datetime.date(an, 1, 1), 0.25, 0.1, cota_impozit, 0.0, salar_minim)
+
+
+def test_calcul_fluturas():
+    cas, cass, impozit, net = RegulaFiscala(datetime.date(2020, 1, 1), 0.25, 0.1, 0.1, 500.0).calcul(10000.0)
+    assert (cas, cass) == (2500.0, 1000.0)
+    assert impozit == pytest.approx(600.0)
+    assert net == pytest.approx(5900.0)
+    # deducerea mai mare decat baza nu produce impozit negativ
+    assert RegulaFiscala(datetime.date(2020, 1, 1), 0.25, 0.1, 0.1, 1e6).calcul(10000.0)[2] == 0.0
+
+
+def test_alegerea_regulii_dupa_data():
+    motor = MotorFiscal([regula(2024), regula(2020), regula(2022)])
+    assert [item.data_efectiva.year for item in motor] == [2020, 2022, 2024]
+    assert motor.regula(datetime.date(2021, 12, 31)).data_efectiva.year == 2020
+    assert motor.regula(datetime.date(2022, 1, 1)).data_efectiva.year == 2022
+    assert motor.regula(datetime.date(2030, 6, 1)).data_efectiva.year == 2024
+    with pytest.raises(ValueError):
+        motor.regula(datetime.date(2019, 12, 31))
+
+
+def test_regula_cu_aceeasi_data_este_inlocuita():
+    motor = MotorFiscal([regula(2020), regula(2022)])
+    noua = regula(2020, cota_impozit=0.16)
+    motor.adaugare(noua)
+    assert len(motor) == 2
+    assert motor.regula(datetime.date(2021, 1, 1)) is noua
+
+
+def test_incarcare_reguli(tmp_path):
+    motor = incarcare_reguli(str(tmp_path / 'lipsa.json'))
+    assert list(motor) == [REGULA_IMPLICITA]
+
+    cale = tmp_path / 'reguli.json'
+    cale.write_text(json.dumps([regula(2020).dictionar(), regula(2023, salar_minim=3700.0).dictionar()]))
+    motor = incarcare_reguli(str(cale))
+    assert motor.regula(datetime.date(2024, 1, 1)).salar_minim == 3700.0
+    assert motor.regula(datetime.date(2021, 1, 1)).dictionar() == regula(2020).dictionar()
+
+    cale.write_text(json.dumps([{'data_efectiva': '2020-01-01'}]))
+    with pytest.raises(ValueError):
+        incarcare_reguli(str(cale))
+
+
+def test_salar_minim_cu_reguli_viitoare(monkeypatch):
+    monkeypatch.setattr(reguli_fiscale, 'motor_fiscal', MotorFiscal([regula(datetime.date.today().year + 1)]))
+    assert salar_minim_curent() == REGULA_IMPLICITA.salar_minim
+
+    monkeypatch.setattr(reguli_fiscale, 'motor_fiscal', MotorFiscal([regula(2000, salar_minim=5000.0)]))
+    assert salar_minim_curent() == 5000.0
+    assert not Companie._validare_salar(4999.0)
+    assert Companie._validare_salar(5000.0)
+
+
+@pytest.mark.parametrize('salar', [float('inf'), float('nan'), -1.0])
+def test_salar_invalid(salar):
+    assert not Companie._validare_salar(salar, 0.0)
+
+
+def test_data_luna():
+    assert data_luna('2025-03') == datetime.date(2025, 3, 1)
+    for text in ('2025', '2025-13', 'martie-2025'):
+        with pytest.raises(ValueError):
+            data_luna(text)
@@ -0,0 +1,25 @@
+import json
+
+from benchmark import masurare_memorie
+from management_angajati import Angajat
+
+
+def test_angajat_fara_dictionar_de_instanta(angajati):
+    angajat = angajati[0]
+    assert not hasattr(angajat, '__dict__')
+    assert Angajat.din_dictionar(angajat.dictionar()).dictionar() == angajat.dictionar()
+
+
+def test_valorile_repetate_sunt_partajate(angajati):
+    # valorile sunt decodate separat, ca la citirea fisierului, apoi internate
+    copii = [Angajat.din_dictionar(json.loads(json.dumps(angajat.dictionar()))) for angajat in angajati[:50]]
+    for atribut in ('departament', 'senioritate'):
+        valori = {}
+        for angajat in copii:
+            assert valori.setdefault(getattr(angajat, atribut), getattr(angajat, atribut)) is getattr(angajat, atribut)
+
+
+def test_memoria_pe_angajat():
+    rezultate = masurare_memorie(2000)
+    assert rezultate['obiect_cu_sloturi'] < rezultate['obiect_cu_dict'] < rezultate['dictionar']
+    assert rezultate['obiect_cu_sloturi'] * 2 < rezultate['dictionar']
@@ -0,0 +1,37 @@
+import csv
+
+import pytest
+
+from management_angajati import Companie
+from reguli_fiscale import regula_curenta
+from salarizare import COLOANE_FLUTURAS, calcul_fluturas, calcul_fluturasi, salvare_fluturasi_csv
+
+
+def test_lotul_este_identic_cu_calculul_individual():
+    salarii = [0.0, 1000.0, 4050.0, 4050.55, 12345.67, 100000.0]
+    tabel = calcul_fluturasi(salarii)
+    assert list(tabel['brut']) == salarii
+    for rand, salar in enumerate(salarii):
+        assert tuple(tabel[coloana][rand] for coloana in COLOANE_FLUTURAS[1:]) == calcul_fluturas(salar)
+
+
+@pytest.mark.parametrize('departament', [None, 'IT', 'Legal'])
+def test_fluturasi_firma(angajati, departament):
+    companie = Companie()
+    companie.adaugare_angajati(angajati)
+    tabel = companie.calcul_fluturasi_lot(departament)
+    selectati = [angajat for angajat in angajati if not departament or angajat.departament == departament]
+    assert tabel['cnp'] == [angajat.cnp for angajat in selectati]
+    assert list(tabel['net']) == [calcul_fluturas(angajat.salar)[3] for angajat in selectati]
+
+
+def test_salvare_csv(tmp_path, angajati):
+    companie = Companie()
+    companie.adaugare_angajati(angajati[:20])
+    tabel = companie.calcul_fluturasi_lot()
+    salvare_fluturasi_csv(tabel, tmp_path / 'fluturasi.csv')
+    with open(tmp_path / 'fluturasi.csv', newline='') as fisier:
+        randuri = list(csv.DictReader(fisier))
+    assert [rand['cnp'] for rand in randuri] == tabel['cnp']
+    assert [float(rand['net']) for rand in randuri] == pytest.approx(list(tabel['net']))
+    assert regula_curenta().calcul(angajati[0].salar)[3] == pytest.approx(float(randuri[0]['net']))
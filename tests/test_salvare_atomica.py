@@ -0,0 +1,68 @@
+import json
+import os
+
+import pytest
+
+import stocare
+from conftest import continut, deschidere, modificat
+from stocare import salvare_json_atomica
+
+
+def test_salvare_pe_bucati(director_lucru):
+    cale = str(director_lucru / 'date.json')
+    inregistrari = [{'CNP': str(index), 'Salar': index * 1.5} for index in range(2500)]
+    salvare_json_atomica(cale, iter(inregistrari), marime_bucata=100, sincronizare=False)
+    assert json.load(open(cale)) == inregistrari
+    salvare_json_atomica(cale, [])
+    assert json.load(open(cale)) == []
+
+
+@pytest.mark.parametrize('eroare', [RuntimeError, KeyboardInterrupt])
+def test_eroare_in_timpul_scrierii(director_lucru, eroare):
+    cale = str(director_lucru / 'date.json')
+    salvare_json_atomica(cale, [{'CNP': '1'}])
+    vechi = open(cale, 'rb').read()
+
+    def inregistrari():
+        for index in range(5000):
+            yield {'CNP': str(index)}
+        raise eroare()
+
+    with pytest.raises(eroare):
+        salvare_json_atomica(cale, inregistrari(), marime_bucata=100)
+    assert open(cale, 'rb').read() == vechi
+    assert os.listdir(director_lucru) == ['date.json']
+
+    with pytest.raises(TypeError):
+        salvare_json_atomica(cale, [{'CNP': object()}])
+    assert open(cale, 'rb').read() == vechi
+    assert os.listdir(director_lucru) == ['date.json']
+
+
+def test_compactare_esuata_nu_pierde_date(director_lucru, angajati, monkeypatch, capsys):
+    cale = director_lucru / 'angajati.json'
+    companie = deschidere(cale, jurnal=True)
+    companie.adaugare_angajati(angajati[:50])
+    companie.salvare_informatii()
+    vechi = cale.read_bytes()
+
+    companie = deschidere(cale, jurnal=True)
+    companie.adaugare_angajati(angajati[50:60])
+    companie.modificare_angajat(modificat(angajati[0], Salar=angajati[0].salar + 1))
+    asteptat = continut(companie)
+
+    def inlocuire_esuata(cale_temporara, cale, sincronizare):
+        raise OSError('disc plin')
+
+    monkeypatch.setattr(stocare, '_inlocuire_atomica', inlocuire_esuata)
+    companie.compactare()
+    assert 'Modificarile raman in jurnal' in capsys.readouterr().out
+    assert cale.read_bytes() == vechi
+    assert not any(nume.endswith('.tmp') for nume in os.listdir(director_lucru))
+
+    # modificarile raman in jurnal si sunt aplicate la urmatoarea deschidere
+    assert continut(deschidere(cale)) == asteptat
+    monkeypatch.undo()
+    companie.salvare_informatii()
+    assert json.loads(cale.read_bytes()) != json.loads(vechi)
+    assert continut(deschidere(cale, jurnal=True)) == asteptat
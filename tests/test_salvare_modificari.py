@@ -0,0 +1,90 @@
+import os
+from concurrent.futures import Future
+
+import pytest
+
+import angajat as functii
+from benchmark import generare_angajati
+from conftest import continut, deschidere, modificat
+from management_angajati import Aplicatie
+
+
+@pytest.fixture
+def fisier_salvat(director_lucru, angajati):
+    cale = director_lucru / 'angajati.json'
+    companie = deschidere(cale)
+    companie.adaugare_angajati(angajati)
+    companie.salvare_informatii()
+    # data modificarii este mutata in trecut, ca o rescriere sa poata fi observata
+    os.utime(cale, (1000000000, 1000000000))
+    return cale
+
+
+def raspunsuri(monkeypatch, valori):
+    valori = iter(valori)
+    monkeypatch.setattr('builtins.input', lambda mesaj='': next(valori))
+
+
+def test_sesiune_fara_modificari_nu_scrie(fisier_salvat, angajati):
+    companie = deschidere(fisier_salvat, jurnal=True)
+    companie.cost_salarii()
+    companie.obtinere_angajat(angajati[0].cnp)
+    assert companie.compactare() is False
+    companie.salvare_informatii()
+    assert os.stat(fisier_salvat).st_mtime == 1000000000
+
+
+def test_meniu_fara_modificari_nu_scrie(fisier_salvat, monkeypatch):
+    raspunsuri(monkeypatch, ['6', '11'])
+    Aplicatie(str(fisier_salvat)).ruleaza()
+    assert os.stat(fisier_salvat).st_mtime == 1000000000
+    assert not os.path.exists(str(fisier_salvat) + '.jurnal')
+
+
+def test_salvare_dupa_modificare(fisier_salvat, angajati):
+    companie = deschidere(fisier_salvat, jurnal=True)
+    companie.modificare_angajat(modificat(angajati[3], Salar=angajati[3].salar + 500))
+    asteptat = continut(companie)
+    assert companie.compactare() is True
+    assert companie.compactare() is False
+    companie.salvare_informatii()
+    assert os.stat(fisier_salvat).st_mtime != 1000000000
+    assert continut(deschidere(fisier_salvat)) == asteptat
+
+
+@pytest.fixture
+def salvari(monkeypatch):
+    # aplicatia cu functii primeste angajatii din memorie, iar salvarile sunt doar numarate
+    apeluri = []
+    angajati = list(generare_angajati(20, seed=5))
+
+    def salvare(lista_angajati, fundal=False):
+        apeluri.append(fundal)
+        if fundal:
+            rezultat = Future()
+            rezultat.set_result(None)
+            return rezultat
+
+    monkeypatch.setattr(functii, 'incarca_date_json', lambda: angajati)
+    monkeypatch.setattr(functii, 'salveaza_date_json', salvare)
+    return angajati, apeluri
+
+
+def test_app_salveaza_numai_dupa_modificari(salvari, monkeypatch, capsys):
+    angajati, apeluri = salvari
+    # stergerea unui CNP inexistent nu modifica angajatii
+    raspunsuri(monkeypatch, ['6', '4', '0000000000000', '12', '11'])
+    functii.app()
+    assert apeluri == []
+    assert 'Nu exista modificari nesalvate.' in capsys.readouterr().out
+
+    cnp = angajati[0]['CNP']
+    raspunsuri(monkeypatch, ['4', cnp, '12', '11'])
+    functii.app()
+    # salvarea din fundal a reusit, deci la iesire nu mai exista nimic de salvat
+    assert apeluri == [True]
+
+    apeluri.clear()
+    raspunsuri(monkeypatch, ['4', angajati[0]['CNP'], '11'])
+    functii.app()
+    assert apeluri == [False]
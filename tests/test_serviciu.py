@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pytest
+
+from management_angajati import Companie
+from serviciu import LUNGIME_MAXIMA_CORP, Serviciu
+
+
+async def citire_raspuns(reader):
+    stare = int((await reader.readline()).split()[1])
+    antete = {}
+    while (linie := await reader.readline()) != b'\r\n':
+        nume, _, valoare = linie.decode('latin-1').partition(':')
+        antete[nume.lower()] = valoare.strip()
+    if antete.get('transfer-encoding') == 'chunked':
+        corp = b''
+        while marime := int(await reader.readline(), 16):
+            corp += await reader.readexactly(marime)
+            await reader.readline()
+        await reader.readline()
+        return stare, [json.loads(linie) for linie in corp.splitlines()]
+    return stare, json.loads(await reader.readexactly(int(antete['content-length'])))
+
+
+def cereri(companie, *mesaje, marime_bucata=7):
+    # trimite mesajele pe o singura conexiune si returneaza raspunsurile, pana la inchiderea conexiunii
+    async def rulare():
+        server = await asyncio.start_server(Serviciu(companie, marime_bucata).trateaza_conexiune, '127.0.0.1', 0)
+        async with server:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            writer.write(b''.join(mesaje))
+            raspunsuri = []
+            while not reader.at_eof() and len(raspunsuri) < len(mesaje):
+                try:
+                    raspunsuri.append(await citire_raspuns(reader))
+                except (IndexError, ValueError):
+                    break
+            writer.close()
+            return raspunsuri
+    return asyncio.run(rulare())
+
+
+def cerere(metoda, cale, corp=None, antete=b''):
+    corp = json.dumps(corp).encode() if corp is not None else b''
+    return b'%s %s HTTP/1.1\r\nContent-Length: %d\r\n%s\r\n%s' % (metoda.encode(), cale.encode(), len(corp), antete, corp)
+
+
+def test_operatii_pe_angajati(angajati):
+    companie = Companie()
+    companie.adaugare_angajati(angajati[1:])
+    nou, existent = angajati[0].dictionar(), angajati[1].dictionar()
+    raspunsuri = cereri(companie,
+                        cerere('POST', '/angajati', nou),
+                        cerere('POST', '/angajati', existent),
+                        cerere('PUT', f'/angajati/{nou["CNP"]}', dict(nou, Salar=20000.0)),
+                        cerere('GET', f'/angajati/{nou["CNP"]}'),
+                        cerere('GET', f'/fluturas/{nou["CNP"]}'),
+                        cerere('DELETE', f'/angajati/{nou["CNP"]}'),
+                        cerere('GET', f'/angajati/{nou["CNP"]}'),
+                        cerere('GET', '/cost?departament=IT'),
+                        cerere('PATCH', '/angajati'))
+    assert [stare for stare, _ in raspunsuri] == [201, 409, 200, 200, 200, 200, 404, 200, 405]
+    assert raspunsuri[3][1]['Salar'] == 20000.0
+    assert raspunsuri[4][1]['brut'] == 20000.0
+    assert raspunsuri[7][1]['total'] == pytest.approx(sum(angajat.salar for angajat in angajati[1:] if angajat.departament == 'IT'))
+
+
+def test_listare_pe_bucati(angajati):
+    companie = Companie()
+    companie.adaugare_angajati(angajati)
+    (stare, lista), (_, pagina) = cereri(companie, cerere('GET', '/angajati?departament=HR'), cerere('GET', '/angajati?limita=20&deplasare=15'))
+    assert stare == 200
+    assert lista == [angajat.dictionar() for angajat in angajati if angajat.departament == 'HR']
+    assert pagina == [angajat.dictionar() for angajat in angajati[15:35]]
+
+
+@pytest.mark.parametrize('mesaj, stare', [
+    (b'GET /angajati\r\n\r\n', 400),
+    (b'GET /cost HTTP/1.1\r\nContent-Length: -1\r\n\r\n', 400),
+    (b'GET /cost HTTP/1.1\r\nContent-Length: %d\r\n\r\n' % (LUNGIME_MAXIMA_CORP + 1), 413),
+    (b'GET /cost HTTP/1.1\r\nX-Antet: ' + b'a' * 100000 + b'\r\n\r\n', 431),
+])
+def test_cereri_invalide(angajati, mesaj, stare):
+    # dupa raspuns conexiunea este inchisa, pentru ca restul datelor nu mai pot fi interpretate
+    assert [stare for stare, _ in cereri(Companie(), mesaj, cerere('GET', '/cost'))] == [stare]
+
+
+def test_eroare_interna(angajati, monkeypatch):
+    companie = Companie()
+
+    def eroare():
+        raise RuntimeError('test')
+    monkeypatch.setattr(companie, 'statistici_salarii', eroare)
+    assert [stare for stare, _ in cereri(companie, cerere('GET', '/statistici'), cerere('GET', '/cost'))] == [500]
@@ -0,0 +1,81 @@
+import datetime
+
+import pytest
+
+import reguli_fiscale
+from conftest import continut
+from management_angajati import Companie
+from reguli_fiscale import MotorFiscal, RegulaFiscala
+from simulare import SCENARIU_BAZA, RegulaSalar, Scenariu
+
+
+REGULA = RegulaFiscala(datetime.date(2000, 1, 1), 0.25, 0.1, 0.1, 300.0, 3000.0)
+REGULA_NOUA = RegulaFiscala(datetime.date(2000, 1, 1), 0.2, 0.1, 0.16, 0.0, 3000.0)
+
+
+@pytest.fixture(autouse=True)
+def motor(monkeypatch):
+    monkeypatch.setattr(reguli_fiscale, 'motor_fiscal', MotorFiscal([REGULA]))
+
+
+def totaluri(angajati, salar_nou, regula):
+    # calculul de referinta, angajat cu angajat
+    brut, net, afectati = {}, {}, 0
+    for angajat in angajati:
+        salar = salar_nou(angajat)
+        brut[angajat.departament] = brut.get(angajat.departament, 0.0) + salar
+        net[angajat.departament] = net.get(angajat.departament, 0.0) + regula.calcul(salar)[3]
+        afectati += salar != angajat.salar
+    return brut, net, afectati
+
+
+def test_scenarii_fata_de_calculul_direct(angajati):
+    companie = Companie()
+    companie.adaugare_angajati(angajati)
+    inainte = continut(companie)
+    scenarii = [
+        Scenariu('IT senior', [RegulaSalar(procent=7, departament='IT', senioritate='senior')]),
+        Scenariu('toti', [RegulaSalar(procent=5), RegulaSalar(suma=200, senioritate='junior')]),
+        Scenariu('cote noi', [RegulaSalar(suma=100, departament='HR')], regula_fiscala=REGULA_NOUA),
+    ]
+    rezultate = companie.simulare_salarii(scenarii)
+
+    def marire_it(angajat):
+        return angajat.salar * 1.07 if (angajat.departament, angajat.senioritate) == ('IT', 'senior') else angajat.salar
+
+    def marire_toti(angajat):
+        return angajat.salar * 1.05 + (200 if angajat.senioritate == 'junior' else 0)
+
+    def marire_hr(angajat):
+        return angajat.salar + (100 if angajat.departament == 'HR' else 0)
+
+    baza_brut, baza_net, _ = totaluri(angajati, lambda angajat: angajat.salar, REGULA)
+    assert rezultate[SCENARIU_BAZA]['brut'] == pytest.approx(sum(baza_brut.values()))
+    assert rezultate[SCENARIU_BAZA]['net'] == pytest.approx(sum(baza_net.values()))
+    for nume, salar_nou, regula in (('IT senior', marire_it, REGULA), ('toti', marire_toti, REGULA),
+                                    ('cote noi', marire_hr, REGULA_NOUA)):
+        brut, net, afectati = totaluri(angajati, salar_nou, regula)
+        rezultat = rezultate['scenarii'][nume]
+        assert rezultat['brut'] == pytest.approx(sum(brut.values()))
+        assert rezultat['delta_net'] == pytest.approx(sum(net.values()) - sum(baza_net.values()))
+        assert rezultat['angajati_afectati'] == afectati
+        for departament, valori in rezultat['departamente'].items():
+            assert valori['brut'] == pytest.approx(brut[departament])
+            assert valori['delta_brut'] == pytest.approx(brut[departament] - baza_brut[departament])
+
+    # simularea nu modifica firma
+    assert continut(companie) == inainte
+
+
+@pytest.mark.parametrize('nume', [[SCENARIU_BAZA], ['a', 'a']])
+def test_nume_de_scenariu_invalide(angajati, nume):
+    companie = Companie()
+    companie.adaugare_angajati(angajati[:10])
+    with pytest.raises(ValueError):
+        companie.simulare_salarii([Scenariu(item) for item in nume])
+
+
+def test_regulile_se_compun_in_ordine():
+    factor, adaos = RegulaSalar(suma=100).aplicare(1.0, 0.0)
+    factor, adaos = RegulaSalar(procent=10).aplicare(factor, adaos)
+    assert 1000 * factor + adaos == pytest.approx((1000 + 100) * 1.1)
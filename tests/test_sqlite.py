@@ -0,0 +1,50 @@
+import pytest
+
+from conftest import continut, deschidere, modificat
+from management_angajati import Companie
+
+
+@pytest.fixture
+def firme(tmp_path, angajati):
+    # aceeasi firma in depozitul SQLite si in memorie
+    depozit, memorie = deschidere(tmp_path / 'date.db'), Companie()
+    for companie in (depozit, memorie):
+        companie.adaugare_angajati(angajati)
+        companie.modificare_angajat(modificat(angajati[3], Salar=17000.0, Departament='HR'))
+        companie.stergere_angajat(angajati[4].cnp)
+    return depozit, memorie
+
+
+def test_operatii_si_redeschidere(tmp_path, firme, angajati):
+    depozit, memorie = firme
+    assert continut(depozit) == continut(memorie)
+    assert depozit.obtinere_angajat(angajati[3].cnp).salar == 17000.0
+    assert depozit.obtinere_angajat(angajati[4].cnp) is None
+    with pytest.raises(KeyError):
+        depozit.stergere_angajat(angajati[4].cnp)
+    with pytest.raises(KeyError):
+        depozit.modificare_angajat(angajati[4])
+
+    depozit.salvare_informatii()
+    assert continut(deschidere(tmp_path / 'date.db')) == continut(memorie)
+
+
+@pytest.mark.parametrize('departament, senioritate', [('IT', None), (None, 'junior'), ('HR', 'mid')])
+def test_filtre_si_agregate(firme, departament, senioritate):
+    depozit, memorie = firme
+    assert ([angajat.cnp for angajat in depozit.selectare_angajati(departament, senioritate)]
+            == [angajat.cnp for angajat in memorie.selectare_angajati(departament, senioritate)])
+    assert depozit.cost_salarii(departament) == pytest.approx(memorie.cost_salarii(departament))
+    statistici_depozit, statistici_memorie = depozit.statistici_salarii(), memorie.statistici_salarii()
+    for camp in ('numar', 'total', 'minim', 'maxim', 'medie'):
+        assert statistici_depozit[camp] == pytest.approx(statistici_memorie[camp])
+
+
+def test_fluturasi_si_cautare(firme):
+    depozit, memorie = firme
+    lot_depozit, lot_memorie = depozit.calcul_fluturasi_lot('IT'), memorie.calcul_fluturasi_lot('IT')
+    assert sorted(lot_depozit['cnp']) == sorted(lot_memorie['cnp'])
+    assert sum(lot_depozit['net']) == pytest.approx(sum(lot_memorie['net']))
+    for argumente in [('judet', '40'), ('data_nasterii', '1980', '1989'), ('cnp', '2')]:
+        assert (sorted(angajat.cnp for angajat in depozit.cautare_angajati(*argumente))
+                == sorted(angajat.cnp for angajat in memorie.cautare_angajati(*argumente)))